@@ -0,0 +1,170 @@
+"""
+This module contains the class for evolving the populations of many independent scheduling problems together.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from typing import List, Sequence
+from gcs import GeneticCloudScheduling
+from cloudlet import Cloudlet, CloudletArray
+from vm import Vm, VmArray
+import operators
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+# Parameters of GeneticCloudScheduling that change the search but are not implemented by BatchScheduling, with the value disabling each
+UNSUPPORTED = (
+	("DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION", 0), ("DESIRED_DELTA_DIVERSITY", None), ("TIME_BUDGET", 0.0),
+	("ADAPTIVE_RATES", False), ("SEED_FRACTION", 0.0), ("LOCAL_SEARCH_BUDGET", 0), ("STEADY_STATE", False),
+	("CHECKPOINT_INTERVAL", 0),
+)
+
+
+class BatchScheduling():
+	"""
+	Schedule many independent problem instances, each with its own cloudlets and VMs, with one genetic algorithm run.
+	Instances are padded into stacked arrays: padded cloudlets have length 0 and padded VMs are never assigned.
+	All populations are evolved together by the operators of the batched engine, shared through the operators module
+	with their leading instance axis: tournament selection, crossover, mutation, one weighted bincount fitness pass and
+	next generation selection, so the interpreter dispatches once per generation instead of once per instance.
+	Fitness values are exactly those the single instance engines give.
+	run() raises ValueError for the parameters in UNSUPPORTED, ENGINE, INCREMENTAL_FITNESS, BOUNDED_FITNESS, N_WORKERS
+	and FITNESS_CACHE_SIZE only change how fitness is evaluated and are ignored.
+	Requires numpy.
+	"""
+
+
+	def __init__(self, gcs: GeneticCloudScheduling):
+		# Scheduler providing the genetic algorithm parameters and the random stream, its CLOUDLETS and VMS are not used
+		self.GCS: GeneticCloudScheduling = gcs
+		# Cloudlet lengths of every instance
+		self.LENGTHS: List[Sequence[float]] = []
+		# VM MIPS of every instance
+		self.MIPS: List[Sequence[float]] = []
+		# Stop once every instance has reached its makespan lower bound
+		self.STOP_AT_LOWER_BOUND: bool = True
+		# Number of generations evolved by the last run()
+		self.GENERATION: int = 0
+		# Schedule and metrics of every instance after the last run()
+		self.RESULTS: List[dict] = []
+
+
+	def add_instance(self, cloudlets: List[Cloudlet], vms: List[Vm]) -> int:
+		"""
+		Add a problem instance.
+		Raises ValueError for an instance without cloudlets or without VMs, which has no schedule to evolve.
+
+		:param cloudlets: List of cloudlets or a CloudletArray.
+		:param vms: List of VMs or a VmArray.
+
+		:returns index: Index of the instance in RESULTS.
+		"""
+
+		if not len(cloudlets) or not len(vms):
+			raise ValueError(f"BatchScheduling instances need at least one cloudlet and one VM, got {len(cloudlets)} cloudlets and {len(vms)} VMs.")
+
+		self.LENGTHS.append(cloudlets.get_lengths() if isinstance(cloudlets, CloudletArray) else [cl.get_length() for cl in cloudlets])
+		self.MIPS.append(vms.get_mips() if isinstance(vms, VmArray) else [vm.get_mips() for vm in vms])
+
+		return len(self.LENGTHS) - 1
+
+
+	def run(self) -> List[dict]:
+		"""
+		Evolve all instances for GCS.N_GENERATIONS generations.
+		Every instance gets GCS.POPULATION_SIZE random individuals and follows the generational scheme of the batched engine,
+		with GCS.TOURNAMENT_SIZE, CROSSOVER, CROSSOVER_RATE, MUTATION_RATE, SPARSE_MUTATION and ELITISM_RATE.
+
+		:returns results: Best schedule and metrics of every instance, see RESULTS.
+		"""
+
+		if np is None:
+			raise ImportError("BatchScheduling requires numpy to be installed.")
+
+		gcs = self.GCS
+		for name, disabled in UNSUPPORTED:
+			if getattr(gcs, name) != disabled:
+				raise ValueError(f"BatchScheduling does not support {name}, set it to {disabled!r}.")
+
+		rng = gcs.get_np_random()
+		n_instances = len(self.LENGTHS)
+		if not n_instances:
+			self.RESULTS = []
+			return self.RESULTS
+
+		n_cloudlets = np.array([len(lengths) for lengths in self.LENGTHS])
+		n_vms = np.array([len(mips) for mips in self.MIPS])
+		n_genes, width = n_cloudlets.max(), n_vms.max()
+		dtype = np.uint16 if width <= 0x10000 else np.uint32
+
+		# Padded cloudlets take no time on any VM, padded VMs are never drawn
+		lengths = np.zeros((n_instances, n_genes))
+		mips = np.ones((n_instances, width))
+		for i in range(n_instances):
+			lengths[i, :n_cloudlets[i]] = self.LENGTHS[i]
+			mips[i, :n_vms[i]] = self.MIPS[i]
+		etc = lengths[:, :, None] / mips[:, None, :]
+
+		lower_bound = np.asarray([operators.makespan_lower_bound(self.LENGTHS[i], self.MIPS[i]) for i in range(n_instances)])
+
+		def evaluate(population: "np.ndarray") -> "np.ndarray":
+			return 1 / operators.completion_times(etc, population).max(axis=2)
+
+		def rank(population: "np.ndarray", fitness: "np.ndarray"):
+			order = np.argsort(-fitness, axis=1, kind="stable")
+			return np.take_along_axis(population, order[:, :, None], axis=1), np.take_along_axis(fitness, order, axis=1)
+
+		size = gcs.POPULATION_SIZE
+		population = rng.integers(0, n_vms.reshape(-1, 1, 1), size=(n_instances, size, n_genes)).astype(dtype)
+		population, fitness = rank(population, evaluate(population))
+		n_pairs = len(range(0, size, 2))
+		n_elites = int(gcs.ELITISM_RATE * size) if gcs.ELITISM_RATE else 0
+		instance = np.arange(n_instances)[:, None]
+		fitness_track = [fitness[:, 0]]
+
+		generation = 0
+		while generation < gcs.N_GENERATIONS:
+			if self.STOP_AT_LOWER_BOUND and np.all(1 / fitness[:, 0] <= lower_bound * (1 + 1e-9)):
+				break
+
+			winner_a, winner_b = operators.select_pairs(rng, n_instances, n_pairs, size, gcs.TOURNAMENT_SIZE)
+			children = operators.crossover(rng, population[instance, winner_a], population[instance, winner_b], n_cloudlets, gcs.CROSSOVER, gcs.CROSSOVER_RATE)
+			operators.mutate(rng, children, n_vms, gcs.MUTATION_RATE, gcs.SPARSE_MUTATION)
+
+			# Next generation, the elites and the best two of every parent-child group
+			candidates = np.concatenate([population, children], axis=1)
+			candidates_fitness = np.concatenate([fitness, evaluate(children)], axis=1)
+			survivors = operators.select_survivors(winner_a, winner_b, candidates_fitness, np.arange(n_elites))
+
+			population, fitness = rank(np.take_along_axis(candidates, survivors[:, :, None], axis=1), np.take_along_axis(candidates_fitness, survivors, axis=1))
+			fitness_track.append(fitness[:, 0])
+			generation = generation + 1
+
+		self.GENERATION = generation
+		fitness_track = np.stack(fitness_track, axis=1)
+		vm_ct = operators.completion_times(etc, population[:, :1])[:, 0]
+
+		self.RESULTS = []
+		for i in range(n_instances):
+			ct = vm_ct[i, :n_vms[i]]
+			makespan = ct.max()
+			self.RESULTS.append({
+				"schedule": population[i, 0, :n_cloudlets[i]].tolist(),
+				"fitness": float(fitness[i, 0]),
+				"makespan": float(makespan),
+				"lower_bound": float(lower_bound[i]),
+				"vm_completion_time": ct.tolist(),
+				"average_completion_time": float(ct.mean()),
+				"arur": float(ct.mean() / makespan),
+				"throughput": float(n_cloudlets[i] / makespan),
+				"fitness_track": fitness_track[i].tolist(),
+			})
+
+		return self.RESULTS
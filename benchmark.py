@@ -0,0 +1,460 @@
+"""
+This module contains the benchmark for scheduler throughput and scaling.
+
+Run a sweep and write the results:
+	python benchmark.py --output results.json
+
+Measure the generations and time a heuristic-seeded initial population saves to reach the best heuristic makespan:
+	python benchmark.py --seeding 0.1 --output seeding.json
+
+Check Sufferage against a brute-force reference on small random workloads:
+	python benchmark.py --verify 200 --engines PYTHON NUMPY
+
+Check that every combination of engine, batched operators, incremental fitness and local search keeps the population consistent:
+	python benchmark.py --verify-options --engines PYTHON NUMPY
+
+Measure how parallel fitness evaluation scales with the number of worker processes:
+	python benchmark.py --data-types TESTING --cloudlets 10000 --vms 100 --populations 200 --engines NUMPY --workers 1 2 4 8
+
+Compare two result files, for example from two commits or two engines:
+	python benchmark.py --compare base.json new.json
+	python benchmark.py --compare python.json numpy.json --ignore engine
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from fractions import Fraction
+from itertools import product
+from typing import List
+from gcs import GeneticCloudScheduling
+from cloudlet import Cloudlet
+from datatype import DataType
+from engine import Engine
+
+
+PHASES = ["calculate_fitness_all", "elitism", "selection", "crossover", "mutation", "local_search", "next_generation"]
+BASELINES = ["random_results_ct", "round_robin_results_ct", "mct_results_ct", "lpt_results_ct", "minmin_results_ct", "maxmin_results_ct", "sufferage_results_ct"]
+# Fields identifying a benchmark case, used to match cases when comparing
+KEYS = ["data_type", "n_cloudlets", "n_vms", "population_size", "engine", "batched_operators", "n_workers"]
+# Value of case fields missing from result files written before the field existed
+DEFAULTS = {"n_workers": 1}
+
+
+def make_workload(gcs: GeneticCloudScheduling, data_type: DataType, n_cloudlets: int):
+	"""
+	Generate a workload of about n_cloudlets cloudlets.
+	GOOGLE and SYNTETHIC workloads are scaled up by concatenating as many generated workloads as needed.
+
+	:param gcs: Scheduler to generate the workload on.
+	:param data_type: TESTING, GOOGLE or SYNTETHIC.
+	:param n_cloudlets: Number of cloudlets.
+	"""
+
+	if data_type is DataType.TESTING:
+		gcs.N_CLOUDLETS = n_cloudlets
+		gcs.generate_cloudlets(400, 1000)
+		return
+
+	generator = gcs.generate_google_like_workload if data_type is DataType.GOOGLE else gcs.generate_syntethic_like_workload
+	cloudlets = []
+	while len(cloudlets) < n_cloudlets:
+		generator()
+		cloudlets.extend(Cloudlet(len(cloudlets) + i, cl.get_length()) for i, cl in enumerate(gcs.CLOUDLETS))
+
+	gcs.CLOUDLETS = cloudlets[:max(n_cloudlets, 1)]
+	gcs.N_CLOUDLETS = len(gcs.CLOUDLETS)
+
+
+def run_case(data_type: DataType, n_cloudlets: int, n_vms: int, population_size: int, engine: Engine, batched_operators: bool, n_workers: int, n_generations: int, seed: int) -> dict:
+	"""
+	Time every GA phase for n_generations generations and every baseline heuristic on one workload.
+
+	:returns result: Benchmark record.
+	"""
+
+	random.seed(seed)
+	gcs = GeneticCloudScheduling()
+	gcs.N_VMS = n_vms
+	gcs.POPULATION_SIZE = population_size
+	gcs.CROSSOVER_RATE = 0.10
+	gcs.MUTATION_RATE = 0.01
+	gcs.ELITISM_RATE = 0.02
+	gcs.ENGINE = engine
+	gcs.BATCHED_OPERATORS = batched_operators
+	gcs.N_WORKERS = n_workers
+
+	make_workload(gcs, data_type, n_cloudlets)
+	gcs.generate_vms(250, 2000)
+
+	start = time.perf_counter()
+	gcs.generate_population()
+	phases = {"generate_population": time.perf_counter() - start}
+	phases.update({phase: 0.0 for phase in PHASES})
+
+	start_run = time.perf_counter()
+	for _ in range(n_generations):
+		for phase in PHASES:
+			start = time.perf_counter()
+			getattr(gcs, phase)()
+			phases[phase] = phases[phase] + time.perf_counter() - start
+	start = time.perf_counter()
+	gcs.calculate_fitness_all()
+	phases["calculate_fitness_all"] = phases["calculate_fitness_all"] + time.perf_counter() - start
+	run_time = time.perf_counter() - start_run
+	gcs.close()
+
+	baselines = {}
+	for baseline in BASELINES:
+		start = time.perf_counter()
+		_, vm_ct = getattr(gcs, baseline)()
+		baselines[baseline] = {"seconds": time.perf_counter() - start, "makespan": max(vm_ct)}
+
+	return {
+		"data_type": data_type.name,
+		"n_cloudlets": gcs.N_CLOUDLETS,
+		"n_vms": n_vms,
+		"population_size": population_size,
+		"engine": engine.name,
+		"batched_operators": batched_operators,
+		"n_workers": n_workers,
+		"n_generations": n_generations,
+		"seconds": run_time,
+		"generations_per_second": n_generations / run_time if run_time else 0.0,
+		"evaluations_per_second": gcs.FITNESS_CACHE_MISSES / run_time if run_time else 0.0,
+		"makespan": 1 / gcs.get_fitness_max()[0],
+		"phases": phases,
+		"baselines": baselines,
+	}
+
+
+def run_sweep(data_types: List[DataType], cloudlets: List[int], vms: List[int], populations: List[int], engines: List[Engine], batched: List[bool], workers: List[int], n_generations: int, seed: int) -> dict:
+	"""
+	Run every combination of the sweep parameters.
+	Each case with several workers also prints the speedup of fitness evaluation over the same case run with the
+	fewest workers of the sweep.
+
+	:returns results: Metadata and list of benchmark records.
+	"""
+
+	results = []
+	serial = {}
+	for case in product(data_types, cloudlets, vms, populations, engines, batched, sorted(workers)):
+		result = run_case(*case, n_generations, seed)
+		results.append(result)
+		evaluation = result["phases"]["calculate_fitness_all"]
+		speedup = serial.setdefault(case[:-1], evaluation) / evaluation if evaluation else 0.0
+		print(f"{result['data_type']}\t{result['n_cloudlets']} cloudlets\t{result['n_vms']} VMs\t{result['population_size']} individuals\t{result['engine']}{' BATCHED' if result['batched_operators'] else ''}\t{result['n_workers']} workers\t{result['generations_per_second']:.2f} gen/s\t{result['evaluations_per_second']:.1f} eval/s\tevaluation x{speedup:.2f}")
+
+	return {
+		"python": platform.python_version(),
+		"machine": platform.machine(),
+		"cpus": os.cpu_count(),
+		"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+		"n_generations": n_generations,
+		"seed": seed,
+		"results": results,
+	}
+
+
+def run_seeding_case(data_type: DataType, n_cloudlets: int, n_vms: int, population_size: int, seed_fraction: float, n_generations: int, target: float, seed: int) -> dict:
+	"""
+	Run the GA on the same workload from a random and from a heuristic-seeded initial population and
+	measure the generations and seconds, including generating the population, each needs to reach target times
+	the best makespan of the MCT, Min-Min and LPT heuristics.
+
+	:returns result: Seeding benchmark record.
+	"""
+
+	runs = {}
+	for name, fraction in (("random", 0.0), ("seeded", seed_fraction)):
+		random.seed(seed)
+		gcs = GeneticCloudScheduling()
+		gcs.N_VMS = n_vms
+		gcs.POPULATION_SIZE = population_size
+		gcs.CROSSOVER_RATE = 0.10
+		gcs.MUTATION_RATE = 0.01
+		gcs.ELITISM_RATE = 0.02
+		gcs.SEED_FRACTION = fraction
+
+		make_workload(gcs, data_type, n_cloudlets)
+		gcs.generate_vms(250, 2000)
+		makespan = target * min(max(vm_ct) for _, vm_ct in (gcs.mct_results_ct(), gcs.minmin_results_ct(), gcs.lpt_results_ct()))
+
+		start = time.perf_counter()
+		gcs.generate_population()
+		population_seconds = time.perf_counter() - start
+		gcs.run(n_generations)
+		gcs.close()
+
+		reached = gcs.generations_to_makespan(makespan)
+		runs[name] = {
+			"generations": reached[0] if reached else None,
+			"seconds": population_seconds + reached[1] if reached else None,
+			"makespan": 1 / max(gcs.FITNESS_TRACK),
+		}
+
+	reached = runs["random"]["generations"] is not None and runs["seeded"]["generations"] is not None
+
+	return {
+		"data_type": data_type.name,
+		"n_cloudlets": gcs.N_CLOUDLETS,
+		"n_vms": n_vms,
+		"population_size": population_size,
+		"seed_fraction": seed_fraction,
+		"n_generations": n_generations,
+		"target_makespan": makespan,
+		"random": runs["random"],
+		"seeded": runs["seeded"],
+		"generations_saved": runs["random"]["generations"] - runs["seeded"]["generations"] if reached else None,
+		"seconds_saved": runs["random"]["seconds"] - runs["seeded"]["seconds"] if reached else None,
+	}
+
+
+def brute_force_sufferage(gcs: GeneticCloudScheduling) -> List[int]:
+	"""
+	Schedule with sufferage by scanning every unscheduled cloudlet on every VM at every step, in exact rational arithmetic.
+	O(n^2 * m), the reference for GeneticCloudScheduling.sufferage_results_ct.
+
+	:param gcs: Scheduler with CLOUDLETS and VMS.
+
+	:returns p1: Individual.
+	"""
+
+	lengths = [Fraction(length) for length in gcs.get_cloudlet_lengths()]
+	mips = [Fraction(m) for m in gcs.get_vm_mips()]
+	vm_length = [Fraction(0)] * len(mips)
+	p1 = [0] * len(lengths)
+	unscheduled = list(range(len(lengths)))
+
+	while unscheduled:
+		best = None
+		for cloudlet_id in unscheduled:
+			ct = sorted(((vm_length[vm_id] + lengths[cloudlet_id]) / mips[vm_id], vm_id) for vm_id in range(len(mips)))
+			# A single VM gives every cloudlet an infinite sufferage
+			sufferage = (1, 0) if len(ct) == 1 else (0, ct[1][0] - ct[0][0])
+			# Strictly larger only, so ties go to the lowest cloudlet ID
+			if best is None or sufferage > best[0]:
+				best = sufferage, cloudlet_id, ct[0][1]
+
+		_, cloudlet_id, vm_id = best
+		p1[cloudlet_id] = vm_id
+		vm_length[vm_id] = vm_length[vm_id] + lengths[cloudlet_id]
+		unscheduled.remove(cloudlet_id)
+
+	return p1
+
+
+def verify_sufferage(n_cases: int, engines: List[Engine], seed: int) -> int:
+	"""
+	Compare sufferage_results_ct with brute_force_sufferage on small random workloads, most of them with
+	repeated lengths and MIPS so that completion times and sufferages tie.
+
+	:param n_cases: Number of workloads.
+	:param engines: Engines to run sufferage_results_ct with.
+	:param seed: Seed of the first workload, the others follow.
+
+	:returns mismatches: Number of workloads and engines where the schedules differ.
+	"""
+
+	mismatches = 0
+	for case in range(n_cases):
+		random.seed(seed + case)
+		gcs = GeneticCloudScheduling()
+		gcs.N_VMS = random.randint(1, 20)
+		gcs.N_CLOUDLETS = random.randint(1, 120)
+		low = random.choice([250, 1000])
+		gcs.generate_cloudlets(400, random.choice([410, 1000]))
+		gcs.generate_vms(low, low + random.choice([0, 2, 1000]))
+
+		reference = brute_force_sufferage(gcs)
+		for engine in engines:
+			gcs.ENGINE = engine
+			if gcs.sufferage_results_ct()[0] != reference:
+				mismatches = mismatches + 1
+				print(f"MISMATCH\tseed {seed + case}\t{gcs.N_CLOUDLETS} cloudlets\t{gcs.N_VMS} VMs\t{engine.name}")
+
+	print(f"\n{mismatches} MISMATCHES IN {n_cases} WORKLOADS")
+
+	return mismatches
+
+
+def verify_options(engines: List[Engine], n_generations: int, seed: int) -> int:
+	"""
+	Run a small workload with every combination of engine, BATCHED_OPERATORS (with NUMPY only), INCREMENTAL_FITNESS and
+	local search on the elites and/or the children, and check that the run completes, that the returned fitness and every
+	FITNESS entry match calculate_fitness and that every LOADS entry matches calculate_all_vm_completion_time.
+
+	:param engines: Engines to run with.
+	:param n_generations: Generations per run.
+	:param seed: Seed of the workload and of the runs.
+
+	:returns failures: Number of combinations that failed.
+	"""
+
+	failures = 0
+	local_searches = [(False, False), (True, False), (False, True), (True, True)]
+	for engine, batched, incremental, (elites, children) in product(engines, [False, True], [False, True], local_searches):
+		if batched and engine is not Engine.NUMPY:
+			continue
+		name = f"{engine.name}{' BATCHED' if batched else ''}{' INCREMENTAL' if incremental else ''}{' ELITES' if elites else ''}{' CHILDREN' if children else ''}"
+		random.seed(seed)
+		gcs = GeneticCloudScheduling()
+		gcs.N_VMS = 10
+		gcs.N_CLOUDLETS = 300
+		gcs.POPULATION_SIZE = 20
+		gcs.CROSSOVER_RATE = 0.3
+		gcs.MUTATION_RATE = 0.02
+		gcs.ELITISM_RATE = 0.1
+		gcs.ENGINE = engine
+		gcs.BATCHED_OPERATORS = batched
+		gcs.INCREMENTAL_FITNESS = incremental
+		gcs.LOCAL_SEARCH_BUDGET = 200 if elites or children else 0
+		gcs.LOCAL_SEARCH_ELITES = elites
+		gcs.LOCAL_SEARCH_CHILDREN = children
+		gcs.generate_cloudlets(400, 1000)
+		gcs.generate_vms(250, 2000)
+		gcs.generate_population()
+
+		try:
+			fitness, individual = gcs.run(n_generations)
+			errors = [abs(gcs.calculate_fitness(individual) - fitness)]
+			for i in range(len(gcs.POPULATION)):
+				errors.append(abs(gcs.calculate_fitness(gcs.POPULATION[i]) - gcs.FITNESS[i]))
+				if incremental:
+					errors.extend(map(abs, map(float.__sub__, gcs.LOADS[i], gcs.calculate_all_vm_completion_time(gcs.POPULATION[i]))))
+			error = f"error {max(errors)}" if max(errors) > 1e-9 else None
+		except Exception as exception:
+			error = repr(exception)
+		if error:
+			failures = failures + 1
+			print(f"FAILED\t{name}\t{error}")
+
+	print(f"\n{failures} FAILED COMBINATIONS")
+
+	return failures
+
+
+def flatten(result: dict) -> dict:
+	"""
+	Flatten the timings of a benchmark record into one level of names.
+
+	:returns timings: Seconds of the whole run, every phase and every baseline.
+	"""
+
+	timings = {"seconds": result["seconds"]}
+	timings.update({f"phase.{name}": seconds for name, seconds in result["phases"].items()})
+	timings.update({f"baseline.{name}": baseline["seconds"] for name, baseline in result["baselines"].items()})
+
+	return timings
+
+
+def compare(base: dict, new: dict, ignore: List[str], threshold: float) -> int:
+	"""
+	Print the new/base time ratio of every timing of the cases found in both result files.
+	Ratios above 1 + threshold are flagged as regressions.
+
+	:param base: Base results.
+	:param new: New results.
+	:param ignore: Case fields left out when matching cases, such as engine.
+	:param threshold: Relative slowdown tolerated before flagging.
+
+	:returns regressions: Number of flagged timings.
+	"""
+
+	keys = [key for key in KEYS if key not in ignore]
+	base_cases = {tuple(result.get(key, DEFAULTS.get(key)) for key in keys): result for result in base["results"]}
+	regressions = 0
+
+	for result in new["results"]:
+		case = tuple(result.get(key, DEFAULTS.get(key)) for key in keys)
+		if case not in base_cases:
+			continue
+
+		print("\t".join(f"{key}={value}" for key, value in zip(keys, case)))
+		base_timings = flatten(base_cases[case])
+		for name, seconds in flatten(result).items():
+			if name not in base_timings or not base_timings[name]:
+				continue
+			ratio = seconds / base_timings[name]
+			flag = ""
+			if ratio > 1 + threshold:
+				flag = "\tREGRESSION"
+				regressions = regressions + 1
+			print(f"\t{name}\t{base_timings[name]:.6f}s -> {seconds:.6f}s\tx{ratio:.2f}{flag}")
+
+	print(f"\n{regressions} REGRESSIONS")
+
+	return regressions
+
+
+if __name__ == '__main__':
+
+	parser = argparse.ArgumentParser(description="Benchmark scheduler throughput and scaling.")
+	parser.add_argument("--output", default="benchmark.json", help="File to write the results to.")
+	parser.add_argument("--data-types", nargs="+", default=["TESTING", "GOOGLE", "SYNTETHIC"], choices=["TESTING", "GOOGLE", "SYNTETHIC"])
+	parser.add_argument("--cloudlets", nargs="+", type=int, default=[100, 1000, 10000])
+	parser.add_argument("--vms", nargs="+", type=int, default=[20, 100])
+	parser.add_argument("--populations", nargs="+", type=int, default=[100])
+	parser.add_argument("--engines", nargs="+", default=["PYTHON"], choices=[engine.name for engine in Engine])
+	parser.add_argument("--batched", nargs="+", type=int, default=[0], choices=[0, 1], help="Run with BATCHED_OPERATORS off (0) and/or on (1).")
+	parser.add_argument("--workers", nargs="+", type=int, default=[1], help="Worker processes for fitness evaluation, 1 evaluates serially.")
+	parser.add_argument("--generations", type=int, default=10)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--seeding", type=float, metavar="FRACTION", help="Compare a random and a seeded initial population instead of timing phases.")
+	parser.add_argument("--target", type=float, default=1.0, help="Makespan to reach in seeding runs, relative to the best heuristic makespan.")
+	parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="Compare two result files instead of running.")
+	parser.add_argument("--ignore", nargs="*", default=[], choices=KEYS, help="Case fields to ignore when matching cases.")
+	parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown flagged as a regression.")
+	parser.add_argument("--verify", type=int, metavar="N", help="Check Sufferage against a brute-force reference on N small random workloads instead of running.")
+	parser.add_argument("--verify-options", action="store_true", help="Check every combination of engine, batched operators, incremental fitness and local search, with --engines, instead of running.")
+	args = parser.parse_args()
+
+	if args.compare:
+		with open(args.compare[0]) as f:
+			base = json.load(f)
+		with open(args.compare[1]) as f:
+			new = json.load(f)
+		# A non-zero exit status lets scripts and CI gate on regressions
+		sys.exit(1 if compare(base, new, args.ignore, args.threshold) else 0)
+
+	elif args.verify is not None:
+		sys.exit(1 if verify_sufferage(args.verify, [Engine[name] for name in args.engines], args.seed) else 0)
+
+	elif args.verify_options:
+		sys.exit(1 if verify_options([Engine[name] for name in args.engines], args.generations, args.seed) else 0)
+
+	elif args.seeding is not None:
+		results = []
+		for data_type, n_cloudlets, n_vms, population_size in product([DataType[name] for name in args.data_types], args.cloudlets, args.vms, args.populations):
+			result = run_seeding_case(data_type, n_cloudlets, n_vms, population_size, args.seeding, args.generations, args.target, args.seed)
+			results.append(result)
+			print(f"{result['data_type']}\t{result['n_cloudlets']} cloudlets\t{result['n_vms']} VMs\t{result['population_size']} individuals\trandom {result['random']['generations']} gen {result['random']['seconds']}s\tseeded {result['seeded']['generations']} gen {result['seeded']['seconds']}s\tsaved {result['generations_saved']} gen {result['seconds_saved']}s")
+		with open(args.output, "w") as f:
+			json.dump({"python": platform.python_version(), "seed": args.seed, "target": args.target, "results": results}, f, indent="\t")
+		print(f"Results written to {args.output}")
+
+	else:
+		results = run_sweep(
+			[DataType[name] for name in args.data_types],
+			args.cloudlets,
+			args.vms,
+			args.populations,
+			[Engine[name] for name in args.engines],
+			[bool(x) for x in args.batched],
+			args.workers,
+			args.generations,
+			args.seed
+		)
+		with open(args.output, "w") as f:
+			json.dump(results, f, indent="\t")
+		print(f"Results written to {args.output}")
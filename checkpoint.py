@@ -0,0 +1,148 @@
+"""
+This module contains the functions for writing and memory-mapping binary checkpoint files.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from contextlib import contextmanager
+from typing import Dict, Iterator, Sequence, Tuple
+
+
+# File signature, offset and length of the JSON metadata
+HEADER = struct.Struct("<8sQQ")
+MAGIC = b"GCSCKPT1"
+# Sections start on a multiple of this many bytes, so every typed view is aligned
+ALIGNMENT = 64
+
+
+def as_buffer(values: Sequence, typecode: str):
+	"""
+	Get values as a typed buffer for a checkpoint section, without copying when they already are one.
+
+	:param values: Array, memoryview or any sequence of numbers.
+	:param typecode: Array typecode of the section.
+
+	:returns buffer: Array or memoryview of the given typecode.
+	"""
+
+	if isinstance(values, array) and values.typecode == typecode:
+		return values
+	if isinstance(values, memoryview) and values.format == typecode and values.c_contiguous:
+		return values
+
+	return array(typecode, values)
+
+
+def copy_buffer(values: Sequence) -> Sequence:
+	"""
+	Copy a memoryview into an array of its format, other sequences are returned as they are.
+	Memory-mapped memoryviews, such as the sections of a checkpoint, can be neither pickled nor deep copied.
+
+	:param values: Sequence of numbers.
+
+	:returns values: Picklable sequence with the same values.
+	"""
+
+	if isinstance(values, memoryview):
+		return array(values.format, values.tobytes())
+
+	return values
+
+
+def write_checkpoint(path: str, state: dict, sections: Dict[str, Tuple[str, object]]):
+	"""
+	Write a checkpoint file: a fixed header, raw native-endian sections, then JSON metadata.
+	Every section is written straight from its buffer, nothing is converted or copied.
+	The file is written next to path and renamed over it, so an interrupted write never leaves a broken checkpoint.
+
+	:param path: Path of the checkpoint file.
+	:param state: JSON serializable state.
+	:param sections: Name to (typecode, buffer) of every section, buffers are arrays or memoryviews of that typecode.
+	"""
+
+	tmp = path + ".tmp"
+	index = {}
+
+	with open(tmp, "wb") as f:
+		f.write(bytes(HEADER.size))
+		for name, (typecode, buffer) in sections.items():
+			offset = f.tell()
+			padding = -offset % ALIGNMENT
+			f.write(bytes(padding))
+			f.write(buffer)
+			index[name] = [offset + padding, typecode, len(buffer)]
+
+		metadata = json.dumps({"byteorder": sys.byteorder, "sections": index, "state": state}).encode()
+		offset = f.tell()
+		f.write(metadata)
+		f.seek(0)
+		f.write(HEADER.pack(MAGIC, offset, len(metadata)))
+
+	os.replace(tmp, path)
+
+
+@contextmanager
+def read_checkpoint(path: str) -> Iterator[Tuple[dict, Dict[str, memoryview]]]:
+	"""
+	Memory-map a checkpoint file, for use in a with statement.
+	Sections are given as zero-copy read-only views of the file, pages are only read when they are accessed.
+	On leaving the with block the views are released and the file is unmapped, so it can be replaced or removed
+	on every platform. Copy anything that is kept, with copy_buffer or tolist, inside the block.
+
+	:param path: Path of the checkpoint file.
+
+	:returns (state, sections): JSON state and name to typed memoryview of every section.
+	"""
+
+	with open(path, "rb") as f:
+		mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+	view = memoryview(mm)
+	sections = {}
+	try:
+		magic, offset, length = HEADER.unpack_from(mm)
+		if magic != MAGIC:
+			raise ValueError(f"{path} is not a checkpoint file.")
+
+		metadata = json.loads(mm[offset:offset + length])
+		if metadata["byteorder"] != sys.byteorder:
+			raise ValueError(f"{path} was written on a {metadata['byteorder']} endian machine.")
+
+		for name, (start, typecode, count) in metadata["sections"].items():
+			itemsize = array(typecode).itemsize
+			sections[name] = view[start:start + count * itemsize].cast(typecode)
+
+		yield metadata["state"], sections
+	finally:
+		for section in sections.values():
+			section.release()
+		view.release()
+		mm.close()
+
+
+def read_checkpoint_state(path: str) -> dict:
+	"""
+	Read only the JSON state of a checkpoint file, its sections are neither mapped nor read.
+
+	:param path: Path of the checkpoint file.
+
+	:returns state: JSON state.
+	"""
+
+	with open(path, "rb") as f:
+		magic, offset, length = HEADER.unpack(f.read(HEADER.size))
+		if magic != MAGIC:
+			raise ValueError(f"{path} is not a checkpoint file.")
+		f.seek(offset)
+		metadata = json.loads(f.read(length))
+
+	return metadata["state"]
@@ -1,31 +1,103 @@
-"""
-This module contains the class details for Cloudlet.
-"""
-
-
-__author__ = "Ahmad Awan"
-__email__ = "i202004@nu.edu.pk"
-
-
-class Cloudlet():
-	
-
-	def __init__(self, id: int, length: int):
-		self.id = id
-		self.length = length
-
-	
-	def get_id(self) -> int:
-		return self.id
-	
-
-	def get_length(self) -> int:
-		return self.length
-
-
-	def __repr__(self):
-		return f"Cloudlet {self.id}: {self.length} MI"
-
-
-	def __str__(self):
-		return f"Cloudlet {self.id}: {self.length} MI"
+"""
+This module contains the class details for Cloudlet.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from array import array
+from typing import Sequence
+from checkpoint import copy_buffer
+
+
+class Cloudlet():
+	
+
+	def __init__(self, id: int, length: int):
+		self.id = id
+		self.length = length
+
+	
+	def get_id(self) -> int:
+		return self.id
+	
+
+	def get_length(self) -> int:
+		return self.length
+
+
+	def __repr__(self):
+		return f"Cloudlet {self.id}: {self.length} MI"
+
+
+	def __str__(self):
+		return f"Cloudlet {self.id}: {self.length} MI"
+
+
+class CloudletArray():
+	"""
+	Columnar list of cloudlets backed by a typed buffer of lengths, such as an array or a memory-mapped memoryview.
+	Behaves like List[Cloudlet], but a Cloudlet object is only created when an item is accessed.
+	"""
+
+
+	def __init__(self, lengths: Sequence[float], ids: Sequence[int] = None):
+		self.lengths = lengths
+		# Cloudlet IDs, a range by default so no memory is used per cloudlet
+		self.ids = range(len(lengths)) if ids is None else ids
+
+
+	def get_lengths(self) -> Sequence[float]:
+		return self.lengths
+
+
+	def __len__(self) -> int:
+		return len(self.lengths)
+
+
+	def concatenate(self, cloudlets: Sequence[Cloudlet]) -> "CloudletArray":
+		"""
+		Create a CloudletArray with the given cloudlets appended to these.
+		Lengths are copied into a new float64 array, so a memory-mapped buffer is left untouched. IDs stay a range
+		while the appended cloudlets continue it, otherwise they are copied into an int64 array.
+
+		:param cloudlets: List of cloudlets or a CloudletArray.
+
+		:returns cloudlets: New CloudletArray.
+		"""
+
+		if isinstance(cloudlets, CloudletArray):
+			lengths, ids = cloudlets.lengths, cloudlets.ids
+		else:
+			lengths, ids = [cl.get_length() for cl in cloudlets], [cl.get_id() for cl in cloudlets]
+
+		n = len(self)
+		if isinstance(self.ids, range) and self.ids == range(n) and list(ids) == list(range(n, n + len(ids))):
+			new_ids = range(n + len(ids))
+		else:
+			new_ids = array("q", self.ids) + array("q", ids)
+
+		return CloudletArray(array("d", self.lengths) + array("d", lengths), new_ids)
+
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return CloudletArray(self.lengths[index], self.ids[index])
+
+		return Cloudlet(self.ids[index], self.lengths[index])
+
+
+	def __iter__(self):
+		for i in range(len(self)):
+			yield self[i]
+
+
+	def __getstate__(self):
+		# Pickled and deep copied with the buffers copied out of any memory map, for worker processes and spawned schedulers
+		return {**self.__dict__, "lengths": copy_buffer(self.lengths), "ids": copy_buffer(self.ids)}
+
+
+	def __repr__(self):
+		return f"CloudletArray: {len(self)} cloudlets"
\ No newline at end of file
@@ -1,15 +1,16 @@
-"""
-This module contains the enum for data type.
-"""
-
-__author__ = "Ahmad Awan"
-__email__ = "i202004@nu.edu.pk"
-
-
-from enum import Enum
-
-
-class DataType(Enum):
-	TESTING = 0
-	GOOGLE = 1
-	SYNTETHIC = 2
\ No newline at end of file
+"""
+This module contains the enum for data type.
+"""
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from enum import Enum
+
+
+class DataType(Enum):
+	TESTING = 0
+	GOOGLE = 1
+	SYNTETHIC = 2
+	TRACE = 3
\ No newline at end of file
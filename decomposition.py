@@ -0,0 +1,229 @@
+"""
+This module contains the class for coarse-to-fine scheduling of very large workloads.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import copy
+import math
+import bisect
+from array import array
+from typing import Tuple, List
+from gcs import GeneticCloudScheduling
+from population import Population, gene_typecode
+from cloudlet import CloudletArray
+
+
+# Parameters of GeneticCloudScheduling the coarse run takes from GCS, its telemetry sink and checkpoint file stay with GCS
+PARAMETERS = (
+	"N_GENERATIONS", "DESIRED_DELTA_FITNESS", "DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION", "DESIRED_DELTA_DIVERSITY",
+	"TIME_BUDGET", "N_VMS", "VMS", "POPULATION_SIZE", "TOURNAMENT_SIZE", "CROSSOVER", "CROSSOVER_RATE", "MUTATION_RATE",
+	"ELITISM_RATE", "ADAPTIVE_RATES", "TARGET_DIVERSITY", "ADAPTATION_FACTOR", "MUTATION_RATE_RANGE", "CROSSOVER_RATE_RANGE",
+	"DIVERSITY_GENES", "SEED_FRACTION", "SEED_HEURISTICS", "SEED_PERTURBATION_RATE", "ENGINE", "INCREMENTAL_FITNESS",
+	"SPARSE_MUTATION", "LOCAL_SEARCH_BUDGET", "LOCAL_SEARCH_ELITES", "LOCAL_SEARCH_CHILDREN", "BATCHED_OPERATORS",
+	"STEADY_STATE", "STEADY_STATE_OFFSPRING", "SEED", "SPAWN_KEY", "N_WORKERS", "FITNESS_CACHE_SIZE", "BOUNDED_FITNESS",
+	"STOP_AT_LOWER_BOUND",
+)
+
+
+class CoarseToFineScheduling():
+	"""
+	Schedule a workload too large for one chromosome gene per cloudlet.
+	Cloudlets are bucketed into N_BUCKETS logarithmic length classes and every class is dealt into at most CHUNKS_PER_BUCKET
+	chunks of nearly equal total length. The genetic algorithm evolves the assignment of chunks to VMs, so its memory
+	and per-generation time scale with the number of chunks instead of the number of cloudlets.
+	The best coarse schedule is expanded to one gene per cloudlet and refined by a local search that moves single
+	cloudlets off the most loaded VM, which works on per-VM length lists and never builds the full ETC table.
+	"""
+
+
+	def __init__(self, gcs: GeneticCloudScheduling):
+		# Configured scheduler with CLOUDLETS and VMS, its genetic algorithm parameters are used for the coarse run
+		self.GCS: GeneticCloudScheduling = gcs
+		# Number of logarithmic length classes
+		self.N_BUCKETS: int = 16
+		# Maximum number of chunks each length class is dealt into, more chunks give the coarse run a finer granularity
+		self.CHUNKS_PER_BUCKET: int = 128
+		# Maximum number of single cloudlet moves applied by the refinement, 0 disables it
+		self.REFINE_BUDGET: int = 1000000
+		# Scheduler that evolved the chunks in the last run(), its tracks describe the coarse run
+		self.COARSE: GeneticCloudScheduling = None
+		# Chunk of every cloudlet
+		self.CHUNKS: array = array("I")
+		# Makespan of the best coarse schedule
+		self.COARSE_MAKESPAN: float = 0.0
+		# Makespan after the refinement
+		self.MAKESPAN: float = 0.0
+		# Number of moves applied by the refinement of the last run()
+		self.REFINE_MOVES: int = 0
+
+
+	def bucket(self) -> Tuple[array, array]:
+		"""
+		Deal the cloudlets into chunks.
+		Lengths are classed on a logarithmic scale between the shortest and the longest cloudlet,
+		and the cloudlets of every class are dealt round robin in length order into its chunks.
+
+		:returns (chunks, chunk_lengths): Chunk of every cloudlet and total length of every chunk.
+		"""
+
+		lengths = self.GCS.get_cloudlet_lengths()
+		ranking = sorted(range(len(lengths)), key=lengths.__getitem__)
+		positive = [length for length in lengths if length > 0]
+		low, high = (min(positive), max(positive)) if positive else (1, 1)
+		scale = self.N_BUCKETS / math.log(high / low) if high > low else 0.0
+
+		# Cloudlets per length class, ranking is in length order so the classes are contiguous in it
+		classes = [0] * self.N_BUCKETS
+		for length in lengths:
+			classes[min(int(math.log(length / low) * scale), self.N_BUCKETS - 1) if length > low else 0] += 1
+
+		chunks = array("I", bytes(array("I").itemsize * len(lengths)))
+		chunk_lengths = array("d")
+		position = 0
+		for size in classes:
+			if not size:
+				continue
+			n_chunks = min(self.CHUNKS_PER_BUCKET, size)
+			first = len(chunk_lengths)
+			chunk_lengths.extend([0.0] * n_chunks)
+			for k in range(size):
+				cloudlet_id = ranking[position + k]
+				chunk = first + k % n_chunks
+				chunks[cloudlet_id] = chunk
+				chunk_lengths[chunk] += lengths[cloudlet_id]
+			position = position + size
+
+		return chunks, chunk_lengths
+
+
+	def expand(self, coarse: List[int]) -> array:
+		"""
+		Expand a coarse schedule to one gene per cloudlet, every cloudlet goes to the VM of its chunk.
+
+		:param coarse: VM of every chunk.
+
+		:returns individual: VM of every cloudlet.
+		"""
+
+		return array(gene_typecode(self.GCS.N_VMS), [coarse[chunk] for chunk in self.CHUNKS])
+
+
+	def refine(self, individual: array, budget: int) -> int:
+		"""
+		Local search on the makespan-defining VM.
+		Every move takes the cloudlet of the most loaded VM whose length is closest to the one that balances it with a
+		receiving VM, over all VMs finishing before the makespan, and applies the move balancing the pair best.
+		Cloudlets are found by bisection in per-VM lists kept in length order, so a move costs O(N_VMS log N_CLOUDLETS).
+		The search stops when no move lowers the pair below the makespan or after budget moves.
+
+		:param individual: VM of every cloudlet, modified in place.
+		:param budget: Maximum number of moves.
+
+		:returns moves: Number of moves applied.
+		"""
+
+		lengths = self.GCS.get_cloudlet_lengths()
+		mips = self.GCS.get_vm_mips()
+		n_vms = len(mips)
+		loads = [0.0] * n_vms
+		members = [[] for _ in range(n_vms)]
+		keys = [[] for _ in range(n_vms)]
+		for cloudlet_id in sorted(range(len(lengths)), key=lengths.__getitem__):
+			vm_id = individual[cloudlet_id]
+			members[vm_id].append(cloudlet_id)
+			keys[vm_id].append(lengths[cloudlet_id])
+			loads[vm_id] += lengths[cloudlet_id] / mips[vm_id]
+
+		moves = 0
+		while moves < budget:
+			bottleneck = max(range(n_vms), key=loads.__getitem__)
+			makespan = loads[bottleneck]
+			bottleneck_keys = keys[bottleneck]
+			best = None
+
+			for vm_id in range(n_vms):
+				if loads[vm_id] >= makespan:
+					continue
+				# Length moving both VMs to the same completion time
+				target = (makespan - loads[vm_id]) / (1 / mips[bottleneck] + 1 / mips[vm_id])
+				i = bisect.bisect_left(bottleneck_keys, target)
+				for position in (i - 1, i):
+					if 0 <= position < len(bottleneck_keys):
+						length = bottleneck_keys[position]
+						pair = max(makespan - length / mips[bottleneck], loads[vm_id] + length / mips[vm_id])
+						if pair < makespan and (best is None or pair < best[0]):
+							best = pair, position, vm_id
+
+			if best is None:
+				break
+
+			_, position, vm_id = best
+			cloudlet_id = members[bottleneck].pop(position)
+			length = bottleneck_keys.pop(position)
+			loads[bottleneck] -= length / mips[bottleneck]
+			loads[vm_id] += length / mips[vm_id]
+			i = bisect.bisect_right(keys[vm_id], length)
+			keys[vm_id].insert(i, length)
+			members[vm_id].insert(i, cloudlet_id)
+			individual[cloudlet_id] = vm_id
+			moves = moves + 1
+
+		return moves
+
+
+	def calculate_all_vm_completion_time(self, individual: array) -> List[float]:
+		"""
+		Calculate completion time for all VMs of a full schedule, summed in cloudlet order like
+		GeneticCloudScheduling.calculate_all_vm_completion_time but without the ETC table.
+
+		:param individual: VM of every cloudlet.
+
+		:returns vm_ct: Completion time of every VM.
+		"""
+
+		lengths = self.GCS.get_cloudlet_lengths()
+		mips = self.GCS.get_vm_mips()
+		vm_ct = [0.0] * len(mips)
+		for cloudlet_id, vm_id in enumerate(individual):
+			vm_ct[vm_id] += lengths[cloudlet_id] / mips[vm_id]
+
+		return vm_ct
+
+
+	def run(self) -> Tuple[float, array]:
+		"""
+		Evolve the chunk assignment with the genetic algorithm of GCS, then expand and refine the best one.
+		The coarse run is a new scheduler with the PARAMETERS and random stream of GCS, without its telemetry and checkpointing.
+		GCS itself is not modified, only its random stream advances.
+
+		:returns (max_fitness, individual): Fitness and VM of every cloudlet of the refined schedule.
+		"""
+
+		self.CHUNKS, chunk_lengths = self.bucket()
+
+		coarse = GeneticCloudScheduling()
+		for name in PARAMETERS:
+			setattr(coarse, name, copy.copy(getattr(self.GCS, name)))
+		coarse._random = self.GCS._random
+		coarse._np_random = self.GCS._np_random
+		coarse.N_CLOUDLETS = len(chunk_lengths)
+		coarse.CLOUDLETS = CloudletArray(chunk_lengths)
+		coarse.POPULATION = Population(coarse.N_VMS, coarse.N_CLOUDLETS)
+		coarse.generate_population()
+		try:
+			fitness, individual = coarse.run()
+		finally:
+			# Only the worker pool of the coarse run is its own to shut down
+			coarse.close()
+		self.COARSE = coarse
+		self.COARSE_MAKESPAN = 1 / fitness
+
+		individual = self.expand(individual)
+		self.REFINE_MOVES = self.refine(individual, self.REFINE_BUDGET) if self.REFINE_BUDGET else 0
+		self.MAKESPAN = max(self.calculate_all_vm_completion_time(individual))
+
+		return 1 / self.MAKESPAN, individual
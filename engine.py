@@ -0,0 +1,15 @@
+"""
+This module contains the enum for fitness engine type.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from enum import Enum
+
+
+class Engine(Enum):
+	PYTHON = 0
+	NUMPY = 1
\ No newline at end of file
@@ -1,484 +1,2453 @@
-"""
-This module contains the class for genetic algorithm and its specification.
-"""
-
-
-__author__ = "Ahmad Awan"
-__email__ = "i202004@nu.edu.pk"
-
-
-import random
-from typing import Tuple, List
-from crossover import Crossover
-from cloudlet import Cloudlet
-from vm import Vm
-
-random.seed(0)
-
-class GeneticCloudScheduling():
-
-
-	def __init__(self):
-		# Number of Generations to iterate to
-		self.N_GENERATIONS: int = 1
-		# Desired Stopping condition based on fitness change ie DETLA FITNESS = NEW FITNESS - OLD FITNESS
-		self.DESIRED_DELTA_FITNESS: float = 0
-		# Number of generations for desired delta fitness to occur concurrently to stop
-		self.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION: int = 0
-		# Number of VMs
-		self.N_VMS: int = 1
-		# Number of Cloudlets
-		self.N_CLOUDLETS: int = 1
-		# Total population size
-		self.POPULATION_SIZE: int = 2
-		# Size of tournament for tournament selection
-		self.TOURNAMENT_SIZE: int = 2
-		# Crossover type
-		self.CROSSOVER: Crossover = Crossover.UNIFORM
-		# Crossover rate
-		self.CROSSOVER_RATE: float = 0.0
-		# Mutation rate
-		self.MUTATION_RATE: float = 0.0
-		# Elitism rate
-		self.ELITISM_RATE: float = 0.0
-		# List of Individuals
-		self.POPULATION: List[List[int]] = []
-		# List of Cloudlets
-		self.CLOUDLETS: List[Cloudlet] = []
-		# List of VMs
-		self.VMS: List[Vm] = []
-		# List of selected inidividuals for crossover
-		self.SELECTION: List[int] = []
-		# List of Children
-		self.CHILDREN: List[List[int]] = []
-		# List of Inidividuals index saved due to elitism
-		self.ELITISM: List[int] = []
-		# POPULATION FITNESS
-		self.FITNESS: List[int] = []
-
-
-	def generate_vms(self, low: int, high: int) -> List[Vm]:
-		"""
-		Generate a list of VMs with the MIPS set as a random value between low and high ranges.
-		
-		:param low: MIPS lower range.
-		:param high: MIPS higher range.
-
-		:returns vms: List of VM.
-		"""
-
-		if low > high:
-			low, high = high, low
-		
-		self.VMS = [Vm(i, random.randint(low, high)) for i in range(self.N_VMS)]
-		return self.VMS
-
-
-	def generate_cloudlets(self, low: int, high: int) -> List[Cloudlet]:
-		"""
-		Generate a list of cloudlets with the length set as a random value between low and high ranges.
-		
-		:param low: MIPS lower range.
-		:param high: MIPS higher range.
-
-		:returns cloudlets: List of tasks.
-		"""
-
-		if low > high:
-			low, high = high, low
-
-		self.CLOUDLETS = [Cloudlet(i, random.randint(low, high)) for i in range(self.N_CLOUDLETS)]
-
-		return self.CLOUDLETS
-
-	def generate_allele(self) -> int:
-		"""
-		Generate gene.
-		This is the generates a random number between 0 and N_VMS - 1.
-
-		:returns gene: gene
-		"""
-
-		return random.randint(0, self.N_VMS - 1)
-
-
-	def generate_individual(self) -> List[int]:
-		"""
-		Generate an individual where the positions represent the ID of cloudlet while the value at each index represents which VM the cloudlet will be assigned to.
-		For example, individual with chromosome [7, 11, 9] has three cloudlets where cloudlet #1, #2 and #3 are assigned to VM ID 7, 11 and 9 respectively.
-
-		:returns inidividual: List of Integers
-		"""
-
-		return [self.generate_allele() for i in range(self.N_CLOUDLETS)]
-
-
-	def generate_population(self) -> List[List[int]]:
-		"""
-		Generate the entire population of inidividuals.
-
-		:returns population: List of individuals.
-		"""
-
-		self.POPULATION = [self.generate_individual() for j in range(self.POPULATION_SIZE)]
-		return self.POPULATION
-
-
-	def get_probability(self, probability: float) -> bool:
-		"""
-		Given the probability, return true or false of the event happening.
-
-		:param probability: Between 0 and 1.
-
-		:returns decisision: bool.
-		"""
-
-		return random.random() <= probability
-
-
-	def produce_offspring(self, p1: List[int], p2: List[int]) -> Tuple[List[int], List[int]]:
-		"""
-		Produce two new offspring given parents P1 and P2.
-		The crossover operation depends on CROSSOVER enum value.
-		Current supported operations are uniform and single point crossover.
-
-		:param p1: Parent p1.
-		:param p2: Parent p2.
-
-		:returns o1, o2: offspring 1 and offspring 2
-		"""
-
-		o1 = []
-		o2 = []
-		if self.CROSSOVER is Crossover.UNIFORM:
-			for i in range(len(p1)):
-				if self.get_probability(self.CROSSOVER_RATE):
-					o1.append(p1[i])
-					o2.append(p2[i])
-				else:
-					o1.append(p2[i])
-					o2.append(p1[i])
-		elif self.CROSSOVER is Crossover.SINGLE_POINT:
-			point = random.randint(0, len(p1))
-			o1 = p1[0:point] + p2[point:0]
-			o1 = p2[0:point] + p1[point:0]
-			
-		return o1, o2
-
-
-	def mutate(self, p1: List[int]):
-		"""
-		Apply mutation on individual with probability MUTATION_RATE.
-		Every gene may be mutated for the provided individual p1.
-
-		:param p1: Individual.
-
-		:returns p1: Individual with mutated genes.
-		"""
-
-		for i in range(len(p1)):
-			if self.get_probability(self.MUTATION_RATE):
-				p1[i] = self.generate_allele()
-		return p1
-	
-
-	def calculate_vm_completion_time(self, vm_id: int, p1: List[int]) -> float:
-		"""
-		Calculate completion time for a particular VM.
-
-		:param vm_id: ID of VM.
-		:param p1: Individual.
-
-		:returns vm_ct: Completion time
-		"""
-
-		vm_ct:float = 0.0
-		for i, _vm_id in enumerate(p1):
-			if vm_id == _vm_id:
-				vm_ct = vm_ct + (self.CLOUDLETS[i].get_length() / self.VMS[vm_id].get_mips())
-		return vm_ct
-
-
-	def calculate_all_vm_completion_time(self, p1: List[int]) -> List[float]:
-		"""
-		Calculate completion time for all VMs.
-
-		:param p1: Individual.
-
-		:returns vm_ct: Completion time of all VMs
-		"""
-
-		vm_ct = [0.0] * self.N_VMS
-
-		for i, vm_id in enumerate(p1):
-			vm_ct[vm_id] = vm_ct[vm_id] + (self.CLOUDLETS[i].get_length() / self.VMS[vm_id].get_mips())
-
-		return vm_ct
-
-
-	def calculate_fitness(self, p1: List[int]) -> float:
-		"""
-		Calculate fitness of an individual based on completion time.
-
-		:param p1: Individual.
-
-		:returns fitness: fitness value.
-		"""
-
-		fitness = 1 / max(self.calculate_all_vm_completion_time(p1))
-
-		return fitness
-
-
-	def calculate_fitness_all(self) -> List[float]:
-		"""
-		Calculate fitness of all inidividuals.
-
-		:returns fitness: List of fitness values.
-		"""
-
-		self.FITNESS = [self.calculate_fitness(individual) for individual in self.POPULATION]
-
-		# Sort population and fitness based on fitness
-		local_fit = zip(self.FITNESS, self.POPULATION)
-		local_fit = sorted(local_fit, key=lambda x : x[0], reverse=True)
-		self.FITNESS, self.POPULATION = zip(*local_fit)
-
-		return self.FITNESS
-
-
-	def get_fitness_max(self) -> Tuple[float, List[int]]:
-		"""
-		Get the individual from population with maximum fitness.
-		
-		:returns (max_fitness, individual): Max fitness and the individual.
-		"""
-
-		max_f = max(self.FITNESS)
-		max_p = self.POPULATION[self.FITNESS.index(max_f)]
-
-		return max_f, max_p
-
-
-	def elitism(self) -> List[int]:
-		"""
-		Perform Elitism based on ELITISM RATE.
-		The fittest from the population will automatically preserved for the next generation.
-
-		:returns elitism: List of individuals index by elitsm.
-		"""
-
-		if self.ELITISM_RATE:
-			self.ELITISM = list(range(int(self.ELITISM_RATE * self.POPULATION_SIZE)))
-
-		return self.ELITISM
-
-
-	def selection(self) -> List[int]:
-		"""
-		Perform Tournament selection based on TOURNAMENT SIZE.
-
-		:returns selection: List of selected individuals by index
-		"""
-
-		range_tournament = range(0, self.POPULATION_SIZE)
-		self.SELECTION = []
- 
-		for _ in range(0, self.POPULATION_SIZE, 2):
-
-			winner_a = None
-			winner_b = None
-
-			# While loop so same individual is not winner of both tournaments.
-			while winner_a == winner_b:
-				tournament_a = random.sample(range_tournament, self.TOURNAMENT_SIZE)
-				tournament_b = random.sample(range_tournament, self.TOURNAMENT_SIZE)
-				
-				fitness_a = [self.FITNESS[x] for x in tournament_a]
-				fitness_b = [self.FITNESS[x] for x in tournament_b]
-				
-				max_a = max(fitness_a)
-				max_b = max(fitness_b)
-
-				winner_a = tournament_a[fitness_a.index(max_a)]
-				winner_b = tournament_b[fitness_b.index(max_b)]
-
-			self.SELECTION.extend([winner_a, winner_b])
-
-		return self.SELECTION
-
-
-	def crossover(self) -> List[List[int]]:
-		"""
-		Perform crossover and store the children.
-		The crossover operation depends on CROSSOVER enum value.
-
-		:returns children: List of children.
-		"""
-		
-		self.CHILDREN = []
-		for i in range(0, len(self.SELECTION), 2):
-			p1 = self.POPULATION[self.SELECTION[i]]
-			p2 = self.POPULATION[self.SELECTION[i+1]]
-			o1, o2 = self.produce_offspring(p1, p2)
-			self.CHILDREN.extend([o1, o2])
-
-		return self.CHILDREN
-
-	
-	def mutation(self) -> List[List[int]]:
-		"""
-		Perform mutation on the children given MUTATION RATE.A
-
-		:returns children: List of children after mutation.
-		"""
-
-		for i, child in enumerate(self.CHILDREN):
-			self.CHILDREN[i] = self.mutate(child)
-
-
-	def next_generation(self) -> List[List[int]]:
-		"""
-		Select the next generation based on elitism and parent-child fitness.
-		For next generations, the best two from the parent-child based on fitness will be saved.
-
-		:returns population: List of individuals for the next generation.
-		"""
-
-		new_generation = [self.POPULATION[x] for x in self.ELITISM]
-
-		for i in range(0, len(self.SELECTION), 2):
-
-			p1, p2, o1, o2 = self.POPULATION[self.SELECTION[i]], self.POPULATION[self.SELECTION[i+1]], self.CHILDREN[i], self.CHILDREN[i+1]
-			fp1, fp2, fo1, fo2 = self.FITNESS[self.SELECTION[i]], self.FITNESS[self.SELECTION[i+1]], self.calculate_fitness(o1), self.calculate_fitness(o2)
-
-			ind = [p1, p2, o1, o2]
-			fitness = [fp1, fp2, fo1, fo2]
-			best = sorted(fitness, reverse=True)[:2]
-			best_a = fitness.index(best[0])
-			best_b = fitness.index(best[1])
-
-			new_generation.extend([ind[best_a], ind[best_b]])
-			
-		self.POPULATION = new_generation
-
-		return self.POPULATION
-
-
-	def generate_syntethic_like_workload(self):
-		"""
-		Generate synthehic workload.
-		Will overwrite N_CLOUDLETS and CLOUDLETS.
-		Best to call this right before generate_population().
-		"""
-
-		counting = [20, 60, 5, 10, 5]
-		amount = [(1, 250), (800, 1200), (1800, 2500), (7000, 10000), (30000, 45000)]
-		self.N_CLOUDLETS = sum(counting)
-		self.CLOUDLETS = []
-		_id = 0
-
-		for i, c in enumerate(counting):
-			for j in range(c):
-				self.CLOUDLETS.append(Cloudlet(_id, random.randint(*amount[i])))
-				_id = _id + 1
-
-	
-	def generate_google_like_workload(self):
-		"""
-		Generate google workload.
-		Will overwrite N_CLOUDLETS and CLOUDLETS.
-		Best to call this right before generate_population().
-		"""
-
-		counting = [20, 40, 30, 4, 6]
-		amount = [(15000, 55000), (59000, 90000), (101000, 135000), (150000, 337500), (525000, 900000)]
-		self.N_CLOUDLETS = sum(counting)
-		self.CLOUDLETS = []
-		_id = 0
-
-		for i, c in enumerate(counting):
-			for j in range(c):
-				self.CLOUDLETS.append(Cloudlet(_id, random.randint(*amount[i])))
-				_id = _id + 1
-
-
-	def random_results_ct(self) -> Tuple[List[int], List[float]]:
-		"""
-		Using random selection algorithm, generate the schedule and its completion time.
-
-		:returns p1, vm_ct: Individual and its completion time.
-		"""
-
-		p1 = self.generate_individual()
-		vm_ct = self.calculate_all_vm_completion_time(p1)
-
-		return p1, vm_ct
-
-
-	def round_robin_results_ct(self) -> Tuple[List[int], List[float]]:
-		"""
-		Using round robin algorithm, generate the schedule and its completion time.
-
-		:returns p1, vm_ct: Individual and its completion time.
-		"""
-
-		p1 = []
-		_x = 0
-		for _ in range(self.N_CLOUDLETS):
-			p1.append(_x)
-			_x = (_x + 1) % self.N_VMS
-
-		vm_ct = self.calculate_all_vm_completion_time(p1)
-
-		return p1, vm_ct
-
-
-	def mct_results_ct(self) -> Tuple[List[int], List[float]]:
-		"""
-		Using minimum completion time algorithm, generate the schedule and its completion time.
-
-		:returns p1, vm_ct: Individual and its completion time.
-		"""
-
-		p1 = []
-		vm_share = [0] * self.N_VMS
-
-		for cl in self.CLOUDLETS:
-			mn = min(vm_share)
-			vm_id = vm_share.index(mn)
-			vm_share[vm_id] = vm_share[vm_id] + (cl.get_length() / self.VMS[vm_id].get_mips())
-
-			p1.append(vm_id)
-
-		vm_ct = self.calculate_all_vm_completion_time(p1)
-
-		return p1, vm_ct
-
-	
-	def minmin_results_ct(self) -> Tuple[List[int], List[float]]:
-		"""
-		Using min-min completion time algorithm, generate the schedule and its completion time.
-
-		:returns p1, vm_ct: Individual and its completion time.
-		"""
-		
-		p1 = []
-		
-		vm_share = [0] * self.N_VMS
-
-		for i, cl in enumerate(self.CLOUDLETS):
-			_vm_share = vm_share.copy()
-			for j, vm in enumerate(self.VMS):
-				_vm_share[j] = _vm_share[j] + (cl.get_length() / vm.get_mips())
-			
-			mn = min(_vm_share)
-			vm_id = _vm_share.index(mn)
-
-			vm_share[vm_id] = vm_share[vm_id] + (cl.get_length() / self.VMS[vm_id].get_mips())
-
-			p1.append(vm_id)
-
-		vm_ct = self.calculate_all_vm_completion_time(p1)
-
-		return p1, vm_ct
+"""
+This module contains the class for genetic algorithm and its specification.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import math
+import time
+import random
+import heapq
+import bisect
+import copy
+import hashlib
+from array import array
+from enum import Enum
+from collections import Counter, OrderedDict
+from itertools import compress, count
+from typing import Tuple, List, Iterable, Iterator, Sequence
+from crossover import Crossover
+from seeding import Seeding
+from engine import Engine
+from parallel import ParallelEvaluator
+from population import Population, gene_typecode
+from cloudlet import Cloudlet, CloudletArray
+from vm import Vm, VmArray
+from workload import read_column
+from telemetry import Telemetry
+from checkpoint import as_buffer, copy_buffer, write_checkpoint, read_checkpoint
+import operators
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+random.seed(0)
+
+# Number of genes, ETC rows or cloudlets processed between two checks of a run() deadline
+DEADLINE_BLOCK = 4096
+# Number of genes calculate_fitness_bounded adds up between two comparisons of the loads with its makespan threshold
+BOUND_BLOCK = 512
+
+class GeneticCloudScheduling():
+
+
+	def __init__(self):
+		# Number of Generations to iterate to
+		self.N_GENERATIONS: int = 1
+		# Desired Stopping condition based on fitness change ie DETLA FITNESS = NEW FITNESS - OLD FITNESS
+		self.DESIRED_DELTA_FITNESS: float = 0
+		# Number of generations for desired delta fitness to occur concurrently to stop
+		self.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION: int = 0
+		# Also require the population diversity to change by at most this much over those generations to stop, None ignores diversity
+		self.DESIRED_DELTA_DIVERSITY: float = None
+		# Wall-clock deadline in seconds for run(), 0 means no limit
+		self.TIME_BUDGET: float = 0.0
+		# Best fitness of every generation of the last run()
+		self.FITNESS_TRACK: List[float] = []
+		# Change of best fitness of every generation of the last run()
+		self.DELTA_FITNESS_TRACK: List[float] = []
+		# Seconds since the start of the last run() at every FITNESS_TRACK entry
+		self.TIME_TRACK: List[float] = []
+		# Population diversity at every FITNESS_TRACK entry, recorded when ADAPTIVE_RATES or DESIRED_DELTA_DIVERSITY is set
+		self.DIVERSITY_TRACK: List[float] = []
+		# Number of generations evolved by the last run()
+		self.GENERATION: int = 0
+		# Number of VMs
+		self.N_VMS: int = 1
+		# Number of Cloudlets
+		self.N_CLOUDLETS: int = 1
+		# Total population size
+		self.POPULATION_SIZE: int = 2
+		# Size of tournament for tournament selection
+		self.TOURNAMENT_SIZE: int = 2
+		# Crossover type
+		self.CROSSOVER: Crossover = Crossover.UNIFORM
+		# Crossover rate
+		self.CROSSOVER_RATE: float = 0.0
+		# Mutation rate
+		self.MUTATION_RATE: float = 0.0
+		# Elitism rate
+		self.ELITISM_RATE: float = 0.0
+		# Adapt MUTATION_RATE and CROSSOVER_RATE to the population diversity before every generation of run()
+		self.ADAPTIVE_RATES: bool = False
+		# Diversity below which the adapted rates are raised, and above which they are lowered
+		self.TARGET_DIVERSITY: float = 0.1
+		# Factor the adapted rates are raised or lowered by per generation
+		self.ADAPTATION_FACTOR: float = 1.25
+		# Lowest and highest adapted MUTATION_RATE
+		self.MUTATION_RATE_RANGE: List[float] = [0.01, 0.03]
+		# Lowest and highest adapted CROSSOVER_RATE, 0.5 mixes the genes of uniform crossover parents the most
+		self.CROSSOVER_RATE_RANGE: List[float] = [0.1, 0.2]
+		# Number of evenly spaced genes the diversity is measured on, 0 measures every gene
+		self.DIVERSITY_GENES: int = 1000
+		# Fraction of the initial population seeded from heuristic schedules and perturbed copies of them, 0 seeds none
+		self.SEED_FRACTION: float = 0.0
+		# Heuristics seeding the initial population
+		self.SEED_HEURISTICS: List[Seeding] = [Seeding.MCT, Seeding.MIN_MIN, Seeding.ROUND_ROBIN, Seeding.LPT]
+		# Probability of reassigning each gene of a perturbed copy of a seed
+		self.SEED_PERTURBATION_RATE: float = 0.05
+		# Fitness engine, NUMPY evaluates the whole population in one batched pass
+		self.ENGINE: Engine = Engine.PYTHON
+		# Carry per-VM loads with each individual and update them per changed gene instead of re-evaluating
+		self.INCREMENTAL_FITNESS: bool = False
+		# Draw the gaps between mutated genes instead of one random number per gene
+		self.SPARSE_MUTATION: bool = False
+		# Candidate moves and swaps scored per generation by the local search on the most loaded VM, 0 disables it
+		self.LOCAL_SEARCH_BUDGET: int = 0
+		# Apply the local search to the elites
+		self.LOCAL_SEARCH_ELITES: bool = True
+		# Apply the local search to the children
+		self.LOCAL_SEARCH_CHILDREN: bool = False
+		# Apply selection, crossover and mutation to the whole population at once, requires numpy
+		self.BATCHED_OPERATORS: bool = False
+		# Replace the generational scheme by steady-state insertion of a few children at a time into the ranked population, cannot be combined with BATCHED_OPERATORS
+		self.STEADY_STATE: bool = False
+		# Number of children produced and evaluated per steady-state insertion
+		self.STEADY_STATE_OFFSPRING: int = 2
+		# Seed of this instance's own random stream, None uses the random module's stream so random.seed applies
+		self.SEED: int = None
+		# Position of this instance's stream in the tree of child streams spawned from SEED
+		self.SPAWN_KEY: List[int] = []
+		# Random generator used by every operator, the random module itself until seed() is called
+		self._random: random.Random = random
+		# Numpy random generator used by the batched operators, seeded lazily from _random
+		self._np_random = None
+		# Number of worker processes for fitness evaluation, 1 evaluates serially
+		self.N_WORKERS: int = 1
+		# Wall-clock time.perf_counter() deadline of the current run(), checked between individuals by the evaluation loops
+		self._deadline: float = None
+		# Process pool used when N_WORKERS is greater than 1
+		self._evaluator: ParallelEvaluator = None
+		# Per generation telemetry collected by step(), None disables it
+		self.TELEMETRY: Telemetry = None
+		# Number of generations evolved per streaming batch
+		self.STREAM_GENERATIONS: int = 10
+		# Wall-clock budget in seconds per streaming batch, 0 means no limit
+		self.STREAM_TIME_BUDGET: float = 0.0
+		# File run() writes a checkpoint to, None disables checkpointing
+		self.CHECKPOINT_PATH: str = None
+		# Number of generations between checkpoints written by run(), 0 disables checkpointing
+		self.CHECKPOINT_INTERVAL: int = 0
+		# Maximum number of chromosomes remembered by the fitness memo, 0 disables it
+		self.FITNESS_CACHE_SIZE: int = 0
+		# Number of fitness values reused from clean individuals or the fitness memo
+		self.FITNESS_CACHE_HITS: int = 0
+		# Number of fitness values that had to be evaluated
+		self.FITNESS_CACHE_MISSES: int = 0
+		# Evaluate children against the makespan of the worse parent of their pair in next_generation and give up on
+		# children that exceed it, only the PYTHON engine stops early. Rejected children typically exceed it only
+		# after 95% or more of their genes, so this saves a few percent of the evaluation at most
+		self.BOUNDED_FITNESS: bool = False
+		# Number of children rejected by the bounded evaluation
+		self.FITNESS_REJECTIONS: int = 0
+		# Stop run() once the best makespan reaches calculate_makespan_lower_bound, as no schedule can be better
+		self.STOP_AT_LOWER_BOUND: bool = True
+		# Least recently used fitness memo keyed by chromosome hash
+		self._fitness_memo: OrderedDict = OrderedDict()
+		# Individuals in one contiguous buffer, ranked by fitness after calculate_fitness_all
+		self.POPULATION: Population = Population(self.N_VMS, self.N_CLOUDLETS)
+		# Whether each FITNESS entry is still valid for its individual, only trusted for the population in _clean_population
+		self.CLEAN: List[bool] = []
+		self._clean_population: Population = None
+		# Expected time to compute table, built lazily from CLOUDLETS and VMS
+		self._etc: array = None
+		self._etc_array = None
+		# List of Cloudlets
+		self.CLOUDLETS: List[Cloudlet] = []
+		# List of VMs
+		self.VMS: List[Vm] = []
+		# List of selected inidividuals for crossover
+		self.SELECTION: List[int] = []
+		# List of Children
+		self.CHILDREN: List[List[int]] = []
+		# Positions of the mutated genes of each child
+		self.MUTATED_GENES: List[List[int]] = []
+		# Per-VM completion time of each individual, used by INCREMENTAL_FITNESS
+		self.LOADS: List[List[float]] = []
+		# Per-VM completion time of each child, used by INCREMENTAL_FITNESS
+		self.CHILDREN_LOADS: List[List[float]] = []
+		# List of Inidividuals index saved due to elitism
+		self.ELITISM: List[int] = []
+		# POPULATION FITNESS, parallel to POPULATION
+		self.FITNESS: array = array("d")
+
+
+	def __getstate__(self) -> dict:
+		# Worker pools and cached tables are not sent to other processes, they are rebuilt lazily
+		state = self.__dict__.copy()
+		state["_evaluator"] = None
+		state["_etc"] = None
+		state["_etc_array"] = None
+		state["_fitness_memo"] = OrderedDict()
+		# The random module cannot be pickled, receivers share their own process's random module instead
+		if self._random is random:
+			state["_random"] = None
+		return state
+
+
+	def __setstate__(self, state: dict):
+		self.__dict__.update(state)
+		if self._random is None:
+			self._random = random
+
+
+	def seed(self, seed: int = None, spawn_key: Sequence[int] = ()):
+		"""
+		Give this instance its own random stream, used by every operator and generator.
+		Without a spawn key the stream is the one random.seed(seed) would give the random module,
+		child streams with different spawn keys are independent of each other and of the root stream.
+
+		:param seed: Seed of the stream, None goes back to sharing the random module's stream.
+		:param spawn_key: Path of a child stream spawned from seed.
+		"""
+
+		self.SEED = seed
+		self.SPAWN_KEY = list(spawn_key)
+		if seed is None:
+			self._random = random
+		elif self.SPAWN_KEY:
+			self._random = random.Random("/".join(str(x) for x in [seed] + self.SPAWN_KEY))
+		else:
+			self._random = random.Random(seed)
+		self._np_random = None
+
+
+	def spawn(self, n: int) -> List["GeneticCloudScheduling"]:
+		"""
+		Copy this scheduler n times, copy i drawing from the child stream SPAWN_KEY + [i] of SEED.
+		The child streams only depend on SEED and SPAWN_KEY, not on how much of this instance's stream was used.
+
+		:param n: Number of copies.
+
+		:returns children: Independent copies with their own streams.
+		"""
+
+		if self.SEED is None:
+			raise ValueError("spawn requires an instance with its own stream, call seed() first.")
+
+		children = []
+		for i in range(n):
+			child = copy.deepcopy(self)
+			child.seed(self.SEED, self.SPAWN_KEY + [i])
+			children.append(child)
+
+		return children
+
+
+	@property
+	def CLOUDLETS(self) -> List[Cloudlet]:
+		return self._cloudlets
+
+
+	@CLOUDLETS.setter
+	def CLOUDLETS(self, cloudlets: List[Cloudlet]):
+		self._cloudlets = cloudlets
+		self.invalidate_etc()
+
+
+	@property
+	def VMS(self) -> List[Vm]:
+		return self._vms
+
+
+	@VMS.setter
+	def VMS(self, vms: List[Vm]):
+		self._vms = vms
+		self.invalidate_etc()
+
+
+	def invalidate_etc(self):
+		"""
+		Drop the cached expected time to compute table and every cached fitness value.
+		Called automatically whenever CLOUDLETS or VMS are replaced, call it manually after modifying them in place.
+		"""
+
+		self._etc = None
+		self._etc_array = None
+		self._fitness_memo.clear()
+		self._clean_population = None
+
+
+	def get_cloudlet_lengths(self) -> Sequence[float]:
+		"""
+		Get the length of every cloudlet, read straight from the buffer for columnar cloudlets.
+
+		:returns lengths: Cloudlet lengths.
+		"""
+
+		if isinstance(self.CLOUDLETS, CloudletArray):
+			return self.CLOUDLETS.get_lengths()
+
+		return [cl.get_length() for cl in self.CLOUDLETS]
+
+
+	def get_vm_mips(self) -> Sequence[float]:
+		"""
+		Get the MIPS of every VM, read straight from the buffer for columnar VMs.
+
+		:returns mips: VM MIPS.
+		"""
+
+		if isinstance(self.VMS, VmArray):
+			return self.VMS.get_mips()
+
+		return [vm.get_mips() for vm in self.VMS]
+
+
+	def get_etc(self) -> array:
+		"""
+		Get the expected time to compute (ETC) table, building it if needed.
+		The table is one flat array of doubles in row-major order, the value at [i * N_VMS + j] is the time taken by cloudlet i on VM j.
+
+		:returns etc: Flat ETC table.
+		"""
+
+		if self._etc is None:
+			mips = self.get_vm_mips()
+			lengths = self.get_cloudlet_lengths()
+			etc = array("d")
+			# Built in blocks of rows so a run() deadline can interrupt it
+			for start in range(0, len(lengths), DEADLINE_BLOCK):
+				self.check_deadline()
+				etc.extend([length / m for length in lengths[start:start + DEADLINE_BLOCK] for m in mips])
+			self._etc = etc
+
+		return self._etc
+
+
+	def get_etc_array(self) -> "np.ndarray":
+		"""
+		Get the expected time to compute (ETC) table as a numpy matrix, building it if needed.
+		Requires numpy.
+
+		:returns etc: ETC matrix of shape (len(CLOUDLETS), len(VMS)).
+		"""
+
+		if np is None:
+			raise ImportError("Engine.NUMPY requires numpy to be installed.")
+
+		if self._etc_array is None:
+			lengths = np.asarray(self.get_cloudlet_lengths(), dtype=np.float64)
+			mips = np.asarray(self.get_vm_mips(), dtype=np.float64)
+			etc = np.empty((len(lengths), len(mips)))
+			# Built in blocks of rows so a run() deadline can interrupt it
+			rows = max(1, DEADLINE_BLOCK * DEADLINE_BLOCK // max(1, len(mips)))
+			for start in range(0, len(lengths), rows):
+				self.check_deadline()
+				np.divide(lengths[start:start + rows, None], mips[None, :], out=etc[start:start + rows])
+			self._etc_array = etc
+
+		return self._etc_array
+
+
+	def generate_vms(self, low: int, high: int) -> List[Vm]:
+		"""
+		Generate a list of VMs with the MIPS set as a random value between low and high ranges.
+		
+		:param low: MIPS lower range.
+		:param high: MIPS higher range.
+
+		:returns vms: List of VM.
+		"""
+
+		if low > high:
+			low, high = high, low
+		
+		self.VMS = [Vm(i, self._random.randint(low, high)) for i in range(self.N_VMS)]
+		return self.VMS
+
+
+	def generate_cloudlets(self, low: int, high: int) -> List[Cloudlet]:
+		"""
+		Generate a list of cloudlets with the length set as a random value between low and high ranges.
+		
+		:param low: MIPS lower range.
+		:param high: MIPS higher range.
+
+		:returns cloudlets: List of tasks.
+		"""
+
+		if low > high:
+			low, high = high, low
+
+		self.CLOUDLETS = [Cloudlet(i, self._random.randint(low, high)) for i in range(self.N_CLOUDLETS)]
+
+		return self.CLOUDLETS
+
+	def generate_allele(self) -> int:
+		"""
+		Generate gene.
+		This is the generates a random number between 0 and N_VMS - 1.
+
+		:returns gene: gene
+		"""
+
+		return self._random.randint(0, self.N_VMS - 1)
+
+
+	def generate_individual(self) -> List[int]:
+		"""
+		Generate an individual where the positions represent the ID of cloudlet while the value at each index represents which VM the cloudlet will be assigned to.
+		For example, individual with chromosome [7, 11, 9] has three cloudlets where cloudlet #1, #2 and #3 are assigned to VM ID 7, 11 and 9 respectively.
+
+		:returns inidividual: List of Integers
+		"""
+
+		individual = []
+		# Generated in blocks of genes so a run() deadline can interrupt it
+		for start in range(0, self.N_CLOUDLETS, DEADLINE_BLOCK):
+			self.check_deadline()
+			individual.extend([self.generate_allele() for i in range(start, min(start + DEADLINE_BLOCK, self.N_CLOUDLETS))])
+
+		return individual
+
+
+	def generate_population(self) -> Population:
+		"""
+		Generate the entire population of inidividuals.
+		When SEED_FRACTION is set, that fraction of the population is seeded by generate_seeded_individuals,
+		which requires CLOUDLETS and VMS, and the rest is random.
+
+		:returns population: Population of individuals.
+		"""
+
+		n_seeded = min(round(self.POPULATION_SIZE * self.SEED_FRACTION), self.POPULATION_SIZE) if self.SEED_FRACTION else 0
+		individuals = self.generate_seeded_individuals(n_seeded) if n_seeded else []
+		for j in range(self.POPULATION_SIZE - n_seeded):
+			self.check_deadline()
+			individuals.append(self.generate_individual())
+
+		self.POPULATION = Population.from_individuals(individuals, self.N_VMS, self.N_CLOUDLETS)
+		self.LOADS = []
+		return self.POPULATION
+
+
+	def generate_seeded_individuals(self, n: int) -> List[List[int]]:
+		"""
+		Generate individuals from the SEED_HEURISTICS schedules, followed by copies of them perturbed with SEED_PERTURBATION_RATE
+		until there are n individuals.
+
+		:param n: Number of individuals.
+
+		:returns individuals: List of individuals.
+		"""
+
+		heuristics = {
+			Seeding.MCT: self.mct_results_ct,
+			Seeding.MIN_MIN: self.minmin_results_ct,
+			Seeding.ROUND_ROBIN: self.round_robin_results_ct,
+			Seeding.LPT: self.lpt_results_ct,
+		}
+		seeds = [heuristics[seeding]()[0] for seeding in self.SEED_HEURISTICS]
+		individuals = seeds[:n]
+
+		while len(individuals) < n:
+			individuals.append(self.perturb(seeds[len(individuals) % len(seeds)], self.SEED_PERTURBATION_RATE))
+
+		return individuals
+
+
+	def perturb(self, p1: List[int], rate: float) -> List[int]:
+		"""
+		Copy an individual and reassign each gene of the copy to a random VM with the given probability.
+
+		:param p1: Individual.
+		:param rate: Probability of reassigning each gene.
+
+		:returns individual: Perturbed copy.
+		"""
+
+		individual = []
+		for start in range(0, len(p1), DEADLINE_BLOCK):
+			self.check_deadline()
+			individual.extend([self.generate_allele() if self.get_probability(rate) else gene for gene in p1[start:start + DEADLINE_BLOCK]])
+
+		return individual
+
+
+	def get_probability(self, probability: float) -> bool:
+		"""
+		Given the probability, return true or false of the event happening.
+
+		:param probability: Between 0 and 1.
+
+		:returns decisision: bool.
+		"""
+
+		return self._random.random() <= probability
+
+
+	def produce_offspring(self, p1: List[int], p2: List[int], crossed: List[int] = None) -> Tuple[List[int], List[int]]:
+		"""
+		Produce two new offspring given parents P1 and P2.
+		The crossover operation depends on CROSSOVER enum value.
+		Current supported operations are uniform and single point crossover.
+
+		:param p1: Parent p1.
+		:param p2: Parent p2.
+		:param crossed: Optional list, the positions where the offspring differ from the parents they keep most genes of are appended to it,
+			o1 keeps p1 and o2 keeps p2 with single point crossover or a CROSSOVER_RATE of at least 0.5, o1 keeps p2 and o2 keeps p1 otherwise.
+
+		:returns o1, o2: offspring 1 and offspring 2
+		"""
+
+		o1 = []
+		o2 = []
+		if self.CROSSOVER is Crossover.UNIFORM:
+			if crossed is None:
+				for a, b in zip(p1, p2):
+					if self.get_probability(self.CROSSOVER_RATE):
+						o1.append(a)
+						o2.append(b)
+					else:
+						o1.append(b)
+						o2.append(a)
+			else:
+				keep = self.CROSSOVER_RATE >= 0.5
+				for i, (a, b) in enumerate(zip(p1, p2)):
+					if self.get_probability(self.CROSSOVER_RATE):
+						o1.append(a)
+						o2.append(b)
+						if not keep:
+							crossed.append(i)
+					else:
+						o1.append(b)
+						o2.append(a)
+						if keep:
+							crossed.append(i)
+		elif self.CROSSOVER is Crossover.SINGLE_POINT:
+			point = self._random.randint(0, len(p1))
+			o1 = list(p1[0:point]) + list(p2[point:])
+			o2 = list(p2[0:point]) + list(p1[point:])
+			if crossed is not None:
+				crossed.extend(range(point, len(p1)))
+			
+		return o1, o2
+
+
+	def mutate(self, p1: List[int], loads: List[float] = None, positions: List[int] = None):
+		"""
+		Apply mutation on individual with probability MUTATION_RATE.
+		Every gene may be mutated for the provided individual p1.
+		With SPARSE_MUTATION only the mutated positions are visited.
+
+		:param p1: Individual.
+		:param loads: Optional per-VM completion time of p1, updated in place for every mutated gene.
+		:param positions: Optional list, the position of every mutated gene is appended to it.
+
+		:returns p1: Individual with mutated genes.
+		"""
+
+		if self.SPARSE_MUTATION:
+			candidates = self.sample_mutation_positions(len(p1))
+		else:
+			candidates = (i for i in range(len(p1)) if self.get_probability(self.MUTATION_RATE))
+
+		for i in candidates:
+			gene = self.generate_allele()
+			if loads is not None:
+				self.move_load(loads, i, p1[i], gene)
+			if positions is not None:
+				positions.append(i)
+			p1[i] = gene
+		return p1
+
+
+	def sample_mutation_positions(self, length: int) -> List[int]:
+		"""
+		Sample the positions to mutate by drawing the geometric gaps between them.
+		Every position is still chosen independently with probability MUTATION_RATE,
+		but only one random number is drawn per mutated gene instead of one per gene.
+
+		:param length: Number of genes.
+
+		:returns positions: Sorted list of positions.
+		"""
+
+		if self.MUTATION_RATE <= 0:
+			return []
+		if self.MUTATION_RATE >= 1:
+			return list(range(length))
+
+		log_q = math.log(1.0 - self.MUTATION_RATE)
+		positions = []
+		i = int(math.log(1.0 - self._random.random()) / log_q)
+		while i < length:
+			positions.append(i)
+			i = i + 1 + int(math.log(1.0 - self._random.random()) / log_q)
+
+		return positions
+
+
+	def move_load(self, loads: List[float], cloudlet_id: int, old_vm_id: int, new_vm_id: int) -> List[float]:
+		"""
+		Update per-VM completion times in place for a cloudlet moved from one VM to another.
+
+		:param loads: Per-VM completion time.
+		:param cloudlet_id: ID of the moved cloudlet.
+		:param old_vm_id: ID of the VM the cloudlet was assigned to.
+		:param new_vm_id: ID of the VM the cloudlet is assigned to now.
+
+		:returns loads: Updated per-VM completion time.
+		"""
+
+		if old_vm_id != new_vm_id:
+			etc = self.get_etc()
+			base = cloudlet_id * self.N_VMS
+			loads[old_vm_id] = loads[old_vm_id] - etc[base + old_vm_id]
+			loads[new_vm_id] = loads[new_vm_id] + etc[base + new_vm_id]
+		return loads
+
+
+	def derive_loads(self, parent: List[int], parent_loads: List[float], child: List[int], positions: Iterable[int]) -> List[float]:
+		"""
+		Derive the per-VM completion time of a child from one of its parents.
+		Only the genes at positions, those produce_offspring recorded as crossed, are moved, the rest of the chromosome is not visited.
+		Values may differ in the last bits from a full calculate_all_vm_completion_time due to rounding,
+		resync_loads recomputes them once an individual becomes an elite or the best.
+
+		:param parent: Parent individual.
+		:param parent_loads: Per-VM completion time of the parent.
+		:param child: Child individual.
+		:param positions: Positions where the child may differ from the parent.
+
+		:returns loads: Per-VM completion time of the child.
+		"""
+
+		loads = list(parent_loads)
+		etc = self.get_etc()
+		n_vms = self.N_VMS
+		# move_load inlined, it is called for a good part of the genes of every child
+		for i in positions:
+			a, b = parent[i], child[i]
+			if a != b:
+				loads[a] = loads[a] - etc[i * n_vms + a]
+				loads[b] = loads[b] + etc[i * n_vms + b]
+		return loads
+	
+
+	def improve(self, p1: List[int], loads: List[float] = None, budget: int = 0) -> Tuple[int, int]:
+		"""
+		Local search on the makespan-defining VM.
+		Repeatedly moves a cloudlet off the most loaded VM onto a VM where it finishes before the current makespan,
+		or when no such move exists, swaps it with a cloudlet of a less loaded VM when both VMs then finish before it.
+		Cloudlets are tried largest first and VMs least loaded first, every candidate is scored in O(1) from the per-VM loads.
+		The cloudlets of every VM are grouped once per call, those of a VM are sorted the first time it is the bottleneck,
+		and they and the VMs by load are kept sorted through the moves by bisection instead of being sorted again.
+		The search stops at a local optimum or after budget scored candidates.
+
+		:param p1: Individual, modified in place.
+		:param loads: Optional per-VM completion time of p1, updated in place.
+		:param budget: Maximum number of candidates to score.
+
+		:returns (scored, moves): Number of candidates scored and of moves and swaps applied.
+		"""
+
+		etc = self.get_etc()
+		n_vms = self.N_VMS
+		if loads is None:
+			loads = self.calculate_all_vm_completion_time(p1)
+		# Cloudlets of every VM in assignment order, mapped to their insertion number, built once per call
+		members = [{} for _ in range(n_vms)]
+		for cloudlet_id, vm_id in enumerate(p1):
+			members[vm_id][cloudlet_id] = cloudlet_id
+		insertions = count(len(p1))
+		# (-ETC, insertion number, cloudlet) of the cloudlets of a VM, sorted the first time it is the bottleneck and kept sorted after
+		ranked = [None] * n_vms
+		# (load, VM) of every VM, kept sorted
+		by_load = sorted(zip(loads, range(n_vms)))
+
+		def reassign(cloudlet_id: int, old_vm_id: int, new_vm_id: int):
+			old_loads = loads[old_vm_id], loads[new_vm_id]
+			self.move_load(loads, cloudlet_id, old_vm_id, new_vm_id)
+			for vm_id, load in zip((old_vm_id, new_vm_id), old_loads):
+				del by_load[bisect.bisect_left(by_load, (load, vm_id))]
+				bisect.insort(by_load, (loads[vm_id], vm_id))
+			insertion = members[old_vm_id].pop(cloudlet_id)
+			if ranked[old_vm_id] is not None:
+				del ranked[old_vm_id][bisect.bisect_left(ranked[old_vm_id], (-etc[cloudlet_id * n_vms + old_vm_id], insertion, cloudlet_id))]
+			insertion = members[new_vm_id][cloudlet_id] = next(insertions)
+			if ranked[new_vm_id] is not None:
+				bisect.insort(ranked[new_vm_id], (-etc[cloudlet_id * n_vms + new_vm_id], insertion, cloudlet_id))
+			p1[cloudlet_id] = new_vm_id
+
+		def candidates(bottleneck: int, receivers: List[int]) -> Iterator[Tuple[int, int, int]]:
+			if ranked[bottleneck] is None:
+				ranked[bottleneck] = sorted((-etc[cloudlet_id * n_vms + bottleneck], insertion, cloudlet_id) for cloudlet_id, insertion in members[bottleneck].items())
+			# The search stops at the first improving candidate, before ranked changes
+			for _, _, cloudlet_id in ranked[bottleneck]:
+				for vm_id in receivers:
+					yield cloudlet_id, vm_id, None
+			for _, _, cloudlet_id in ranked[bottleneck]:
+				for vm_id in receivers:
+					for other_id in members[vm_id]:
+						yield cloudlet_id, vm_id, other_id
+
+		scored = 0
+		moves = 0
+		while scored < budget:
+			makespan = by_load[-1][0]
+			# The lowest VM ID among the most loaded, and the VMs below the makespan least loaded first
+			n_receivers = bisect.bisect_left(by_load, (makespan, -1))
+			bottleneck = by_load[n_receivers][1]
+			receivers = [vm_id for _, vm_id in by_load[:n_receivers]]
+
+			for cloudlet_id, vm_id, other_id in candidates(bottleneck, receivers):
+				scored = scored + 1
+				if other_id is None:
+					improves = loads[vm_id] + etc[cloudlet_id * n_vms + vm_id] < makespan
+				else:
+					improves = loads[bottleneck] - etc[cloudlet_id * n_vms + bottleneck] + etc[other_id * n_vms + bottleneck] < makespan \
+						and loads[vm_id] - etc[other_id * n_vms + vm_id] + etc[cloudlet_id * n_vms + vm_id] < makespan
+				if improves or scored >= budget:
+					break
+			else:
+				break
+
+			if not improves:
+				break
+
+			reassign(cloudlet_id, bottleneck, vm_id)
+			if other_id is not None:
+				reassign(other_id, vm_id, bottleneck)
+			moves = moves + 1
+
+		return scored, moves
+
+
+	def calculate_vm_completion_time(self, vm_id: int, p1: List[int]) -> float:
+		"""
+		Calculate completion time for a particular VM.
+
+		:param vm_id: ID of VM.
+		:param p1: Individual.
+
+		:returns vm_ct: Completion time
+		"""
+
+		etc = self.get_etc()
+		vm_ct:float = 0.0
+		for i, _vm_id in enumerate(p1):
+			if vm_id == _vm_id:
+				vm_ct = vm_ct + etc[i * self.N_VMS + vm_id]
+		return vm_ct
+
+
+	def calculate_all_vm_completion_time(self, p1: List[int]) -> List[float]:
+		"""
+		Calculate completion time for all VMs.
+
+		:param p1: Individual.
+
+		:returns vm_ct: Completion time of all VMs
+		"""
+
+		if self.ENGINE is Engine.NUMPY:
+			return self.calculate_population_vm_completion_time([p1])[0].tolist()
+
+		etc = self.get_etc()
+		vm_ct = [0.0] * self.N_VMS
+
+		for start in range(0, len(p1), DEADLINE_BLOCK):
+			self.check_deadline()
+			for base, vm_id in zip(range(start * self.N_VMS, len(etc), self.N_VMS), p1[start:start + DEADLINE_BLOCK]):
+				vm_ct[vm_id] = vm_ct[vm_id] + etc[base + vm_id]
+
+		return vm_ct
+
+
+	def calculate_population_vm_completion_time(self, population: List[List[int]]) -> "np.ndarray":
+		"""
+		Calculate completion time for all VMs of every individual in one batched pass.
+		Each gene is weighted by its ETC entry and accumulated with a weighted bincount,
+		which sums in the same order as calculate_all_vm_completion_time and therefore gives the same values.
+		Requires numpy.
+
+		:param population: List of individuals.
+
+		:returns vm_ct: Matrix of completion times with one row per individual and one column per VM.
+		"""
+
+		if isinstance(population, Population):
+			matrix = population.as_array()
+		else:
+			matrix = np.asarray(population, dtype=np.intp).reshape(len(population), -1)
+
+		# Rows are evaluated in blocks of about DEADLINE_BLOCK * DEADLINE_BLOCK genes so a run() deadline can interrupt it
+		etc = self.get_etc_array()[None]
+		rows = max(1, DEADLINE_BLOCK * DEADLINE_BLOCK // max(1, matrix.shape[1]))
+		if len(matrix) <= rows:
+			self.check_deadline()
+			return operators.completion_times(etc, matrix[None])[0]
+		vm_ct = np.empty((len(matrix), self.N_VMS))
+		for start in range(0, len(matrix), rows):
+			self.check_deadline()
+			vm_ct[start:start + rows] = operators.completion_times(etc, matrix[None, start:start + rows])[0]
+
+		return vm_ct
+
+
+	def calculate_fitness(self, p1: List[int]) -> float:
+		"""
+		Calculate fitness of an individual based on completion time.
+
+		:param p1: Individual.
+
+		:returns fitness: fitness value.
+		"""
+
+		fitness = 1 / max(self.calculate_all_vm_completion_time(p1))
+
+		return fitness
+
+
+	def calculate_fitness_bounded(self, p1: List[int], makespan: float) -> float:
+		"""
+		Calculate fitness of an individual, giving up once the load of any VM exceeds a makespan.
+		Loads are summed in the same order and the same loop as calculate_all_vm_completion_time, so an accepted individual
+		gets exactly the fitness calculate_fitness gives it, and they are compared with the makespan every BOUND_BLOCK genes.
+		Children of the genetic algorithm mostly exceed the makespan of the worse parent only in their last few percent
+		of genes, so a rejection saves little and a comparison per gene would cost more than it saves.
+
+		:param p1: Individual.
+		:param makespan: Makespan threshold.
+
+		:returns fitness: fitness value, 0.0 when the individual is rejected.
+		"""
+
+		etc = self.get_etc()
+		vm_ct = [0.0] * self.N_VMS
+
+		# Loads only grow, so comparing the largest one after every block rejects exactly the individuals a per-gene check would
+		for start in range(0, len(p1), BOUND_BLOCK):
+			self.check_deadline()
+			for base, vm_id in zip(range(start * self.N_VMS, len(etc), self.N_VMS), p1[start:start + BOUND_BLOCK]):
+				vm_ct[vm_id] = vm_ct[vm_id] + etc[base + vm_id]
+			if max(vm_ct) > makespan:
+				return 0.0
+
+		return 1 / max(vm_ct)
+
+
+	def calculate_fitness_population(self, population: List[List[int]], makespans: List[float] = None) -> List[float]:
+		"""
+		Calculate fitness of a list of individuals using the ENGINE.
+		With makespans, the PYTHON engine rejects every individual whose makespan exceeds its threshold with fitness 0.0
+		without a full pass. The NUMPY engine and worker processes always evaluate in full.
+
+		:param population: List of individuals.
+		:param makespans: Optional makespan threshold of every individual.
+
+		:returns fitness: List of fitness values.
+		"""
+
+		self.check_deadline()
+
+		if self.N_WORKERS > 1 and len(population):
+			return self.get_evaluator().evaluate(self.get_etc_array(), population)
+
+		if self.ENGINE is Engine.NUMPY:
+			if not len(population):
+				return []
+			return (1 / self.calculate_population_vm_completion_time(population).max(axis=1)).tolist()
+
+		fitness = []
+		if makespans is not None:
+			for individual, makespan in zip(population, makespans):
+				self.check_deadline()
+				fitness.append(self.calculate_fitness_bounded(individual, makespan))
+			self.FITNESS_REJECTIONS = self.FITNESS_REJECTIONS + fitness.count(0.0)
+			return fitness
+
+		for individual in population:
+			self.check_deadline()
+			fitness.append(self.calculate_fitness(individual))
+
+		return fitness
+
+
+	def check_deadline(self):
+		"""
+		Raise TimeoutError when the wall-clock deadline of the current run() has passed.
+		Called by the population generation, heuristic, operator and evaluation loops between individuals and every
+		DEADLINE_BLOCK genes within them, run() catches it.
+		"""
+
+		if self._deadline is not None and time.perf_counter() > self._deadline:
+			raise TimeoutError("The wall-clock budget of run() ran out.")
+
+
+	def get_evaluator(self) -> ParallelEvaluator:
+		"""
+		Get the process pool evaluator, creating it if N_WORKERS changed.
+
+		:returns evaluator: Parallel evaluator with N_WORKERS workers.
+		"""
+
+		if self._evaluator is None or self._evaluator.n_workers != self.N_WORKERS:
+			self.close()
+			self._evaluator = ParallelEvaluator(self.N_WORKERS)
+
+		return self._evaluator
+
+
+	def close(self):
+		"""
+		Shut down the worker processes and free shared memory used by parallel evaluation, and close the telemetry sink.
+		"""
+
+		if self._evaluator is not None:
+			self._evaluator.close()
+			self._evaluator = None
+		if self.TELEMETRY is not None:
+			self.TELEMETRY.close()
+
+
+	def chromosome_key(self, p1: List[int]) -> bytes:
+		"""
+		Hash a chromosome for the fitness memo.
+		Lists and POPULATION rows with the same genes give the same key.
+
+		:param p1: Individual.
+
+		:returns key: 16 byte digest.
+		"""
+
+		typecode = gene_typecode(self.N_VMS)
+		if np is not None and isinstance(p1, np.ndarray):
+			p1 = np.ascontiguousarray(p1, dtype=np.uint16 if typecode == "H" else np.uint32)
+		elif not isinstance(p1, memoryview):
+			p1 = array(typecode, p1)
+
+		return hashlib.blake2b(p1, digest_size=16).digest()
+
+
+	def calculate_fitness_cached(self, population: List[List[int]], makespans: List[float] = None) -> List[float]:
+		"""
+		Calculate fitness of a list of individuals, reusing values from the fitness memo when FITNESS_CACHE_SIZE is set.
+		Only the misses are evaluated, in one call to calculate_fitness_population.
+		Rejected individuals are not remembered.
+
+		:param population: List of individuals.
+		:param makespans: Optional makespan threshold of every individual, see calculate_fitness_population.
+
+		:returns fitness: List of fitness values.
+		"""
+
+		if not self.FITNESS_CACHE_SIZE:
+			self.FITNESS_CACHE_MISSES = self.FITNESS_CACHE_MISSES + len(population)
+			return self.calculate_fitness_population(population, makespans)
+
+		memo = self._fitness_memo
+		keys = [self.chromosome_key(individual) for individual in population]
+		fitness = [memo.get(key) for key in keys]
+		misses = [i for i, value in enumerate(fitness) if value is None]
+		miss_makespans = [makespans[i] for i in misses] if makespans is not None else None
+
+		for i, value in zip(misses, self.calculate_fitness_population([population[i] for i in misses], miss_makespans)):
+			fitness[i] = value
+			if value:
+				memo[keys[i]] = value
+		for key in keys:
+			if key in memo:
+				memo.move_to_end(key)
+		while len(memo) > self.FITNESS_CACHE_SIZE:
+			memo.popitem(last=False)
+
+		self.FITNESS_CACHE_HITS = self.FITNESS_CACHE_HITS + len(population) - len(misses)
+		self.FITNESS_CACHE_MISSES = self.FITNESS_CACHE_MISSES + len(misses)
+
+		return fitness
+
+
+	def calculate_loads_population(self, population: List[List[int]]) -> List[List[float]]:
+		"""
+		Calculate completion time for all VMs of a list of individuals using the ENGINE.
+
+		:param population: List of individuals.
+
+		:returns loads: Per-VM completion time of every individual.
+		"""
+
+		self.check_deadline()
+		if self.ENGINE is Engine.NUMPY and len(population):
+			return self.calculate_population_vm_completion_time(population).tolist()
+
+		loads = []
+		for individual in population:
+			self.check_deadline()
+			loads.append(self.calculate_all_vm_completion_time(individual))
+
+		return loads
+
+
+	def calculate_fitness_all(self) -> array:
+		"""
+		Calculate fitness of all inidividuals.
+
+		:returns fitness: Array of fitness values.
+		"""
+
+		if not isinstance(self.POPULATION, Population):
+			self.POPULATION = Population.from_individuals(self.POPULATION, self.N_VMS)
+
+		if self.INCREMENTAL_FITNESS:
+			if len(self.LOADS) != len(self.POPULATION):
+				self.LOADS = self.calculate_loads_population(self.POPULATION)
+			fitness = [1 / max(loads) for loads in self.LOADS]
+		elif self._clean_population is self.POPULATION:
+			# Only individuals marked dirty are evaluated, the rest carry their fitness from next_generation
+			fitness = list(self.FITNESS)
+			dirty = [i for i, clean in enumerate(self.CLEAN) if not clean]
+			for i, value in zip(dirty, self.calculate_fitness_cached([self.POPULATION[i] for i in dirty])):
+				fitness[i] = value
+			self.FITNESS_CACHE_HITS = self.FITNESS_CACHE_HITS + len(fitness) - len(dirty)
+		else:
+			fitness = self.calculate_fitness_cached(self.POPULATION)
+
+		# Sort population based on fitness by permutation, fitness and loads follow the same ranking
+		ranking = self.POPULATION.sort(fitness)
+		self.FITNESS = array("d", [fitness[i] for i in ranking])
+		self.CLEAN = [True] * len(self.FITNESS)
+		self._clean_population = self.POPULATION
+		if self.INCREMENTAL_FITNESS:
+			self.LOADS = [self.LOADS[i] for i in ranking]
+			self.resync_loads(max(1, int(self.ELITISM_RATE * self.POPULATION_SIZE)))
+
+		return self.FITNESS
+
+
+	def resync_loads(self, n: int) -> int:
+		"""
+		Recompute the carried loads of the n fittest individuals from scratch and re-rank the population.
+		Loads updated gene by gene drift in the last bits over generations, so the elites and the best individual
+		are ranked, kept and reported on exact values. Repeats until the n fittest are all exact.
+
+		:param n: Number of fittest individuals to resync.
+
+		:returns resynced: Number of individuals whose fitness changed.
+		"""
+
+		resynced = 0
+		changed = True
+		while changed:
+			changed = False
+			# One batched pass over the n fittest with Engine.NUMPY
+			for i, loads in enumerate(self.calculate_loads_population([self.POPULATION[i] for i in range(min(n, len(self.LOADS)))])):
+				self.LOADS[i] = loads
+				if 1 / max(loads) != self.FITNESS[i]:
+					self.FITNESS[i] = 1 / max(loads)
+					changed = True
+					resynced = resynced + 1
+			if changed:
+				ranking = self.POPULATION.sort(self.FITNESS)
+				self.FITNESS = array("d", [self.FITNESS[i] for i in ranking])
+				self.LOADS = [self.LOADS[i] for i in ranking]
+
+		return resynced
+
+
+	def get_fitness_max(self) -> Tuple[float, List[int]]:
+		"""
+		Get the individual from population with maximum fitness.
+		
+		:returns (max_fitness, individual): Max fitness and the individual.
+		"""
+
+		max_f = max(self.FITNESS)
+		max_p = list(self.POPULATION[self.FITNESS.index(max_f)])
+
+		return max_f, max_p
+
+
+	def elitism(self) -> List[int]:
+		"""
+		Perform Elitism based on ELITISM RATE.
+		The fittest from the population will automatically preserved for the next generation.
+
+		:returns elitism: List of individuals index by elitsm.
+		"""
+
+		if self.ELITISM_RATE:
+			self.ELITISM = list(range(int(self.ELITISM_RATE * self.POPULATION_SIZE)))
+
+		return self.ELITISM
+
+
+	def selection(self) -> List[int]:
+		"""
+		Perform Tournament selection based on TOURNAMENT SIZE.
+
+		:returns selection: List of selected individuals by index
+		"""
+
+		if self.BATCHED_OPERATORS:
+			return self.selection_batched()
+
+		range_tournament = range(0, self.POPULATION_SIZE)
+		self.SELECTION = []
+ 
+		for _ in range(0, self.POPULATION_SIZE, 2):
+
+			winner_a = None
+			winner_b = None
+
+			# While loop so same individual is not winner of both tournaments.
+			while winner_a == winner_b:
+				tournament_a = self._random.sample(range_tournament, self.TOURNAMENT_SIZE)
+				tournament_b = self._random.sample(range_tournament, self.TOURNAMENT_SIZE)
+				
+				fitness_a = [self.FITNESS[x] for x in tournament_a]
+				fitness_b = [self.FITNESS[x] for x in tournament_b]
+				
+				max_a = max(fitness_a)
+				max_b = max(fitness_b)
+
+				winner_a = tournament_a[fitness_a.index(max_a)]
+				winner_b = tournament_b[fitness_b.index(max_b)]
+
+			self.SELECTION.extend([winner_a, winner_b])
+
+		return self.SELECTION
+
+
+	def crossover(self) -> List[List[int]]:
+		"""
+		Perform crossover and store the children.
+		The crossover operation depends on CROSSOVER enum value.
+
+		:returns children: List of children.
+		"""
+
+		if self.BATCHED_OPERATORS:
+			return self.crossover_batched()
+		
+		self.CHILDREN = []
+		self.CHILDREN_LOADS = []
+		# Uniform children mostly keep the genes of one parent, derive their loads from that parent
+		keep = self.CROSSOVER is not Crossover.UNIFORM or self.CROSSOVER_RATE >= 0.5
+		for i in range(0, len(self.SELECTION), 2):
+			self.check_deadline()
+			p1 = self.POPULATION[self.SELECTION[i]]
+			p2 = self.POPULATION[self.SELECTION[i+1]]
+			crossed = [] if self.INCREMENTAL_FITNESS else None
+			o1, o2 = self.produce_offspring(p1, p2, crossed)
+			self.CHILDREN.extend([o1, o2])
+			if self.INCREMENTAL_FITNESS:
+				l1 = self.LOADS[self.SELECTION[i]]
+				l2 = self.LOADS[self.SELECTION[i+1]]
+				if keep:
+					self.CHILDREN_LOADS.extend([self.derive_loads(p1, l1, o1, crossed), self.derive_loads(p2, l2, o2, crossed)])
+				else:
+					self.CHILDREN_LOADS.extend([self.derive_loads(p2, l2, o1, crossed), self.derive_loads(p1, l1, o2, crossed)])
+
+		return self.CHILDREN
+
+	
+	def mutation(self) -> List[List[int]]:
+		"""
+		Perform mutation on the children given MUTATION RATE.A
+
+		:returns children: List of children after mutation.
+		"""
+
+		if self.BATCHED_OPERATORS:
+			return self.mutation_batched()
+
+		self.MUTATED_GENES = [[] for _ in self.CHILDREN]
+		for i, child in enumerate(self.CHILDREN):
+			self.check_deadline()
+			if self.INCREMENTAL_FITNESS:
+				self.CHILDREN[i] = self.mutate(child, self.CHILDREN_LOADS[i], self.MUTATED_GENES[i])
+			else:
+				self.CHILDREN[i] = self.mutate(child, positions=self.MUTATED_GENES[i])
+
+
+	def local_search(self) -> int:
+		"""
+		Improve the elites and/or the children with improve(), sharing LOCAL_SEARCH_BUDGET scored candidates,
+		elites in rank order first.
+
+		:returns scored: Number of candidates scored.
+		"""
+
+		budget = self.LOCAL_SEARCH_BUDGET
+
+		if self.LOCAL_SEARCH_ELITES:
+			budget = budget - self.improve_elites(budget)
+
+		if self.LOCAL_SEARCH_CHILDREN:
+			for i in range(len(self.CHILDREN)):
+				if budget <= 0:
+					break
+				self.check_deadline()
+				child = self.CHILDREN[i] if isinstance(self.CHILDREN, list) else self.CHILDREN[i].tolist()
+				# Batched children carry no loads, next_generation_batched evaluates them after the search
+				loads = self.CHILDREN_LOADS[i] if self.INCREMENTAL_FITNESS and not self.BATCHED_OPERATORS else None
+				scored, moves = self.improve(child, loads, budget)
+				budget = budget - scored
+				if moves and not isinstance(self.CHILDREN, list):
+					self.CHILDREN[i] = child
+
+		return self.LOCAL_SEARCH_BUDGET - budget
+
+
+	def improve_elites(self, budget: int) -> int:
+		"""
+		Improve the individuals of ELITISM in rank order with improve(), updating POPULATION, FITNESS and LOADS in place.
+		Improved elites only get fitter, the ranking is left to the caller.
+
+		:param budget: Maximum number of candidates to score.
+
+		:returns scored: Number of candidates scored.
+		"""
+
+		scored = 0
+		for x in self.ELITISM:
+			if scored >= budget:
+				break
+			self.check_deadline()
+			individual = list(self.POPULATION[x])
+			loads = list(self.LOADS[x]) if self.INCREMENTAL_FITNESS else None
+			n_scored, moves = self.improve(individual, loads, budget - scored)
+			scored = scored + n_scored
+			if moves:
+				self.POPULATION[x] = individual
+				if self.INCREMENTAL_FITNESS:
+					self.LOADS[x] = loads
+				self.FITNESS[x] = 1 / max(loads) if self.INCREMENTAL_FITNESS else self.calculate_fitness_cached([individual])[0]
+
+		return scored
+
+
+	def next_generation(self) -> Population:
+		"""
+		Select the next generation based on elitism and parent-child fitness.
+		For next generations, the best two from the parent-child based on fitness will be saved.
+
+		:returns population: Population of individuals for the next generation.
+		"""
+
+		if self.BATCHED_OPERATORS:
+			return self.next_generation_batched()
+
+		children = self.CHILDREN
+		if self.ENGINE is Engine.NUMPY and len(children):
+			# All children are converted once, evaluated in one pass over the matrix and the survivors copied into the next generation as rows
+			children = Population.from_array(children, self.N_VMS)
+
+		new_generation = [self.POPULATION[x] for x in self.ELITISM]
+		new_fitness = [self.FITNESS[x] for x in self.ELITISM]
+		if self.INCREMENTAL_FITNESS:
+			new_loads = [self.LOADS[x] for x in self.ELITISM]
+			children_fitness = [1 / max(loads) for loads in self.CHILDREN_LOADS]
+		elif self.BOUNDED_FITNESS:
+			# A child worse than both parents of its pair never survives, its exact fitness is not needed.
+			# The margin keeps rounding from rejecting a child that ties the worse parent
+			makespans = []
+			for i in range(0, len(self.SELECTION), 2):
+				makespan = (1 + 1e-9) / min(self.FITNESS[self.SELECTION[i]], self.FITNESS[self.SELECTION[i+1]])
+				makespans.extend([makespan, makespan])
+			children_fitness = self.calculate_fitness_cached(children, makespans)
+		else:
+			children_fitness = self.calculate_fitness_cached(children)
+
+		for i in range(0, len(self.SELECTION), 2):
+
+			p1, p2, o1, o2 = self.POPULATION[self.SELECTION[i]], self.POPULATION[self.SELECTION[i+1]], children[i], children[i+1]
+			fp1, fp2, fo1, fo2 = self.FITNESS[self.SELECTION[i]], self.FITNESS[self.SELECTION[i+1]], children_fitness[i], children_fitness[i+1]
+
+			ind = [p1, p2, o1, o2]
+			fitness = [fp1, fp2, fo1, fo2]
+			best = sorted(fitness, reverse=True)[:2]
+			best_a = fitness.index(best[0])
+			best_b = fitness.index(best[1])
+
+			new_generation.extend([ind[best_a], ind[best_b]])
+			new_fitness.extend([fitness[best_a], fitness[best_b]])
+			if self.INCREMENTAL_FITNESS:
+				loads = [self.LOADS[self.SELECTION[i]], self.LOADS[self.SELECTION[i+1]], self.CHILDREN_LOADS[i], self.CHILDREN_LOADS[i+1]]
+				new_loads.extend([loads[best_a], loads[best_b]])
+			
+		self.POPULATION = Population.from_individuals(new_generation, self.N_VMS, self.POPULATION.length)
+		# Survivors carry their fitness into the next calculate_fitness_all
+		self.FITNESS = array("d", new_fitness)
+		self.CLEAN = [True] * len(new_fitness)
+		self._clean_population = self.POPULATION
+		if self.INCREMENTAL_FITNESS:
+			self.LOADS = new_loads
+
+		return self.POPULATION
+
+
+	def get_np_random(self) -> "np.random.Generator":
+		"""
+		Get the numpy random generator for the batched operators.
+		It is seeded from the instance's random stream on first use, so seeding keeps runs reproducible.
+
+		:returns rng: Numpy random generator.
+		"""
+
+		if np is None:
+			raise ImportError("BATCHED_OPERATORS requires numpy to be installed.")
+
+		if self._np_random is None:
+			self._np_random = np.random.default_rng(self._random.getrandbits(64))
+
+		return self._np_random
+
+
+	def selection_batched(self) -> List[int]:
+		"""
+		Perform Tournament selection for the whole population at once.
+		POPULATION is sorted by fitness, so the winner of a tournament is simply its smallest index.
+
+		:returns selection: List of selected individuals by index
+		"""
+
+		n_pairs = len(range(0, self.POPULATION_SIZE, 2))
+		winner_a, winner_b = operators.select_pairs(self.get_np_random(), 1, n_pairs, self.POPULATION_SIZE, self.TOURNAMENT_SIZE)
+		self.SELECTION = np.stack([winner_a[0], winner_b[0]], axis=1).ravel().tolist()
+
+		return self.SELECTION
+
+
+	def crossover_batched(self) -> "np.ndarray":
+		"""
+		Perform crossover for all selected pairs at once using one random mask for the whole generation.
+		The crossover operation depends on CROSSOVER enum value.
+
+		:returns children: Matrix of children, one row per child.
+		"""
+
+		matrix = self.POPULATION.as_array()
+		selection = np.asarray(self.SELECTION, dtype=np.intp)
+		n_genes = np.asarray([matrix.shape[1]])
+		children = operators.crossover(self.get_np_random(), matrix[None, selection[0::2]], matrix[None, selection[1::2]], n_genes, self.CROSSOVER, self.CROSSOVER_RATE)
+		self.CHILDREN = children[0]
+
+		return self.CHILDREN
+
+
+	def mutation_batched(self) -> "np.ndarray":
+		"""
+		Perform mutation on all children at once given MUTATION RATE.
+		With SPARSE_MUTATION the number of mutations is drawn from a binomial distribution and only
+		that many distinct positions are sampled, instead of one random number per gene.
+
+		:returns children: Matrix of children after mutation.
+		"""
+
+		flat = operators.mutate(self.get_np_random(), self.CHILDREN[None], np.asarray([self.N_VMS]), self.MUTATION_RATE, self.SPARSE_MUTATION)
+		rows, cols = np.divmod(flat, self.CHILDREN.shape[1])
+		self.MUTATED_GENES = np.split(cols, np.searchsorted(rows, np.arange(1, self.CHILDREN.shape[0])))
+
+		return self.CHILDREN
+
+
+	def next_generation_batched(self) -> Population:
+		"""
+		Select the next generation from the children matrix, keeping the best two of every parent-child group.
+
+		:returns population: Population of individuals for the next generation.
+		"""
+
+		matrix = self.POPULATION.as_array()
+		selection = np.asarray(self.SELECTION, dtype=np.intp)
+		if self.INCREMENTAL_FITNESS:
+			# Children are evaluated once, their fitness is derived from their loads
+			children_loads = self.calculate_loads_population(self.CHILDREN)
+			children_fitness = np.asarray([1 / max(loads) for loads in children_loads], dtype=np.float64)
+		else:
+			children_fitness = np.asarray(self.calculate_fitness_cached(self.CHILDREN), dtype=np.float64)
+		fitness = np.concatenate([np.frombuffer(self.FITNESS, dtype=np.float64), children_fitness])
+
+		# Candidates of each pair are p1, p2, o1, o2, as rows of the population stacked on the children.
+		survivors = operators.select_survivors(selection[None, 0::2], selection[None, 1::2], fitness[None], self.ELITISM)[0]
+
+		if self.INCREMENTAL_FITNESS:
+			loads = list(self.LOADS) + children_loads
+			self.LOADS = [loads[i] for i in survivors]
+
+		self.POPULATION = Population.from_array(np.concatenate([matrix, self.CHILDREN])[survivors], self.N_VMS)
+		self.FITNESS = array("d", fitness[survivors].tolist())
+		self.CLEAN = [True] * len(self.FITNESS)
+		self._clean_population = self.POPULATION
+
+		return self.POPULATION
+
+
+	def tournament(self, size: int) -> int:
+		"""
+		Pick TOURNAMENT_SIZE random ranks of the sorted population and return the fittest, which is the lowest rank.
+
+		:param size: Number of ranks to pick from.
+
+		:returns rank: Ranked position of the winner.
+		"""
+
+		return min(self._random.sample(range(size), self.TOURNAMENT_SIZE))
+
+
+	def steady_state_step(self, budget: int = 0) -> int:
+		"""
+		Produce STEADY_STATE_OFFSPRING children from tournament winners with produce_offspring and mutate,
+		improve them with LOCAL_SEARCH_CHILDREN, evaluate only the children and insert every child that beats
+		the least fit individual in its place.
+		Children are evaluated through the fitness memo and BOUNDED_FITNESS like next_generation does,
+		or from their loads with INCREMENTAL_FITNESS.
+		The population stays ranked: the insertion point is found by binary search in O(log P) compares,
+		the child is written over the evicted row and the rank order, FITNESS and LOADS shift by one entry,
+		an O(P) move of references that is small next to evaluating the child.
+		Only the least fit individual is ever evicted, so every rank above it, the elites included, is kept.
+		POPULATION must have been fully evaluated by calculate_fitness_all, CLEAN stays all True.
+
+		:param budget: Maximum number of local search candidates to score on the children.
+
+		:returns inserted: Number of children inserted.
+		"""
+
+		population, fitness = self.POPULATION, self.FITNESS
+		size = len(population)
+		keep = self.CROSSOVER is not Crossover.UNIFORM or self.CROSSOVER_RATE >= 0.5
+
+		children = []
+		children_loads = []
+		while len(children) < self.STEADY_STATE_OFFSPRING:
+			a = b = self.tournament(size)
+			while a == b and size > 1:
+				b = self.tournament(size)
+
+			p1, p2 = population[a], population[b]
+			crossed = [] if self.INCREMENTAL_FITNESS else None
+			o1, o2 = self.produce_offspring(p1, p2, crossed)
+			if self.INCREMENTAL_FITNESS:
+				if keep:
+					l1, l2 = self.derive_loads(p1, self.LOADS[a], o1, crossed), self.derive_loads(p2, self.LOADS[b], o2, crossed)
+				else:
+					l1, l2 = self.derive_loads(p2, self.LOADS[b], o1, crossed), self.derive_loads(p1, self.LOADS[a], o2, crossed)
+				children_loads.extend([l1, l2])
+			else:
+				l1 = l2 = None
+			self.mutate(o1, l1)
+			self.mutate(o2, l2)
+			children.extend([o1, o2])
+
+		children = children[:self.STEADY_STATE_OFFSPRING]
+		if self.LOCAL_SEARCH_CHILDREN:
+			for i, child in enumerate(children):
+				if budget <= 0:
+					break
+				self.check_deadline()
+				scored, _ = self.improve(child, children_loads[i] if self.INCREMENTAL_FITNESS else None, budget)
+				budget = budget - scored
+		if self.INCREMENTAL_FITNESS:
+			children_fitness = [1 / max(loads) for loads in children_loads]
+		elif self.BOUNDED_FITNESS:
+			# A child worse than the least fit individual is never inserted
+			makespan = (1 + 1e-9) / fitness[-1]
+			children_fitness = self.calculate_fitness_cached(children, [makespan] * len(children))
+		else:
+			children_fitness = self.calculate_fitness_cached(children)
+
+		inserted = 0
+		for i, (child, value) in enumerate(zip(children, children_fitness)):
+			if value <= fitness[-1]:
+				continue
+			if self.INCREMENTAL_FITNESS and value > fitness[0]:
+				# The new best is ranked and reported on exact loads, see resync_loads
+				children_loads[i] = self.calculate_all_vm_completion_time(child)
+				value = 1 / max(children_loads[i])
+
+			# First rank with a lower fitness, equally fit individuals keep their ranks ahead of the child
+			lo, hi = 0, size - 1
+			while lo < hi:
+				mid = (lo + hi) // 2
+				if fitness[mid] >= value:
+					lo = mid + 1
+				else:
+					hi = mid
+
+			population[size - 1] = child
+			population.order.insert(lo, population.order.pop())
+			fitness.pop()
+			fitness.insert(lo, value)
+			if self.INCREMENTAL_FITNESS:
+				self.LOADS.pop()
+				self.LOADS.insert(lo, children_loads[i])
+			inserted = inserted + 1
+
+		return inserted
+
+
+	def step(self) -> float:
+		"""
+		Perform the genetic operations of one generation and evaluate the new population.
+		With STEADY_STATE one generation is as many steady-state insertions as it takes to evaluate POPULATION_SIZE children,
+		so N_GENERATIONS and the stopping conditions keep their meaning. Once per generation the elites, the top
+		ELITISM_RATE of the population, are improved with LOCAL_SEARCH_ELITES and re-ranked, the children of the
+		insertions share the rest of LOCAL_SEARCH_BUDGET, and with INCREMENTAL_FITNESS the loads of the elites are resynced.
+		STEADY_STATE produces its few children per insertion without the batched operators, so it raises ValueError with
+		BATCHED_OPERATORS set.
+		POPULATION must have been evaluated by calculate_fitness_all before the first step.
+
+		:returns fitness: Best fitness of the new population.
+		"""
+
+		if self.STEADY_STATE:
+			if self.BATCHED_OPERATORS:
+				raise ValueError("STEADY_STATE does not support BATCHED_OPERATORS, set it to False.")
+			rounds = max(1, self.POPULATION_SIZE // self.STEADY_STATE_OFFSPRING)
+			n_elites = int(self.ELITISM_RATE * self.POPULATION_SIZE)
+
+			def steady_state():
+				if self._clean_population is not self.POPULATION or len(self.FITNESS) != len(self.POPULATION) or not all(self.CLEAN):
+					self.calculate_fitness_all()
+				budget = self.LOCAL_SEARCH_BUDGET
+				if budget and self.LOCAL_SEARCH_ELITES and n_elites:
+					self.ELITISM = list(range(n_elites))
+					budget = budget - self.improve_elites(budget)
+					ranking = self.POPULATION.sort(self.FITNESS)
+					self.FITNESS = array("d", [self.FITNESS[i] for i in ranking])
+					if self.INCREMENTAL_FITNESS:
+						self.LOADS = [self.LOADS[i] for i in ranking]
+				for _ in range(rounds):
+					self.steady_state_step(budget // rounds)
+				if self.INCREMENTAL_FITNESS:
+					self.resync_loads(max(1, n_elites))
+
+			if self.TELEMETRY is None:
+				steady_state()
+			else:
+				self.TELEMETRY.time_phase("steady_state", steady_state)
+				self.TELEMETRY.record(self)
+			return self.FITNESS[0]
+
+		if self.TELEMETRY is None:
+			self.elitism()
+			self.selection()
+			self.crossover()
+			self.mutation()
+			self.local_search()
+			self.next_generation()
+			self.calculate_fitness_all()
+		else:
+			for phase in (self.elitism, self.selection, self.crossover, self.mutation, self.local_search, self.next_generation, self.calculate_fitness_all):
+				self.TELEMETRY.time_phase(phase.__name__, phase)
+			self.TELEMETRY.record(self)
+
+		return self.FITNESS[0]
+
+
+	def calculate_makespan_lower_bound(self) -> float:
+		"""
+		Calculate a lower bound on the makespan of any schedule of CLOUDLETS on VMS, see operators.makespan_lower_bound.
+
+		:returns makespan: Lower bound on the makespan.
+		"""
+
+		return operators.makespan_lower_bound(self.get_cloudlet_lengths(), self.get_vm_mips())
+
+
+	def has_converged(self) -> bool:
+		"""
+		Check the stopping condition on DELTA_FITNESS_TRACK.
+		If max and min of delta fitness for DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION generations are equal to or below DESIRED DELTA FITNESS, stop.
+		When DESIRED_DELTA_DIVERSITY is set, the diversity over those generations must also have plateaued within it.
+
+		:returns converged: bool.
+		"""
+
+		n = self.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION
+		track = self.DELTA_FITNESS_TRACK[-n:]
+
+		converged = len(self.DELTA_FITNESS_TRACK) >= n \
+			and min(track) <= self.DESIRED_DELTA_FITNESS \
+			and max(track) <= self.DESIRED_DELTA_FITNESS
+
+		if converged and self.DESIRED_DELTA_DIVERSITY is not None:
+			track = self.DIVERSITY_TRACK[-n:]
+			converged = len(self.DIVERSITY_TRACK) >= n and max(track) - min(track) <= self.DESIRED_DELTA_DIVERSITY
+
+		return converged
+
+
+	def calculate_diversity(self) -> float:
+		"""
+		Measure the diversity of the population as the mean pairwise Hamming distance between individuals,
+		relative to that of a uniformly random population.
+		The distance is computed from the VM counts of every gene, one pass over the genes instead of one per pair,
+		on DIVERSITY_GENES evenly spaced genes.
+
+		:returns diversity: 0 when all individuals are equal, about 1 for a random population.
+		"""
+
+		population = self.POPULATION
+		size, length = len(population), population.length
+		if size < 2 or not length or self.N_VMS < 2:
+			return 0.0
+
+		stride = max(1, length // self.DIVERSITY_GENES) if self.DIVERSITY_GENES else 1
+		positions = range(0, length, stride)
+
+		# Number of ordered pairs of individuals, self pairs included, that agree on a gene, summed over genes
+		if np is not None:
+			# Rank order does not matter, read the rows as stored
+			matrix = np.frombuffer(population.data, dtype=np.uint16 if population.typecode == "H" else np.uint32)
+			matrix = matrix[:size * length].reshape(size, length)[:, ::stride]
+			chunk = max(1, (1 << 20) // self.N_VMS)
+			agreements = 0
+			for start in range(0, matrix.shape[1], chunk):
+				block = matrix[:, start:start + chunk].astype(np.intp)
+				index = block + np.arange(block.shape[1], dtype=np.intp) * self.N_VMS
+				counts = np.bincount(index.ravel(), minlength=block.shape[1] * self.N_VMS).astype(np.float64)
+				agreements = agreements + float(counts @ counts)
+		else:
+			rows = list(population)
+			agreements = 0
+			for i in positions:
+				agreements = agreements + sum(c * c for c in Counter(row[i] for row in rows).values())
+
+		distance = 1 - (agreements - size * len(positions)) / (size * (size - 1) * len(positions))
+
+		return distance / (1 - 1 / self.N_VMS)
+
+
+	def adapt_rates(self, diversity: float):
+		"""
+		Raise MUTATION_RATE and CROSSOVER_RATE by ADAPTATION_FACTOR while the diversity is below TARGET_DIVERSITY,
+		to explore again once the population collapses, and lower them otherwise, to exploit while it is diverse.
+		The rates are kept within MUTATION_RATE_RANGE and CROSSOVER_RATE_RANGE.
+
+		:param diversity: Diversity of the current population, see calculate_diversity.
+		"""
+
+		factor = self.ADAPTATION_FACTOR if diversity < self.TARGET_DIVERSITY else 1 / self.ADAPTATION_FACTOR
+		low, high = self.MUTATION_RATE_RANGE
+		self.MUTATION_RATE = min(max(self.MUTATION_RATE * factor, low), high)
+		low, high = self.CROSSOVER_RATE_RANGE
+		self.CROSSOVER_RATE = min(max(self.CROSSOVER_RATE * factor, low), high)
+
+
+	def run(self, n_generations: int = None, time_budget: float = None, resume: bool = False) -> Tuple[float, List[int]]:
+		"""
+		Run the genetic algorithm until n_generations generations, convergence, a provably optimal schedule or the wall-clock deadline.
+		The deadline is a hard stop counted from the call, so building and evaluating the initial population count against it.
+		With a deadline the LPT schedule is computed first, within it, as a fallback better than a random population.
+		A generation is not started when the duration of the previous one says it would end past the deadline,
+		and the generation, operator and evaluation loops stop within DEADLINE_BLOCK genes of it passing,
+		abandoning the unfinished generation. Only the sort of LPT, about 0.3 s for 1M cloudlets, runs unchecked.
+		Nothing is computed after the deadline, the better of the LPT schedule
+		and the best schedule evaluated so far is returned, or (0.0, None) when the deadline passed before either.
+		Generates the population when there is none yet, otherwise continues from the current one.
+		FITNESS_TRACK, DELTA_FITNESS_TRACK, TIME_TRACK, DIVERSITY_TRACK and GENERATION describe the run afterwards.
+		With ADAPTIVE_RATES the operator rates are adapted to the diversity before every generation.
+		Every CHECKPOINT_INTERVAL generations the state is written to CHECKPOINT_PATH.
+
+		:param n_generations: Generation limit, defaults to N_GENERATIONS.
+		:param time_budget: Wall-clock budget in seconds, defaults to TIME_BUDGET, 0 means no limit.
+		:param resume: Continue a run restored by load_checkpoint, keeping its tracks, generation count and elapsed time.
+
+		:returns (max_fitness, individual): Best fitness and individual found during the run.
+		"""
+
+		start = time.perf_counter()
+		n_generations = self.N_GENERATIONS if n_generations is None else n_generations
+		time_budget = self.TIME_BUDGET if time_budget is None else time_budget
+
+		if resume:
+			generation = self.GENERATION
+			fitness = self.FITNESS_TRACK[-1] if self.FITNESS_TRACK else 0
+			start = start - (self.TIME_TRACK[-1] if self.TIME_TRACK else 0.0)
+		else:
+			self.FITNESS_TRACK = []
+			self.DELTA_FITNESS_TRACK = []
+			self.TIME_TRACK = []
+			self.DIVERSITY_TRACK = []
+			generation = 0
+			fitness = 0
+		step_time = 0.0
+		best = (0.0, None)
+		timed_out = False
+		track_diversity = self.ADAPTIVE_RATES or self.DESIRED_DELTA_DIVERSITY is not None
+		self._deadline = start + time_budget if time_budget else None
+
+		try:
+			if self._deadline is not None:
+				individual, vm_ct = self.lpt_results_ct()
+				best = 1 / max(vm_ct), individual
+
+			if not len(self.POPULATION):
+				self.generate_population()
+			if not resume or self._clean_population is not self.POPULATION:
+				self.calculate_fitness_all()
+
+			best = max(best, self.get_fitness_max(), key=lambda x: x[0])
+			# Relative margin for the rounding of the makespan and the bound
+			lower_bound = self.calculate_makespan_lower_bound() * (1 + 1e-9) if self.STOP_AT_LOWER_BOUND else 0.0
+
+			while generation < n_generations:
+
+				# Calculate fitness deltas and store them for historical data
+				old_fitness = fitness
+				fitness, individual = self.get_fitness_max()
+				self.FITNESS_TRACK.append(fitness)
+				self.DELTA_FITNESS_TRACK.append(fitness - old_fitness)
+				self.TIME_TRACK.append(time.perf_counter() - start)
+				if track_diversity:
+					self.DIVERSITY_TRACK.append(self.calculate_diversity())
+				if fitness > best[0]:
+					best = fitness, individual
+
+				if self.has_converged():
+					break
+
+				# The best schedule is optimal
+				if fitness and 1 / fitness <= lower_bound:
+					break
+
+				now = time.perf_counter()
+				if time_budget and now + step_time - start > time_budget:
+					break
+
+				if self.ADAPTIVE_RATES:
+					self.adapt_rates(self.DIVERSITY_TRACK[-1])
+				self.step()
+				step_time = time.perf_counter() - now
+				generation = generation + 1
+
+				if self.CHECKPOINT_PATH and self.CHECKPOINT_INTERVAL and generation % self.CHECKPOINT_INTERVAL == 0:
+					self.GENERATION = generation
+					self.save_checkpoint(self.CHECKPOINT_PATH)
+
+		except TimeoutError:
+			# The unfinished generation is abandoned, the population is left as the last finished one
+			timed_out = True
+
+		finally:
+			self._deadline = None
+
+		self.GENERATION = generation
+		if len(self.POPULATION) and self._clean_population is self.POPULATION and len(self.FITNESS) == len(self.POPULATION) and all(self.CLEAN):
+			fitness, individual = self.get_fitness_max()
+			if fitness > best[0]:
+				best = fitness, individual
+		else:
+			# The deadline passed before the population was evaluated
+			fitness = best[0]
+		self.FITNESS_TRACK.append(fitness)
+		self.TIME_TRACK.append(time.perf_counter() - start)
+		if track_diversity and len(self.POPULATION) and not timed_out:
+			self.DIVERSITY_TRACK.append(self.calculate_diversity())
+
+		return best
+
+
+	def generations_to_makespan(self, makespan: float) -> Tuple[int, float]:
+		"""
+		Find when the last run() first reached a makespan.
+
+		:param makespan: Target makespan.
+
+		:returns (generation, seconds): Generations evolved and seconds since the start of the run, None when it was not reached.
+		"""
+
+		for generation, (fitness, seconds) in enumerate(zip(self.FITNESS_TRACK, self.TIME_TRACK)):
+			if fitness and 1 / fitness <= makespan:
+				return generation, seconds
+
+		return None
+
+
+	def save_checkpoint(self, path: str):
+		"""
+		Write the full state between two generations to a binary checkpoint file.
+		Chromosomes, fitness, loads, cloudlets and VMs are written as raw buffers straight from memory,
+		configuration, tracks, counters and the states of both random generators as JSON metadata.
+		The operator lists of the last generation, runtime objects and the ETC tables are not saved.
+
+		:param path: Path of the checkpoint file.
+		"""
+
+		attributes = {}
+		for key, value in self.__dict__.items():
+			values = value if isinstance(value, list) else [value]
+			if key.isupper() and all(x is None or isinstance(x, (bool, int, float, str, Enum)) for x in values):
+				values = [{"enum": type(x).__name__, "name": x.name} if isinstance(x, Enum) else x for x in values]
+				attributes[key] = values if isinstance(value, list) else values[0]
+
+		state = {
+			"attributes": attributes,
+			"length": self.POPULATION.length,
+			"clean": self._clean_population is self.POPULATION,
+			"loads": len(self.LOADS),
+			"random": self._random.getstate(),
+			"np_random": self._np_random.bit_generator.state if self._np_random is not None else None,
+		}
+
+		population = self.POPULATION
+		if isinstance(self.CLOUDLETS, CloudletArray):
+			ids = self.CLOUDLETS.ids
+		else:
+			ids = [cl.get_id() for cl in self.CLOUDLETS]
+
+		write_checkpoint(path, state, {
+			"population": (population.typecode, memoryview(population.data)[:population.size * population.length]),
+			"order": ("q", array("q", population.order)),
+			"fitness": ("d", as_buffer(self.FITNESS, "d")),
+			"loads": ("d", array("d", (load for loads in self.LOADS for load in loads))),
+			"lengths": ("d", as_buffer(self.get_cloudlet_lengths(), "d")),
+			"ids": ("q", as_buffer(ids, "q")),
+			"mips": ("d", as_buffer(self.get_vm_mips(), "d")),
+			"memo_keys": ("B", b"".join(self._fitness_memo.keys())),
+			"memo_values": ("d", array("d", self._fitness_memo.values())),
+		})
+
+
+	def load_checkpoint(self, path: str):
+		"""
+		Restore the full state from a checkpoint file written by save_checkpoint, including the random generators.
+		Every section is copied out of the mapped file, which is closed again before returning, CLOUDLETS and VMS become columnar.
+		Continue the interrupted run with run(resume=True).
+
+		:param path: Path of the checkpoint file.
+		"""
+
+		enums = {cls.__name__: cls for cls in (Crossover, Seeding, Engine)}
+		with read_checkpoint(path) as (state, sections):
+			self.CLOUDLETS = CloudletArray(copy_buffer(sections["lengths"]), copy_buffer(sections["ids"]))
+			self.VMS = VmArray(copy_buffer(sections["mips"]))
+			for key, value in state["attributes"].items():
+				values = value if isinstance(value, list) else [value]
+				values = [enums[x["enum"]][x["name"]] if isinstance(x, dict) else x for x in values]
+				setattr(self, key, values if isinstance(value, list) else values[0])
+
+			self.POPULATION = Population.from_buffer(copy_buffer(sections["population"]), self.N_VMS, state["length"], sections["order"])
+			self.FITNESS = array("d", sections["fitness"])
+			loads = sections["loads"]
+			width = len(loads) // state["loads"] if state["loads"] else 0
+			self.LOADS = [loads[i * width:(i + 1) * width].tolist() for i in range(state["loads"])]
+
+			keys, values = sections["memo_keys"], sections["memo_values"]
+			width = len(keys) // len(values) if len(values) else 0
+			self._fitness_memo = OrderedDict((bytes(keys[i * width:(i + 1) * width]), value) for i, value in enumerate(values))
+		self._clean_population = self.POPULATION if state["clean"] else None
+
+		self.seed(self.SEED, self.SPAWN_KEY)
+		version, internal, gauss = state["random"]
+		self._random.setstate((version, tuple(internal), gauss))
+		if state["np_random"] is not None:
+			if np is None:
+				raise ImportError("The checkpoint uses BATCHED_OPERATORS which require numpy to be installed.")
+			self._np_random = np.random.default_rng()
+			self._np_random.bit_generator.state = state["np_random"]
+
+
+	def get_population_loads(self) -> List[List[float]]:
+		"""
+		Get a copy of the per-VM completion time of every individual, reusing LOADS when they are valid.
+
+		:returns loads: Per-VM completion time of every individual.
+		"""
+
+		if self.INCREMENTAL_FITNESS and len(self.LOADS) == len(self.POPULATION):
+			return [list(loads) for loads in self.LOADS]
+
+		return [list(loads) for loads in self.calculate_loads_population(self.POPULATION)]
+
+
+	def add_cloudlets(self, cloudlets: List[Cloudlet]) -> Population:
+		"""
+		Append arriving cloudlets and extend every chromosome with one gene per cloudlet.
+		Each new gene is seeded with the VM of minimum completion time given that individual's current loads.
+		The ETC table is extended rather than rebuilt.
+
+		:param cloudlets: List of arriving cloudlets or a CloudletArray.
+
+		:returns population: Population with extended chromosomes.
+		"""
+
+		if not cloudlets:
+			return self.POPULATION
+
+		loads = self.get_population_loads()
+		etc, etc_array = self.get_etc(), self._etc_array
+
+		mips = self.get_vm_mips()
+		rows = [[cl.get_length() / m for m in mips] for cl in cloudlets]
+		if isinstance(self.CLOUDLETS, CloudletArray):
+			self.CLOUDLETS = self.CLOUDLETS.concatenate(cloudlets)
+		else:
+			self.CLOUDLETS = list(self.CLOUDLETS) + list(cloudlets)
+		self.N_CLOUDLETS = len(self.CLOUDLETS)
+		self._etc = etc + array("d", [ct for row in rows for ct in row])
+		if etc_array is not None:
+			self._etc_array = np.vstack([etc_array, np.array(rows, dtype=np.float64)])
+
+		individuals = []
+		for individual, individual_loads in zip(self.POPULATION, loads):
+			genes = []
+			for row in rows:
+				_loads = [load + ct for load, ct in zip(individual_loads, row)]
+				vm_id = _loads.index(min(_loads))
+				individual_loads[vm_id] = _loads[vm_id]
+				genes.append(vm_id)
+			individuals.append(list(individual) + genes)
+
+		self.POPULATION = Population.from_individuals(individuals, self.N_VMS, self.N_CLOUDLETS)
+		self.LOADS = loads if self.INCREMENTAL_FITNESS else []
+
+		return self.POPULATION
+
+
+	def remove_cloudlets(self, ids: Iterable[int]) -> Population:
+		"""
+		Remove completed cloudlets by ID and drop their genes from every chromosome.
+		The ETC table is filtered rather than rebuilt.
+
+		:param ids: IDs of the completed cloudlets.
+
+		:returns population: Population with shortened chromosomes.
+		"""
+
+		ids = set(ids)
+		keep = [cl.get_id() not in ids for cl in self.CLOUDLETS]
+		if all(keep):
+			return self.POPULATION
+
+		etc, etc_array = self.get_etc(), self._etc_array
+
+		loads = []
+		if self.INCREMENTAL_FITNESS and len(self.LOADS) == len(self.POPULATION):
+			loads = self.get_population_loads()
+			removed = [i for i, k in enumerate(keep) if not k]
+			for individual, individual_loads in zip(self.POPULATION, loads):
+				for i in removed:
+					individual_loads[individual[i]] = individual_loads[individual[i]] - etc[i * self.N_VMS + individual[i]]
+
+		self.CLOUDLETS = list(compress(self.CLOUDLETS, keep))
+		self.N_CLOUDLETS = len(self.CLOUDLETS)
+		self._etc = array("d")
+		for i in compress(range(len(keep)), keep):
+			self._etc.extend(etc[i * self.N_VMS:(i + 1) * self.N_VMS])
+		if etc_array is not None:
+			self._etc_array = etc_array[np.array(keep, dtype=bool)]
+
+		self.POPULATION = Population.from_individuals((list(compress(individual, keep)) for individual in self.POPULATION), self.N_VMS, self.N_CLOUDLETS)
+		self.LOADS = loads
+
+		return self.POPULATION
+
+
+	def reschedule(self, arrivals: List[Cloudlet] = None, completions: Iterable[int] = None, n_generations: int = None, time_budget: float = None) -> Tuple[float, List[int]]:
+		"""
+		Apply cloudlet arrivals and completions to the current population and continue evolving it.
+		Evolution stops after n_generations or once time_budget seconds have passed, whichever comes first.
+		A cold start generates the population when there is none yet.
+
+		:param arrivals: List of arriving cloudlets.
+		:param completions: IDs of completed cloudlets.
+		:param n_generations: Generation budget, defaults to STREAM_GENERATIONS.
+		:param time_budget: Wall-clock budget in seconds, defaults to STREAM_TIME_BUDGET, 0 means no limit.
+
+		:returns (max_fitness, individual): Best fitness and individual for the current CLOUDLETS.
+		"""
+
+		start = time.perf_counter()
+		n_generations = self.STREAM_GENERATIONS if n_generations is None else n_generations
+		time_budget = self.STREAM_TIME_BUDGET if time_budget is None else time_budget
+
+		self.remove_cloudlets(completions or [])
+		self.add_cloudlets(arrivals or [])
+
+		if not self.CLOUDLETS:
+			return 0.0, []
+		if not len(self.POPULATION):
+			self.generate_population()
+
+		if time_budget:
+			time_budget = time_budget - (time.perf_counter() - start)
+			if time_budget <= 0:
+				n_generations, time_budget = 0, 0.0
+
+		return self.run(n_generations, time_budget)
+
+
+	def stream(self, batches: Iterable[Tuple[List[Cloudlet], List[int]]]) -> Iterator[Tuple[float, List[int]]]:
+		"""
+		Reschedule continuously from an iterator of (arrivals, completions) batches.
+		A queue.Queue can be consumed with iter(queue.get, None).
+
+		:param batches: Iterable of (list of arriving cloudlets, IDs of completed cloudlets).
+
+		:returns schedules: Iterator of (max_fitness, individual) after every batch.
+		"""
+
+		for arrivals, completions in batches:
+			yield self.reschedule(arrivals, completions)
+
+
+	def replace_worst(self, individuals: List[List[int]]) -> Population:
+		"""
+		Replace the least fit individuals of the sorted population with the given individuals.
+		Call calculate_fitness_all afterwards to evaluate and sort them.
+
+		:param individuals: List of individuals to insert.
+
+		:returns population: Population of individuals.
+		"""
+
+		keep = len(self.POPULATION) - len(individuals)
+		individuals = [list(x) for x in individuals]
+
+		if self.INCREMENTAL_FITNESS and len(self.LOADS) == len(self.POPULATION):
+			self.LOADS = list(self.LOADS[:keep]) + self.calculate_loads_population(individuals)
+		clean = self._clean_population is self.POPULATION
+		self.POPULATION = Population.from_individuals(self.POPULATION[:keep] + individuals, self.N_VMS)
+		if clean:
+			self.FITNESS = self.FITNESS[:keep] + array("d", [0.0] * len(individuals))
+			self.CLEAN = self.CLEAN[:keep] + [False] * len(individuals)
+			self._clean_population = self.POPULATION
+
+		return self.POPULATION
+
+
+	def generate_syntethic_like_workload(self):
+		"""
+		Generate synthehic workload.
+		Will overwrite N_CLOUDLETS and CLOUDLETS.
+		Best to call this right before generate_population().
+		"""
+
+		counting = [20, 60, 5, 10, 5]
+		amount = [(1, 250), (800, 1200), (1800, 2500), (7000, 10000), (30000, 45000)]
+		self.N_CLOUDLETS = sum(counting)
+		self.CLOUDLETS = []
+		_id = 0
+
+		for i, c in enumerate(counting):
+			for j in range(c):
+				self.CLOUDLETS.append(Cloudlet(_id, self._random.randint(*amount[i])))
+				_id = _id + 1
+
+	
+	def generate_google_like_workload(self):
+		"""
+		Generate google workload.
+		Will overwrite N_CLOUDLETS and CLOUDLETS.
+		Best to call this right before generate_population().
+		"""
+
+		counting = [20, 40, 30, 4, 6]
+		amount = [(15000, 55000), (59000, 90000), (101000, 135000), (150000, 337500), (525000, 900000)]
+		self.N_CLOUDLETS = sum(counting)
+		self.CLOUDLETS = []
+		_id = 0
+
+		for i, c in enumerate(counting):
+			for j in range(c):
+				self.CLOUDLETS.append(Cloudlet(_id, self._random.randint(*amount[i])))
+				_id = _id + 1
+
+
+	def load_trace_workload(self, path: str, **options) -> CloudletArray:
+		"""
+		Load a trace workload, reading the cloudlet lengths into a columnar CloudletArray.
+		Will overwrite N_CLOUDLETS and CLOUDLETS.
+		Best to call this right before generate_population().
+
+		:param path: Path of a CSV trace, or a raw binary trace that is memory-mapped.
+		:param options: Column, window and sampling options of workload.read_column.
+
+		:returns cloudlets: Columnar list of cloudlets.
+		"""
+
+		self.CLOUDLETS = CloudletArray(read_column(path, **options, rng=self._random))
+		self.N_CLOUDLETS = len(self.CLOUDLETS)
+
+		return self.CLOUDLETS
+
+
+	def load_trace_vms(self, path: str, **options) -> VmArray:
+		"""
+		Load VM capacities from a trace, reading the MIPS into a columnar VmArray.
+		Will overwrite N_VMS and VMS.
+		Best to call this right before generate_population().
+
+		:param path: Path of a CSV trace, or a raw binary trace that is memory-mapped.
+		:param options: Column, window and sampling options of workload.read_column.
+
+		:returns vms: Columnar list of VMs.
+		"""
+
+		self.VMS = VmArray(read_column(path, **options, rng=self._random))
+		self.N_VMS = len(self.VMS)
+
+		return self.VMS
+
+
+	def random_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using random selection algorithm, generate the schedule and its completion time.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		p1 = self.generate_individual()
+		vm_ct = self.calculate_all_vm_completion_time(p1)
+
+		return p1, vm_ct
+
+
+	def round_robin_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using round robin algorithm, generate the schedule and its completion time.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		p1 = []
+		_x = 0
+		for _ in range(self.N_CLOUDLETS):
+			p1.append(_x)
+			_x = (_x + 1) % self.N_VMS
+
+		vm_ct = self.calculate_all_vm_completion_time(p1)
+
+		return p1, vm_ct
+
+
+	def mct_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using minimum completion time algorithm, generate the schedule and its completion time.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		etc = self.get_etc()
+		p1 = []
+		vm_share = [0] * self.N_VMS
+
+		for base in range(0, len(etc), self.N_VMS):
+			if not base % (DEADLINE_BLOCK * self.N_VMS):
+				self.check_deadline()
+			mn = min(vm_share)
+			vm_id = vm_share.index(mn)
+			vm_share[vm_id] = vm_share[vm_id] + etc[base + vm_id]
+
+			p1.append(vm_id)
+
+		vm_ct = self.calculate_all_vm_completion_time(p1)
+
+		return p1, vm_ct
+
+
+
+	def ordered_mct_results_ct(self, order: Iterable[int]) -> Tuple[List[int], List[float]]:
+		"""
+		Schedule the cloudlets in the given order, each on the VM where it completes first given the cloudlets already scheduled.
+
+		:param order: Cloudlet indices in scheduling order.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		p1 = [0] * self.N_CLOUDLETS
+
+		if self.ENGINE is Engine.NUMPY:
+			lengths = np.asarray(self.get_cloudlet_lengths(), dtype=np.float64)
+			mips = np.asarray(self.get_vm_mips(), dtype=np.float64)
+			vm_share = np.zeros(self.N_VMS)
+
+			for position, cloudlet_id in enumerate(order):
+				if not position % DEADLINE_BLOCK:
+					self.check_deadline()
+				ct = vm_share + lengths[cloudlet_id] / mips
+				vm_id = int(ct.argmin())
+				vm_share[vm_id] = ct[vm_id]
+				p1[cloudlet_id] = vm_id
+
+		else:
+			etc = self.get_etc()
+			vm_share = [0.0] * self.N_VMS
+
+			for position, cloudlet_id in enumerate(order):
+				if not position % DEADLINE_BLOCK:
+					self.check_deadline()
+				ct = [share + t for share, t in zip(vm_share, etc[cloudlet_id * self.N_VMS:(cloudlet_id + 1) * self.N_VMS])]
+				vm_id = ct.index(min(ct))
+				vm_share[vm_id] = ct[vm_id]
+				p1[cloudlet_id] = vm_id
+
+		vm_ct = self.calculate_all_vm_completion_time(p1)
+
+		return p1, vm_ct
+
+
+	def lpt_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using longest processing time first algorithm, generate the schedule and its completion time.
+		Cloudlets are scheduled by descending length, each on the VM with the least load so far, kept in a heap.
+		Completion times are computed from the lengths and MIPS without building the ETC table,
+		so it costs O(n log n) and serves as the fallback of run() under a time budget.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		lengths = self.get_cloudlet_lengths()
+		mips = self.get_vm_mips()
+		p1 = [0] * len(lengths)
+		vm_share = [(0.0, vm_id) for vm_id in range(self.N_VMS)]
+
+		for position, cloudlet_id in enumerate(sorted(range(len(lengths)), key=lengths.__getitem__, reverse=True)):
+			if not position % DEADLINE_BLOCK:
+				self.check_deadline()
+			share, vm_id = vm_share[0]
+			heapq.heapreplace(vm_share, (share + lengths[cloudlet_id] / mips[vm_id], vm_id))
+			p1[cloudlet_id] = vm_id
+
+		# Summed in cloudlet order with the same quotients as the ETC table, as calculate_all_vm_completion_time does
+		vm_ct = [0.0] * self.N_VMS
+		for start in range(0, len(p1), DEADLINE_BLOCK):
+			self.check_deadline()
+			for length, vm_id in zip(lengths[start:start + DEADLINE_BLOCK], p1[start:start + DEADLINE_BLOCK]):
+				vm_ct[vm_id] = vm_ct[vm_id] + length / mips[vm_id]
+
+		return p1, vm_ct
+
+
+	def minmin_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using min-min completion time algorithm, generate the schedule and its completion time.
+		Min-min repeatedly schedules the unscheduled cloudlet with the smallest minimum completion time.
+		As ETC[i][j] = length_i / mips_j, the completion time on every VM grows with the cloudlet length,
+		so that cloudlet is always the shortest one and min-min is MCT over the cloudlets by ascending length,
+		O(n log n + n * m) instead of O(n^2 * m).
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		lengths = self.get_cloudlet_lengths()
+
+		return self.ordered_mct_results_ct(sorted(range(len(lengths)), key=lengths.__getitem__))
+
+
+	def maxmin_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using max-min completion time algorithm, generate the schedule and its completion time.
+		Max-min repeatedly schedules the unscheduled cloudlet with the largest minimum completion time,
+		which for the same reason as min-min is always the longest one.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		lengths = self.get_cloudlet_lengths()
+
+		return self.ordered_mct_results_ct(sorted(range(len(lengths)), key=lengths.__getitem__, reverse=True))
+
+
+	def sufferage_results_ct(self) -> Tuple[List[int], List[float]]:
+		"""
+		Using sufferage algorithm, generate the schedule and its completion time.
+		Sufferage repeatedly schedules the unscheduled cloudlet with the largest sufferage, the difference between its
+		second best and best completion time, on its best VM. Ties go to the lowest cloudlet ID, and between VMs to the lowest VM ID.
+		Completion times are computed as (length scheduled on the VM + cloudlet length) / MIPS and the sufferage as one
+		quotient of the same sums, so for integer lengths and MIPS equal completion times and sufferages compare equal
+		instead of differing in rounding, and the result matches scheduling with exact rational arithmetic.
+		Cloudlets of the same length have the same best and second best VM and sufferage, so one row is kept per distinct
+		length, holding them and the lowest unscheduled cloudlet ID. Scheduling a cloudlet only delays its VM, so only the
+		rows whose best or second best VM it is are updated, over the 64 (16 with Engine.PYTHON) VMs with the smallest
+		completion times at their last full scan. A row is scanned over all VMs again once its second best VM may be outside them.
+		This takes about 3 s for 20k cloudlets on 200 VMs and about 20 s for 100k cloudlets on 1k VMs with Engine.NUMPY,
+		and about a minute for 20k cloudlets on 200 VMs with Engine.PYTHON.
+
+		:returns p1, vm_ct: Individual and its completion time.
+		"""
+
+		lengths = self.get_cloudlet_lengths()
+		mips = self.get_vm_mips()
+		n = len(lengths)
+		inf = float("inf")
+		p1 = [0] * n
+		if not n or self.N_VMS == 1:
+			# A single VM gives every cloudlet an infinite sufferage
+			return p1, self.calculate_all_vm_completion_time(p1)
+
+		# Distinct lengths, and the unscheduled cloudlets of every one with the lowest ID last
+		values = sorted(set(lengths))
+		row = {length: r for r, length in enumerate(values)}
+		waiting = [[] for _ in values]
+		for cloudlet_id in range(n - 1, -1, -1):
+			waiting[row[lengths[cloudlet_id]]].append(cloudlet_id)
+		n_rows = len(values)
+
+		if self.ENGINE is Engine.NUMPY:
+			# Number of candidate VMs of every row
+			width = min(64, self.N_VMS)
+			np_values = np.asarray(values, dtype=np.float64)
+			np_mips = np.asarray(mips, dtype=np.float64)
+			# Total length scheduled on every VM
+			vm_length = np.zeros(self.N_VMS)
+			# Candidate VMs of every row sorted by ID, their MIPS, and the smallest completion time left out of them
+			candidates = np.empty((n_rows, width), dtype=np.intp)
+			candidate_mips = np.empty((n_rows, width))
+			limit = np.full(n_rows, np.inf)
+			best = np.empty(n_rows, dtype=np.intp)
+			second = np.empty(n_rows, dtype=np.intp)
+			sufferages = np.empty(n_rows)
+			first_id = np.array([cloudlets[-1] for cloudlets in waiting], dtype=np.int64)
+
+			def settle(rows: "np.ndarray", best_vm: "np.ndarray", second_vm: "np.ndarray"):
+				best[rows] = best_vm
+				second[rows] = second_vm
+				mips_best, mips_second = np_mips[best_vm], np_mips[second_vm]
+				length = np_values[rows]
+				sufferages[rows] = ((vm_length[second_vm] + length) * mips_best - (vm_length[best_vm] + length) * mips_second) / (mips_best * mips_second)
+
+			def scan(rows: "np.ndarray"):
+				ct = (vm_length + np_values[rows, None]) / np_mips
+				index = np.arange(len(rows))
+				if width < self.N_VMS:
+					part = np.argpartition(ct, width, axis=1)
+					candidates[rows] = np.sort(part[:, :width], axis=1)
+					candidate_mips[rows] = np_mips[candidates[rows]]
+					limit[rows] = ct[index, part[:, width]]
+				else:
+					candidates[rows] = np.arange(self.N_VMS)
+					candidate_mips[rows] = np_mips
+				first = ct.argmin(axis=1)
+				ct[index, first] = np.inf
+				settle(rows, first, ct.argmin(axis=1))
+
+			def update(rows: "np.ndarray"):
+				vms = candidates[rows]
+				ct = (vm_length[vms] + np_values[rows, None]) / candidate_mips[rows]
+				index = np.arange(len(rows))
+				first = ct.argmin(axis=1)
+				ct[index, first] = np.inf
+				following = ct.argmin(axis=1)
+				# A VM left out of the candidates may have taken the second place
+				stale = ct[index, following] >= limit[rows]
+				if stale.any():
+					scan(rows[stale])
+					keep = ~stale
+					rows, vms, first, following = rows[keep], vms[keep], first[keep], following[keep]
+					index = index[:len(rows)]
+				settle(rows, vms[index, first], vms[index, following])
+
+			def pick() -> int:
+				tied = np.flatnonzero(sufferages == sufferages.max())
+				return int(tied[first_id[tied].argmin()])
+
+			def schedule(r: int, vm_id: int):
+				vm_length[vm_id] = vm_length[vm_id] + np_values[r]
+				if waiting[r]:
+					first_id[r] = waiting[r][-1]
+				else:
+					sufferages[r] = -np.inf
+					best[r] = second[r] = -1
+				rows = np.flatnonzero((best == vm_id) | (second == vm_id))
+				if len(rows):
+					update(rows)
+
+			scan(np.arange(n_rows))
+
+		else:
+			width = min(16, self.N_VMS)
+			vm_length = [0.0] * self.N_VMS
+			candidates = [None] * n_rows
+			limit = [inf] * n_rows
+			best = [0] * n_rows
+			second = [0] * n_rows
+			# Rows whose best or second best VM it is, for every VM
+			involving = [set() for _ in range(self.N_VMS)]
+			# Heap of (-sufferage, cloudlet_id, row, version), entries of older versions are stale
+			heap = []
+			version = [0] * n_rows
+
+			def settle(r: int, best_vm: int, second_vm: int):
+				involving[best[r]].discard(r)
+				involving[second[r]].discard(r)
+				involving[best_vm].add(r)
+				involving[second_vm].add(r)
+				best[r], second[r] = best_vm, second_vm
+				length = values[r]
+				sufferage = ((vm_length[second_vm] + length) * mips[best_vm] - (vm_length[best_vm] + length) * mips[second_vm]) / (mips[best_vm] * mips[second_vm])
+				version[r] = version[r] + 1
+				heapq.heappush(heap, (-sufferage, waiting[r][-1], r, version[r]))
+
+			def scan(r: int):
+				length = values[r]
+				ct = [(total + length) / m for total, m in zip(vm_length, mips)]
+				if width < self.N_VMS:
+					nearest = heapq.nsmallest(width + 1, range(self.N_VMS), key=ct.__getitem__)
+					candidates[r] = sorted(nearest[:width])
+					limit[r] = ct[nearest[width]]
+				else:
+					candidates[r] = list(range(self.N_VMS))
+				first = ct.index(min(ct))
+				ct[first] = inf
+				settle(r, first, ct.index(min(ct)))
+
+			def update(r: int):
+				length = values[r]
+				vms = candidates[r]
+				ct = [(vm_length[vm_id] + length) / mips[vm_id] for vm_id in vms]
+				first = ct.index(min(ct))
+				ct[first] = inf
+				following = ct.index(min(ct))
+				# A VM left out of the candidates may have taken the second place
+				if ct[following] >= limit[r]:
+					scan(r)
+				else:
+					settle(r, vms[first], vms[following])
+
+			def pick() -> int:
+				while True:
+					_, _, r, _version = heapq.heappop(heap)
+					if version[r] == _version:
+						return r
+
+			def schedule(r: int, vm_id: int):
+				vm_length[vm_id] = vm_length[vm_id] + values[r]
+				rows = involving[vm_id] - {r}
+				if waiting[r]:
+					update(r)
+				else:
+					involving[best[r]].discard(r)
+					involving[second[r]].discard(r)
+					version[r] = version[r] + 1
+				for r in sorted(rows):
+					update(r)
+				# Drop the stale entries once they outnumber the rows
+				if len(heap) > 4 * n_rows:
+					heap[:] = [entry for entry in heap if version[entry[2]] == entry[3]]
+					heapq.heapify(heap)
+
+			for r in range(n_rows):
+				scan(r)
+
+		for _ in range(n):
+			r = pick()
+			vm_id = int(best[r])
+			p1[waiting[r].pop()] = vm_id
+			schedule(r, vm_id)
+
+		vm_ct = self.calculate_all_vm_completion_time(p1)
+
+		return p1, vm_ct
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+This module contains the class for running the genetic algorithm as an island model on separate processes.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Tuple, List
+from gcs import GeneticCloudScheduling
+from topology import Topology
+
+
+def _island(conn: Connection, gcs: GeneticCloudScheduling, seed: int, spawn_key: List[int]):
+	"""
+	Island process.
+	Evolves its own population and exchanges elites with the driver until told to stop.
+	Every command is (n_generations, migrants), None stops the island.
+	"""
+
+	gcs.seed(seed, spawn_key)
+	gcs.generate_population()
+	gcs.calculate_fitness_all()
+	fitness_track = [gcs.get_fitness_max()[0]]
+
+	while True:
+		command = conn.recv()
+		if command is None:
+			break
+
+		n_generations, migrants = command
+		if migrants:
+			gcs.replace_worst(migrants)
+			gcs.calculate_fitness_all()
+
+		for _ in range(n_generations):
+			gcs.step()
+			fitness_track.append(gcs.get_fitness_max()[0])
+
+		elites = [(gcs.FITNESS[x], list(gcs.POPULATION[x])) for x in gcs.elitism()]
+		max_f, max_p = gcs.get_fitness_max()
+		conn.send((fitness_track, elites, (max_f, list(max_p))))
+		fitness_track = []
+
+	gcs.close()
+	conn.close()
+
+
+class IslandModel():
+	"""
+	Run N_ISLANDS independent copies of a configured GeneticCloudScheduling, each on its own process and random stream.
+	Every MIGRATION_INTERVAL generations the elites of each island, as chosen by elitism(), migrate over the
+	TOPOLOGY and replace the least fit individuals of the receiving island.
+	"""
+
+
+	def __init__(self, gcs: GeneticCloudScheduling):
+		# Configured scheduler with CLOUDLETS and VMS, copied to every island
+		self.GCS: GeneticCloudScheduling = gcs
+		# Number of islands
+		self.N_ISLANDS: int = 2
+		# Number of generations between migrations
+		self.MIGRATION_INTERVAL: int = 10
+		# Migration topology
+		self.TOPOLOGY: Topology = Topology.RING
+		# Root seed of the islands, island i uses child stream i of SEED
+		self.SEED: int = 0
+		# Best fitness of every generation, one list per island
+		self.FITNESS_HISTORY: List[List[float]] = []
+		# Number of generations every island evolved in the last run()
+		self.GENERATION: int = 0
+		# Best fitness found on any island
+		self.BEST_FITNESS: float = 0.0
+		# Individual with the best fitness found on any island
+		self.BEST_INDIVIDUAL: List[int] = []
+
+
+	def migrate(self, elites: List[List[Tuple[float, List[int]]]]) -> List[List[List[int]]]:
+		"""
+		Route the elites of every island to their receivers according to TOPOLOGY.
+		For a fully connected topology each island receives the best of all other islands' elites.
+
+		:param elites: List of (fitness, individual) elites for every island.
+
+		:returns migrants: List of individuals to insert for every island.
+		"""
+
+		if self.TOPOLOGY is Topology.RING:
+			return [[x for _, x in elites[i - 1]] for i in range(self.N_ISLANDS)]
+
+		migrants = []
+		for i in range(self.N_ISLANDS):
+			pool = [elite for j, island_elites in enumerate(elites) if j != i for elite in island_elites]
+			pool = sorted(pool, key=lambda x : x[0], reverse=True)[:len(elites[i])]
+			migrants.append([x for _, x in pool])
+
+		return migrants
+
+
+	def run(self) -> Tuple[float, List[int]]:
+		"""
+		Run all islands for GCS.N_GENERATIONS generations.
+
+		:returns (max_fitness, individual): Best fitness and individual over all islands.
+		"""
+
+		conns = []
+		processes = []
+		for i in range(self.N_ISLANDS):
+			parent_conn, child_conn = Pipe()
+			process = Process(target=_island, args=(child_conn, self.GCS, self.SEED, self.GCS.SPAWN_KEY + [i]))
+			process.start()
+			conns.append(parent_conn)
+			processes.append(process)
+
+		self.FITNESS_HISTORY = [[] for _ in range(self.N_ISLANDS)]
+		self.BEST_FITNESS = 0.0
+		self.BEST_INDIVIDUAL = []
+		self.GENERATION = 0
+		migrants = [[] for _ in range(self.N_ISLANDS)]
+
+		try:
+			while self.GENERATION < self.GCS.N_GENERATIONS:
+				n_generations = min(self.MIGRATION_INTERVAL, self.GCS.N_GENERATIONS - self.GENERATION)
+				for conn, island_migrants in zip(conns, migrants):
+					conn.send((n_generations, island_migrants))
+
+				elites = []
+				for i, conn in enumerate(conns):
+					fitness_track, island_elites, (max_f, max_p) = conn.recv()
+					self.FITNESS_HISTORY[i].extend(fitness_track)
+					elites.append(island_elites)
+					if max_f > self.BEST_FITNESS:
+						self.BEST_FITNESS, self.BEST_INDIVIDUAL = max_f, max_p
+
+				migrants = self.migrate(elites)
+				self.GENERATION = self.GENERATION + n_generations
+		finally:
+			for conn in conns:
+				conn.send(None)
+			for process in processes:
+				process.join()
+
+		return self.BEST_FITNESS, self.BEST_INDIVIDUAL
+
+
+	def get_fitness_track(self) -> List[float]:
+		"""
+		Get the best fitness over all islands for every generation.
+
+		:returns fitness_track: List of fitness values.
+		"""
+
+		return [max(x) for x in zip(*self.FITNESS_HISTORY)]
@@ -1,265 +1,400 @@
-"""
-This module contains the code for running the genetic algorithm and comparison with other algorithms
-"""
-
-
-__author__ = "Ahmad Awan"
-__email__ = "i202004@nu.edu.pk"
-
-
-from gcs import GeneticCloudScheduling
-from crossover import Crossover
-from datatype import DataType
-
-
-if __name__ == '__main__':
-
-	gcs = GeneticCloudScheduling()
-	
-	# Set parameters
-	gcs.N_GENERATIONS = 1000
-	gcs.N_VMS = 20
-	gcs.POPULATION_SIZE = 100
-	gcs.CROSSOVER = Crossover.UNIFORM # Use UNIFORM or SINGLE_POINT
-	gcs.CROSSOVER_RATE = 0.10
-	gcs.MUTATION_RATE = 0.01
-	gcs.ELITISM_RATE = 0.02
-	gcs.DESIRED_DELTA_FITNESS = 0
-	gcs.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION = 7
-	data_type = DataType.GOOGLE # Use TESTING, GOOGLE or SYNTETHIC
-
-	# Change datatype between TESTING, GOOGLE and SYNTETHIC for different workload. 
-	# TESTING WORKLOAD is bad for simulation as workload is too small and too randomized.
-	# Better to use GOOGLE or SYNTETHIC workload which can be commented or uncommented out below.
-	
-	if data_type is DataType.TESTING:
-
-		print("USING TESTING WORKLOAD")
-		gcs.N_CLOUDLETS = 100
-		gcs.generate_cloudlets(400, 1000)
-
-	elif data_type is DataType.GOOGLE:
-
-		print("USING GOOGLE LIKE WORKLOAD")
-		gcs.generate_google_like_workload()
-
-	elif data_type is DataType.SYNTETHIC:
-
-		print("USING SYNTHETIC WORKLOAD")
-		gcs.generate_syntethic_like_workload()
-
-	# Generate population and VMs
-	gcs.generate_population()
-	gcs.generate_vms(250, 2000)
-
-	print(f"Starting Genetic algorithm for {gcs.N_GENERATIONS} generations optimizing for {gcs.N_VMS} VMs")
-
-	# Initialize Additional Data
-	fitness_track = []
-	delta_fitness_track = []
-	generation = 0
-	fitness = 0
-	old_fitness = 0
-
-	# Main loop
-	while generation < gcs.N_GENERATIONS:
-
-		gcs.calculate_fitness_all()
-
-		# Calculate fitness deltas and store them for historical data
-		old_fitness = fitness
-		fitness, fittest_individual = gcs.get_fitness_max()
-		delta_fitness = fitness - old_fitness
-		fitness_track.append(fitness)
-		delta_fitness_track.append(delta_fitness)
-
-		print(f"Generations:\t{generation + 1} / {gcs.N_GENERATIONS}\t| Δ {delta_fitness}\t| ΣΔ {sum(delta_fitness_track[-3:])}")
-
-		# If max and min of delta fitness for x generations is equal to or below DESIRED DELTA FITNESS for DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION generations, stop
-		if len(delta_fitness_track) >= gcs.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION \
-			and min(delta_fitness_track[-gcs.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION:]) <= gcs.DESIRED_DELTA_FITNESS \
-			and max(delta_fitness_track[-gcs.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION:]) <= gcs.DESIRED_DELTA_FITNESS:
-			break
-
-		# Perform Genetic Operations
-		gcs.elitism()
-		gcs.selection()
-		gcs.crossover()
-		gcs.mutation()
-
-		gcs.next_generation()
-
-		generation = generation + 1
-
-	# Get final fitness
-	gcs.calculate_fitness_all()
-	fitness, fittest_individual = gcs.get_fitness_max()
-	fitness_track.append(fitness)
-
-	ind_vm_ct = gcs.calculate_all_vm_completion_time(fittest_individual)
-	sct = max(ind_vm_ct)
-	fct = min(x for x in ind_vm_ct if x > 0)
-	act = sum(ind_vm_ct) / len(ind_vm_ct)
-	arur = act / sct
-	tpt = gcs.N_CLOUDLETS / sct
-
-	print("\n==============================================\n")
-
-	print("FINAL RESULTS")
-	print(f"FINAL GENERATION: {generation + 1} / {gcs.N_GENERATIONS}")
-	print(f"BEST FITNESS: {fitness}")
-	if gcs.N_CLOUDLETS <= 20:
-		print(f"FITTEST INDIVIDUAL CHROMOSOME: {fittest_individual}")
-	if gcs.N_VMS <= 20:
-		print(f"FITTEST INDIVIDUAL COMPLETION TIME FOR EACH VM IN SECONDS {ind_vm_ct}")
-	print(f"FITNESS HISTORY {fitness_track}")
-
-	print("\n==============================================\n")
-
-	print("Metrics for Schedule.")
-
-	print("")
-
-	print("Fastest Completion Time represents which VM will finish first and time taken. Lower is better.")
-	print("Slowest Completion Time represents which VM will finish last and time taken. Lower is better.")
-	print("Average Completion Time represents the average time each VM is taking to finish. Lower is better.")
-	print("Average Resource Utilization (ARUR) is the average use of each resource. Higher is better.")
-	print("Troughput is the jobs finished per unit time. Higher is better.")
-	print("Makespan is again the slowest time taken by a VM to finish, lower is better.")
-
-	print("")
-
-	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {sct}")
-	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {fct}")
-	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {act}")
-	print(f"ARUR (Average Resource Utilization): {arur}")
-	print(f"THROUGHPUT: {tpt}")
-	print(f"MAKESPAN: {sct}")
-
-	print("\n==============================================\n")
-	
-	print("\nComparison with other algorithms")
-
-	print("\nRandom Selection (RS) Algorithm")
-
-	rp1, rind_vm_ct = gcs.random_results_ct()
-	rsct = max(rind_vm_ct)
-	rfct = min(x for x in rind_vm_ct if x > 0)
-	ract = sum(rind_vm_ct) / len(rind_vm_ct)
-	rarur = ract / rsct
-	rtpt = gcs.N_CLOUDLETS / rsct
-
-	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {rsct}")
-	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {rfct}")
-	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {ract}")
-	print(f"ARUR (Average Resource Utilization): {rarur}")
-	print(f"THROUGHPUT: {rtpt}")
-	print(f"MAKESPAN: {rsct}")
-
-	print("\nRound Robin (RR) Algorithm")
-
-	rrp1, rrind_vm_ct = gcs.round_robin_results_ct()
-	rrsct = max(rrind_vm_ct)
-	rrfct = min(x for x in rrind_vm_ct if x > 0)
-	rract = sum(rrind_vm_ct) / len(rrind_vm_ct)
-	rrarur = rract / rrsct
-	rrtpt = gcs.N_CLOUDLETS / rrsct
-
-	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {rrsct}")
-	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {rrfct}")
-	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {rract}")
-	print(f"ARUR (Average Resource Utilization): {rrarur}")
-	print(f"THROUGHPUT: {rrtpt}")
-	print(f"MAKESPAN: {rrsct}")
-
-	print("\nMinumum Completion Time (MCT) Algorithm")
-
-	mp1, mind_vm_ct = gcs.mct_results_ct()
-	msct = max(mind_vm_ct)
-	mfct = min(x for x in mind_vm_ct if x > 0)
-	mact = sum(mind_vm_ct) / len(mind_vm_ct)
-	marur = mact / msct
-	mtpt = gcs.N_CLOUDLETS / msct
-	
-	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {msct}")
-	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {mfct}")
-	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {mact}")
-	print(f"ARUR (Average Resource Utilization): {marur}")
-	print(f"THROUGHPUT: {mtpt}")
-	print(f"MAKESPAN: {msct}")
-
-	print("\nMin-Min Algorithm")
-
-	mmnp1, mmnind_vm_ct = gcs.minmin_results_ct()
-	mmnsct = max(mmnind_vm_ct)
-	mmnfct = min(x for x in mmnind_vm_ct if x > 0)
-	mmnact = sum(mmnind_vm_ct) / len(mmnind_vm_ct)
-	mmnarur = mmnact / mmnsct
-	mmntpt = gcs.N_CLOUDLETS / mmnsct
-	
-	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {mmnsct}")
-	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {mmnfct}")
-	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {mmnact}")
-	print(f"ARUR (Average Resource Utilization): {mmnarur}")
-	print(f"THROUGHPUT: {mmntpt}")
-	print(f"MAKESPAN: {mmnsct}")
-
-	print("\n==============================================\n")
-
-	print("\nRatio of Genetic Algorithm to other algorithms.\n")
-
-	print("")
-
-	print("Slowest Completion Time Ratio. Less than 1 means GCS is better.")
-	print("Fastest Completion Time Ratio. Less than 1 means GCS is better.")
-	print("Fastest Completion Time Ratio. Less than 1 means GCS is better.")
-	print("ARUR Ratio. Greater than 1 means GCS is better.")
-	print("Throghput Ratio. Greater than 1 means GCS is better.")
-	print("Makespan Ratio. Less than 1 means GCS is better.")
-	
-	print("")
-
-	print(f"GCS-to-RS SLOWEST COMPLETION TIME RATIO: {sct / rsct}")
-	print(f"GCS-to-RR SLOWEST COMPLETION TIME RATIO: {sct / rrsct}")
-	print(f"GCS-to-MCT SLOWEST COMPLETION TIME RATIO: {sct / msct}")
-	print(f"GCS-to-MIN-MIN SLOWEST COMPLETION TIME RATIO: {sct / mmnsct}")
-
-	print("")
-
-	print(f"GCS-to-RS FASTEST COMPLETION TIME RATIO: {fct / rfct}")
-	print(f"GCS-to-RR FASTEST COMPLETION TIME RATIO: {fct / rrfct}")
-	print(f"GCS-to-MCT FASTEST COMPLETION TIME RATIO: {fct / mfct}")
-	print(f"GCS-to-MIN-MIN FASTEST COMPLETION TIME RATIO: {fct / mmnfct}")
-
-	print("")
-
-	print(f"GCS-to-RS AVERAGE COMPLETION TIME RATIO: {act / ract}")
-	print(f"GCS-to-RR AVERAGE COMPLETION TIME RATIO: {act / rract}")
-	print(f"GCS-to-MCT AVERAGE COMPLETION TIME RATIO: {act / mact}")
-	print(f"GCS-to-MIN-MIN AVERAGE COMPLETION TIME RATIO: {act / mmnact}")
-
-	print("")
-
-	print(f"GCS-to-RS ARUR RATIO: {arur / rarur}")
-	print(f"GCS-to-RR ARUR RATIO: {arur / rrarur}")
-	print(f"GCS-to-MCT ARUR RATIO: {arur / marur}")
-	print(f"GCS-to-MIN-MIN ARUR RATIO: {arur / mmnarur}")
-
-	print("")
-
-	print(f"GCS-to-RS THROUGHPUT RATIO: {tpt / rtpt}")
-	print(f"GCS-to-RR THROUGHPUT RATIO: {tpt / rrtpt}")
-	print(f"GCS-to-MCT THROUGHPUT RATIO: {tpt / mtpt}")
-	print(f"GCS-to-MIN-MIN THROUGHPUT RATIO: {tpt / mmntpt}")
-
-	print("")
-
-	print(f"GCS-to-RS MAKESPAN RATIO: {sct / rsct}")
-	print(f"GCS-to-RR MAKESPAN RATIO: {sct / rrsct}")
-	print(f"GCS-to-MCT MAKESPAN RATIO: {sct / msct}")
-	print(f"GCS-to-MIN-MIN MAKESPAN RATIO: {sct / mmnsct}")
-
-	print("\n==============================================\n")
-
-	print("\nNote: Fastest Completion time is not the best metric, Slowest, Average Completion time, ARUR, Throughput and Makespan are much better metrics for comparison.")
-	print("This is because the longer a virtual machines runs, the host machine will remained powered on and continue opeartions and consuming more power, resulting in higher usage cost, billing and CO2 emmissions.")
+"""
+This module contains the code for running the genetic algorithm and comparison with other algorithms
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import sys
+from gcs import GeneticCloudScheduling
+from crossover import Crossover
+from datatype import DataType
+from engine import Engine
+from island import IslandModel
+from multiseed import MultiSeedRunner
+from decomposition import CoarseToFineScheduling
+from schedulecache import ScheduleCache
+from topology import Topology
+from telemetry import Telemetry
+
+
+if __name__ == '__main__':
+
+	gcs = GeneticCloudScheduling()
+	
+	# Set parameters
+	gcs.N_GENERATIONS = 1000
+	gcs.N_VMS = 20
+	gcs.POPULATION_SIZE = 100
+	gcs.CROSSOVER = Crossover.UNIFORM # Use UNIFORM or SINGLE_POINT
+	gcs.CROSSOVER_RATE = 0.10
+	gcs.MUTATION_RATE = 0.01
+	gcs.ELITISM_RATE = 0.02
+	gcs.SEED_FRACTION = 0.0 # Fraction of the initial population seeded from MCT, Min-Min, round robin and LPT schedules and perturbed copies of them
+	gcs.ENGINE = Engine.PYTHON # Use PYTHON or NUMPY (requires numpy)
+	gcs.SPARSE_MUTATION = False # Sample only the mutated positions instead of one random number per gene
+	gcs.BATCHED_OPERATORS = False # Apply genetic operators to the whole population at once, requires numpy
+	gcs.STEADY_STATE = False # Insert a few children at a time into the ranked population, evicting the least fit, instead of replacing whole generations
+	gcs.INCREMENTAL_FITNESS = False # Update per-VM loads per changed gene instead of re-evaluating
+	gcs.N_WORKERS = 1 # Worker processes for fitness evaluation, more than 1 requires numpy
+	gcs.FITNESS_CACHE_SIZE = 0 # Chromosomes remembered to skip re-evaluating duplicates, 0 disables
+	gcs.BOUNDED_FITNESS = False # Stop evaluating a child once it is worse than both parents, PYTHON engine only, saves a few percent at most
+	gcs.LOCAL_SEARCH_BUDGET = 0 # Candidate moves and swaps off the most loaded VM scored per generation, 0 disables the local search
+	gcs.LOCAL_SEARCH_ELITES = True # Apply the local search to the elites
+	gcs.LOCAL_SEARCH_CHILDREN = False # Apply the local search to the children
+	gcs.DESIRED_DELTA_FITNESS = 0
+	gcs.DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION = 7
+	gcs.DESIRED_DELTA_DIVERSITY = None # Also require the population diversity to have plateaued within this to stop, None ignores diversity
+	gcs.ADAPTIVE_RATES = False # Raise the mutation and crossover rates while the population has collapsed, lower them while it is diverse
+	gcs.STOP_AT_LOWER_BOUND = True # Stop as soon as the best makespan reaches the lower bound, the schedule is then optimal
+	gcs.TIME_BUDGET = 0 # Wall-clock deadline in seconds, the best schedule so far is returned when it is reached, 0 means no limit
+	gcs.CHECKPOINT_PATH = None # File the state is written to every CHECKPOINT_INTERVAL generations, resume with load_checkpoint and run(resume=True)
+	gcs.CHECKPOINT_INTERVAL = 0 # Generations between checkpoints, 0 disables checkpointing
+	data_type = DataType.GOOGLE # Use TESTING, GOOGLE, SYNTETHIC or TRACE
+	trace_path = "trace.csv" # Cloudlet lengths for the TRACE workload, CSV or raw float64 binary
+	trace_vms_path = None # Optional VM MIPS for the TRACE workload
+	n_islands = 1 # Use more than 1 to run an island model with one process per island
+	migration_interval = 10 # Generations between island migrations
+	topology = Topology.RING # Use RING or FULLY_CONNECTED
+	n_seeds = 1 # Use more than 1 to run the genetic algorithm from that many seeds and print makespan statistics over them
+	n_seed_workers = 1 # Worker processes the seeds are run on
+	n_buckets = 0 # Use more than 0 to evolve chunks of that many cloudlet length classes and refine the expanded schedule, for very large workloads
+	verbose = False # Print progress every generation, slows down runs with fast generations
+	telemetry_path = None # Write per generation phase timings and statistics as JSON lines to this file
+	cache_path = None # Directory of a persistent schedule cache, identical reruns return the cached schedule and near ones are seeded from it
+	run_sufferage = True # Also compare with the Sufferage schedule, which takes seconds to minutes for very large workloads
+
+	# Change datatype between TESTING, GOOGLE and SYNTETHIC for different workload. 
+	# TESTING WORKLOAD is bad for simulation as workload is too small and too randomized.
+	# Better to use GOOGLE or SYNTETHIC workload which can be commented or uncommented out below.
+	
+	if data_type is DataType.TESTING:
+
+		print("USING TESTING WORKLOAD")
+		gcs.N_CLOUDLETS = 100
+		gcs.generate_cloudlets(400, 1000)
+
+	elif data_type is DataType.GOOGLE:
+
+		print("USING GOOGLE LIKE WORKLOAD")
+		gcs.generate_google_like_workload()
+
+	elif data_type is DataType.SYNTETHIC:
+
+		print("USING SYNTHETIC WORKLOAD")
+		gcs.generate_syntethic_like_workload()
+
+	elif data_type is DataType.TRACE:
+
+		print(f"USING TRACE WORKLOAD {trace_path}")
+		gcs.load_trace_workload(trace_path)
+		if trace_vms_path:
+			gcs.load_trace_vms(trace_vms_path)
+
+	# Generate VMs and population, seeding the population needs the VMs
+	if not gcs.VMS:
+		gcs.generate_vms(250, 2000)
+	gcs.generate_population()
+	cache = ScheduleCache(cache_path) if cache_path else None
+
+	if n_islands > 1:
+
+		print(f"Starting Genetic algorithm on {n_islands} islands for {gcs.N_GENERATIONS} generations optimizing for {gcs.N_VMS} VMs")
+
+		island_model = IslandModel(gcs)
+		island_model.N_ISLANDS = n_islands
+		island_model.MIGRATION_INTERVAL = migration_interval
+		island_model.TOPOLOGY = topology
+		fitness, fittest_individual = island_model.run()
+		fitness_track = island_model.get_fitness_track()
+		generation = island_model.GENERATION
+
+	elif n_seeds > 1:
+
+		print(f"Starting Genetic algorithm from {n_seeds} seeds for {gcs.N_GENERATIONS} generations optimizing for {gcs.N_VMS} VMs")
+
+		runner = MultiSeedRunner(gcs)
+		runner.SEEDS = list(range(n_seeds))
+		runner.N_WORKERS = n_seed_workers
+		fitness, fittest_individual = runner.run()
+		fitness_track = runner.FITNESS_HISTORY[runner.SEEDS.index(runner.BEST_SEED)]
+		generation = runner.GENERATIONS[runner.SEEDS.index(runner.BEST_SEED)]
+
+	elif n_buckets > 0:
+
+		print(f"Starting coarse-to-fine Genetic algorithm on {n_buckets} length classes for {gcs.N_GENERATIONS} generations optimizing for {gcs.N_VMS} VMs")
+
+		decomposition = CoarseToFineScheduling(gcs)
+		decomposition.N_BUCKETS = n_buckets
+		fitness, fittest_individual = decomposition.run()
+		fitness_track = decomposition.COARSE.FITNESS_TRACK
+		generation = decomposition.COARSE.GENERATION
+		print(f"COARSE MAKESPAN: {decomposition.COARSE_MAKESPAN} ON {decomposition.COARSE.N_CLOUDLETS} CHUNKS, {decomposition.REFINE_MOVES} REFINEMENT MOVES")
+
+	else:
+
+		print(f"Starting Genetic algorithm for {gcs.N_GENERATIONS} generations optimizing for {gcs.N_VMS} VMs")
+
+		if verbose or telemetry_path:
+			gcs.TELEMETRY = Telemetry(telemetry_path)
+		if verbose:
+			gcs.TELEMETRY.CALLBACKS.append(lambda record: print(f"Generations:\t{record['generation'] + 1} / {gcs.N_GENERATIONS}\t| Δ {record['delta_fitness']}\t| {sum(record['phases'].values()):.6f}s"))
+
+		# Run until N_GENERATIONS, stagnation or TIME_BUDGET
+		if cache:
+			fitness, fittest_individual = cache.run(gcs)
+			print(f"SCHEDULE CACHE: {cache.LAST.upper()}")
+		else:
+			fitness, fittest_individual = gcs.run()
+		fitness_track = gcs.FITNESS_TRACK
+		generation = gcs.GENERATION
+		gcs.close()
+
+	if fittest_individual is None:
+		sys.exit("TIME_BUDGET RAN OUT BEFORE ANY SCHEDULE WAS EVALUATED")
+
+	# An exact cache hit runs no generation, its results are the metrics stored with the cached schedule
+	cache_hit = cache is not None and cache.LAST == "hit"
+	ind_vm_ct = cache.METRICS["vm_completion_time"] if cache_hit else gcs.calculate_all_vm_completion_time(fittest_individual)
+	sct = max(ind_vm_ct)
+	fct = min(x for x in ind_vm_ct if x > 0)
+	act = sum(ind_vm_ct) / len(ind_vm_ct)
+	arur = act / sct
+	tpt = gcs.N_CLOUDLETS / sct
+
+	print("\n==============================================\n")
+
+	print("FINAL RESULTS")
+	if cache_hit:
+		print(f"CACHED SCHEDULE: MAKESPAN {cache.METRICS['makespan']} FOUND AT GENERATION {cache.METRICS['generation'] + 1} / {gcs.N_GENERATIONS}")
+	else:
+		print(f"FINAL GENERATION: {generation + 1} / {gcs.N_GENERATIONS}")
+	print(f"BEST FITNESS: {fitness}")
+	if gcs.N_CLOUDLETS <= 20:
+		print(f"FITTEST INDIVIDUAL CHROMOSOME: {fittest_individual}")
+	if gcs.N_VMS <= 20:
+		print(f"FITTEST INDIVIDUAL COMPLETION TIME FOR EACH VM IN SECONDS {ind_vm_ct}")
+	if not cache_hit:
+		print(f"FITNESS HISTORY {fitness_track}")
+	if n_islands > 1:
+		for i, island_fitness_track in enumerate(island_model.FITNESS_HISTORY):
+			print(f"ISLAND {i + 1} FITNESS HISTORY {island_fitness_track}")
+	elif n_seeds > 1:
+		print(f"BEST SEED: {runner.BEST_SEED}")
+		print(f"MAKESPAN STATISTICS OVER {n_seeds} SEEDS: {runner.get_statistics()}")
+	elif not cache_hit:
+		print(f"FITNESS CACHE HITS: {gcs.FITNESS_CACHE_HITS}")
+		print(f"FITNESS CACHE MISSES: {gcs.FITNESS_CACHE_MISSES}")
+		heuristic_makespan = min(max(vm_ct) for _, vm_ct in (gcs.mct_results_ct(), gcs.minmin_results_ct(), gcs.lpt_results_ct()))
+		reached = gcs.generations_to_makespan(heuristic_makespan)
+		if reached:
+			print(f"BEST HEURISTIC MAKESPAN {heuristic_makespan} REACHED AFTER {reached[0]} GENERATIONS IN {reached[1]:.3f}s")
+		else:
+			print(f"BEST HEURISTIC MAKESPAN {heuristic_makespan} NOT REACHED")
+
+	print("\n==============================================\n")
+
+	print("Metrics for Schedule.")
+
+	print("")
+
+	print("Fastest Completion Time represents which VM will finish first and time taken. Lower is better.")
+	print("Slowest Completion Time represents which VM will finish last and time taken. Lower is better.")
+	print("Average Completion Time represents the average time each VM is taking to finish. Lower is better.")
+	print("Average Resource Utilization (ARUR) is the average use of each resource. Higher is better.")
+	print("Troughput is the jobs finished per unit time. Higher is better.")
+	print("Makespan is again the slowest time taken by a VM to finish, lower is better.")
+
+	print("")
+
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {sct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {fct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {act}")
+	print(f"ARUR (Average Resource Utilization): {arur}")
+	print(f"THROUGHPUT: {tpt}")
+	print(f"MAKESPAN: {sct}")
+	lower_bound = gcs.calculate_makespan_lower_bound()
+	print(f"MAKESPAN LOWER BOUND: {lower_bound}")
+	print(f"OPTIMALITY GAP: {(sct / lower_bound - 1) * 100:.2f}%")
+
+	print("\n==============================================\n")
+	
+	print("\nComparison with other algorithms")
+
+	print("\nRandom Selection (RS) Algorithm")
+
+	rp1, rind_vm_ct = gcs.random_results_ct()
+	rsct = max(rind_vm_ct)
+	rfct = min(x for x in rind_vm_ct if x > 0)
+	ract = sum(rind_vm_ct) / len(rind_vm_ct)
+	rarur = ract / rsct
+	rtpt = gcs.N_CLOUDLETS / rsct
+
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {rsct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {rfct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {ract}")
+	print(f"ARUR (Average Resource Utilization): {rarur}")
+	print(f"THROUGHPUT: {rtpt}")
+	print(f"MAKESPAN: {rsct}")
+
+	print("\nRound Robin (RR) Algorithm")
+
+	rrp1, rrind_vm_ct = gcs.round_robin_results_ct()
+	rrsct = max(rrind_vm_ct)
+	rrfct = min(x for x in rrind_vm_ct if x > 0)
+	rract = sum(rrind_vm_ct) / len(rrind_vm_ct)
+	rrarur = rract / rrsct
+	rrtpt = gcs.N_CLOUDLETS / rrsct
+
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {rrsct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {rrfct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {rract}")
+	print(f"ARUR (Average Resource Utilization): {rrarur}")
+	print(f"THROUGHPUT: {rrtpt}")
+	print(f"MAKESPAN: {rrsct}")
+
+	print("\nMinumum Completion Time (MCT) Algorithm")
+
+	mp1, mind_vm_ct = gcs.mct_results_ct()
+	msct = max(mind_vm_ct)
+	mfct = min(x for x in mind_vm_ct if x > 0)
+	mact = sum(mind_vm_ct) / len(mind_vm_ct)
+	marur = mact / msct
+	mtpt = gcs.N_CLOUDLETS / msct
+	
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {msct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {mfct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {mact}")
+	print(f"ARUR (Average Resource Utilization): {marur}")
+	print(f"THROUGHPUT: {mtpt}")
+	print(f"MAKESPAN: {msct}")
+
+	print("\nMin-Min Algorithm")
+
+	mmnp1, mmnind_vm_ct = gcs.minmin_results_ct()
+	mmnsct = max(mmnind_vm_ct)
+	mmnfct = min(x for x in mmnind_vm_ct if x > 0)
+	mmnact = sum(mmnind_vm_ct) / len(mmnind_vm_ct)
+	mmnarur = mmnact / mmnsct
+	mmntpt = gcs.N_CLOUDLETS / mmnsct
+	
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {mmnsct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {mmnfct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {mmnact}")
+	print(f"ARUR (Average Resource Utilization): {mmnarur}")
+	print(f"THROUGHPUT: {mmntpt}")
+	print(f"MAKESPAN: {mmnsct}")
+
+	print("\nMax-Min Algorithm")
+
+	mmxp1, mmxind_vm_ct = gcs.maxmin_results_ct()
+	mmxsct = max(mmxind_vm_ct)
+	mmxfct = min(x for x in mmxind_vm_ct if x > 0)
+	mmxact = sum(mmxind_vm_ct) / len(mmxind_vm_ct)
+	mmxarur = mmxact / mmxsct
+	mmxtpt = gcs.N_CLOUDLETS / mmxsct
+
+	print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {mmxsct}")
+	print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {mmxfct}")
+	print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {mmxact}")
+	print(f"ARUR (Average Resource Utilization): {mmxarur}")
+	print(f"THROUGHPUT: {mmxtpt}")
+	print(f"MAKESPAN: {mmxsct}")
+
+	if run_sufferage:
+
+		print("\nSufferage Algorithm")
+
+		sfp1, sfind_vm_ct = gcs.sufferage_results_ct()
+		sfsct = max(sfind_vm_ct)
+		sffct = min(x for x in sfind_vm_ct if x > 0)
+		sfact = sum(sfind_vm_ct) / len(sfind_vm_ct)
+		sfarur = sfact / sfsct
+		sftpt = gcs.N_CLOUDLETS / sfsct
+
+		print(f"FITTEST INDIVIDUAL SLOWEST COMPLETION TIME: {sfsct}")
+		print(f"FITTEST INDIVIDUAL FASTEST COMPLETION TIME: {sffct}")
+		print(f"FITTEST INDIVIDUAL AVERAGE COMPLETION TIME: {sfact}")
+		print(f"ARUR (Average Resource Utilization): {sfarur}")
+		print(f"THROUGHPUT: {sftpt}")
+		print(f"MAKESPAN: {sfsct}")
+
+	print("\n==============================================\n")
+
+	print("\nRatio of Genetic Algorithm to other algorithms.\n")
+
+	print("")
+
+	print("Slowest Completion Time Ratio. Less than 1 means GCS is better.")
+	print("Fastest Completion Time Ratio. Less than 1 means GCS is better.")
+	print("Fastest Completion Time Ratio. Less than 1 means GCS is better.")
+	print("ARUR Ratio. Greater than 1 means GCS is better.")
+	print("Throghput Ratio. Greater than 1 means GCS is better.")
+	print("Makespan Ratio. Less than 1 means GCS is better.")
+	
+	print("")
+
+	print(f"GCS-to-RS SLOWEST COMPLETION TIME RATIO: {sct / rsct}")
+	print(f"GCS-to-RR SLOWEST COMPLETION TIME RATIO: {sct / rrsct}")
+	print(f"GCS-to-MCT SLOWEST COMPLETION TIME RATIO: {sct / msct}")
+	print(f"GCS-to-MIN-MIN SLOWEST COMPLETION TIME RATIO: {sct / mmnsct}")
+	print(f"GCS-to-MAX-MIN SLOWEST COMPLETION TIME RATIO: {sct / mmxsct}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE SLOWEST COMPLETION TIME RATIO: {sct / sfsct}")
+
+	print("")
+
+	print(f"GCS-to-RS FASTEST COMPLETION TIME RATIO: {fct / rfct}")
+	print(f"GCS-to-RR FASTEST COMPLETION TIME RATIO: {fct / rrfct}")
+	print(f"GCS-to-MCT FASTEST COMPLETION TIME RATIO: {fct / mfct}")
+	print(f"GCS-to-MIN-MIN FASTEST COMPLETION TIME RATIO: {fct / mmnfct}")
+	print(f"GCS-to-MAX-MIN FASTEST COMPLETION TIME RATIO: {fct / mmxfct}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE FASTEST COMPLETION TIME RATIO: {fct / sffct}")
+
+	print("")
+
+	print(f"GCS-to-RS AVERAGE COMPLETION TIME RATIO: {act / ract}")
+	print(f"GCS-to-RR AVERAGE COMPLETION TIME RATIO: {act / rract}")
+	print(f"GCS-to-MCT AVERAGE COMPLETION TIME RATIO: {act / mact}")
+	print(f"GCS-to-MIN-MIN AVERAGE COMPLETION TIME RATIO: {act / mmnact}")
+	print(f"GCS-to-MAX-MIN AVERAGE COMPLETION TIME RATIO: {act / mmxact}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE AVERAGE COMPLETION TIME RATIO: {act / sfact}")
+
+	print("")
+
+	print(f"GCS-to-RS ARUR RATIO: {arur / rarur}")
+	print(f"GCS-to-RR ARUR RATIO: {arur / rrarur}")
+	print(f"GCS-to-MCT ARUR RATIO: {arur / marur}")
+	print(f"GCS-to-MIN-MIN ARUR RATIO: {arur / mmnarur}")
+	print(f"GCS-to-MAX-MIN ARUR RATIO: {arur / mmxarur}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE ARUR RATIO: {arur / sfarur}")
+
+	print("")
+
+	print(f"GCS-to-RS THROUGHPUT RATIO: {tpt / rtpt}")
+	print(f"GCS-to-RR THROUGHPUT RATIO: {tpt / rrtpt}")
+	print(f"GCS-to-MCT THROUGHPUT RATIO: {tpt / mtpt}")
+	print(f"GCS-to-MIN-MIN THROUGHPUT RATIO: {tpt / mmntpt}")
+	print(f"GCS-to-MAX-MIN THROUGHPUT RATIO: {tpt / mmxtpt}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE THROUGHPUT RATIO: {tpt / sftpt}")
+
+	print("")
+
+	print(f"GCS-to-RS MAKESPAN RATIO: {sct / rsct}")
+	print(f"GCS-to-RR MAKESPAN RATIO: {sct / rrsct}")
+	print(f"GCS-to-MCT MAKESPAN RATIO: {sct / msct}")
+	print(f"GCS-to-MIN-MIN MAKESPAN RATIO: {sct / mmnsct}")
+	print(f"GCS-to-MAX-MIN MAKESPAN RATIO: {sct / mmxsct}")
+	if run_sufferage:
+		print(f"GCS-to-SUFFERAGE MAKESPAN RATIO: {sct / sfsct}")
+
+	print("\n==============================================\n")
+
+	print("\nNote: Fastest Completion time is not the best metric, Slowest, Average Completion time, ARUR, Throughput and Makespan are much better metrics for comparison.")
+	print("This is because the longer a virtual machines runs, the host machine will remained powered on and continue opeartions and consuming more power, resulting in higher usage cost, billing and CO2 emmissions.")
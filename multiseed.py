@@ -0,0 +1,131 @@
+"""
+This module contains the class for running the genetic algorithm from many seeds on a pool of worker processes.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import copy
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List
+from gcs import GeneticCloudScheduling
+
+
+# Template scheduler sent once to every worker process
+_WORKER = {}
+
+
+def _attach(gcs: GeneticCloudScheduling):
+	"""
+	Worker initializer, keep the template scheduler.
+	"""
+
+	_WORKER["gcs"] = gcs
+
+
+def _run_seed(seed: int) -> Tuple[float, List[int], int, List[float]]:
+	"""
+	Worker task, run the template scheduler from one seed.
+	"""
+
+	return run_seed(_WORKER["gcs"], seed)
+
+
+def run_seed(gcs: GeneticCloudScheduling, seed: int) -> Tuple[float, List[int], int, List[float]]:
+	"""
+	Run a copy of a configured scheduler on its own random stream, from a population generated from that stream.
+	The scheduler itself is not modified.
+
+	:param gcs: Configured scheduler with CLOUDLETS and VMS.
+	:param seed: Seed of the copy's random stream.
+
+	:returns (max_fitness, individual, generation, fitness_track): Best fitness and individual, generations evolved and best fitness of every generation.
+	"""
+
+	gcs = copy.deepcopy(gcs)
+	gcs.seed(seed)
+	gcs.generate_population()
+	fitness, individual = gcs.run()
+	gcs.close()
+
+	return fitness, list(individual), gcs.GENERATION, gcs.FITNESS_TRACK
+
+
+class MultiSeedRunner():
+	"""
+	Run independent copies of a configured GeneticCloudScheduling from every seed in SEEDS, on N_WORKERS processes.
+	Every run uses its own random stream, so its result only depends on its seed and not on the worker it ran on
+	or on the other seeds. All runs share the workload of the configured scheduler.
+	"""
+
+
+	def __init__(self, gcs: GeneticCloudScheduling):
+		# Configured scheduler with CLOUDLETS and VMS, copied for every seed
+		self.GCS: GeneticCloudScheduling = gcs
+		# Seeds to run
+		self.SEEDS: List[int] = list(range(10))
+		# Number of worker processes, 1 runs the seeds one after another in this process
+		self.N_WORKERS: int = 1
+		# Makespan of the best schedule of every seed
+		self.MAKESPANS: List[float] = []
+		# Generations evolved from every seed
+		self.GENERATIONS: List[int] = []
+		# Best fitness of every generation, one list per seed
+		self.FITNESS_HISTORY: List[List[float]] = []
+		# Seed that found the best schedule
+		self.BEST_SEED: int = None
+		# Best fitness found from any seed
+		self.BEST_FITNESS: float = 0.0
+		# Individual with the best fitness found from any seed
+		self.BEST_INDIVIDUAL: List[int] = []
+
+
+	def run(self) -> Tuple[float, List[int]]:
+		"""
+		Run the scheduler from every seed.
+		With more than one worker every run evaluates fitness serially, so the pool is not oversubscribed.
+
+		:returns (max_fitness, individual): Best fitness and individual over all seeds.
+		"""
+
+		if self.N_WORKERS > 1:
+			gcs = copy.copy(self.GCS)
+			gcs.N_WORKERS = 1
+			with ProcessPoolExecutor(self.N_WORKERS, initializer=_attach, initargs=(gcs,)) as executor:
+				results = list(executor.map(_run_seed, self.SEEDS))
+		else:
+			results = [run_seed(self.GCS, seed) for seed in self.SEEDS]
+
+		self.MAKESPANS = [1 / fitness for fitness, _, _, _ in results]
+		self.GENERATIONS = [generation for _, _, generation, _ in results]
+		self.FITNESS_HISTORY = [fitness_track for _, _, _, fitness_track in results]
+		self.BEST_SEED, self.BEST_FITNESS, self.BEST_INDIVIDUAL = None, 0.0, []
+		for seed, (fitness, individual, _, _) in zip(self.SEEDS, results):
+			if fitness > self.BEST_FITNESS:
+				self.BEST_SEED, self.BEST_FITNESS, self.BEST_INDIVIDUAL = seed, fitness, individual
+
+		return self.BEST_FITNESS, self.BEST_INDIVIDUAL
+
+
+	def get_statistics(self) -> dict:
+		"""
+		Get statistics of the best makespan over all seeds of the last run().
+
+		:returns statistics: Number of runs, mean, standard deviation, minimum, median and maximum makespan.
+		"""
+
+		makespans = self.MAKESPANS
+		if not makespans:
+			return {"runs": 0}
+
+		return {
+			"runs": len(makespans),
+			"mean": statistics.mean(makespans),
+			"stdev": statistics.stdev(makespans) if len(makespans) > 1 else 0.0,
+			"min": min(makespans),
+			"median": statistics.median(makespans),
+			"max": max(makespans),
+		}
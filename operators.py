@@ -0,0 +1,163 @@
+"""
+This module contains the numpy genetic operators of the batched engine.
+Every operator works on arrays with a leading instance axis, so GeneticCloudScheduling applies them to its one
+population and BatchScheduling to the stacked populations of many problem instances with the same random draws.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from typing import Tuple, Sequence
+from crossover import Crossover
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+def makespan_lower_bound(lengths: Sequence[float], mips: Sequence[float]) -> float:
+	"""
+	Calculate a lower bound on the makespan of any schedule of cloudlets on VMs.
+	Spreading the total length perfectly over all VMs takes total length / total MIPS,
+	and the longest cloudlet takes at least its length divided by the fastest VM's MIPS.
+
+	:param lengths: Cloudlet lengths.
+	:param mips: VM MIPS.
+
+	:returns makespan: Lower bound on the makespan.
+	"""
+
+	if not len(lengths) or not len(mips):
+		return 0.0
+
+	return max(sum(lengths) / sum(mips), max(lengths) / max(mips))
+
+
+def select_pairs(rng: "np.random.Generator", n_instances: int, n_pairs: int, population_size: int, tournament_size: int) -> Tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Perform Tournament selection for every pair of parents of every instance at once.
+	Populations are sorted by fitness, so the winner of a tournament is simply its smallest rank.
+	Pairs where the same individual won both tournaments are redrawn.
+
+	:param rng: Numpy random generator.
+	:param n_instances: Number of instances.
+	:param n_pairs: Number of pairs of parents per instance.
+	:param population_size: Number of individuals per instance.
+	:param tournament_size: Number of distinct individuals per tournament.
+
+	:returns (winner_a, winner_b): Ranks of the first and second parents, of shape (instances, pairs).
+	"""
+
+	def tournament(n: int) -> "np.ndarray":
+		# Smallest rank of tournament_size distinct random ranks for each of n tournaments
+		keys = rng.random((n, population_size))
+		return np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size].min(axis=1)
+
+	winner_a = tournament(n_instances * n_pairs).reshape(n_instances, n_pairs)
+	winner_b = tournament(n_instances * n_pairs).reshape(n_instances, n_pairs)
+	same = np.flatnonzero(winner_a == winner_b)
+	while len(same):
+		winner_a.flat[same] = tournament(len(same))
+		winner_b.flat[same] = tournament(len(same))
+		same = same[winner_a.flat[same] == winner_b.flat[same]]
+
+	return winner_a, winner_b
+
+
+def crossover(rng: "np.random.Generator", p1: "np.ndarray", p2: "np.ndarray", n_genes: "np.ndarray", kind: Crossover, rate: float) -> "np.ndarray":
+	"""
+	Perform crossover for all pairs of every instance at once using one random mask.
+
+	:param rng: Numpy random generator.
+	:param p1: First parents, of shape (instances, pairs, genes).
+	:param p2: Second parents, of the same shape.
+	:param n_genes: Number of real genes of every instance, single point crossover points are drawn up to it.
+	:param kind: Crossover type.
+	:param rate: Probability of taking each gene of a uniform crossover from the first parent.
+
+	:returns children: Children of shape (instances, 2 * pairs, genes), the two children of a pair are adjacent.
+	"""
+
+	n_instances, n_pairs, width = p1.shape
+	if kind is Crossover.UNIFORM:
+		mask = rng.random(p1.shape) <= rate
+	else:
+		points = rng.integers(0, n_genes[:, None], size=(n_instances, n_pairs), endpoint=True)
+		mask = np.arange(width) < points[:, :, None]
+
+	children = np.empty((n_instances, 2 * n_pairs, width), dtype=p1.dtype)
+	children[:, 0::2] = np.where(mask, p1, p2)
+	children[:, 1::2] = np.where(mask, p2, p1)
+
+	return children
+
+
+def mutate(rng: "np.random.Generator", children: "np.ndarray", n_vms: "np.ndarray", rate: float, sparse: bool = False) -> "np.ndarray":
+	"""
+	Perform mutation on all children of every instance at once, in place.
+	With sparse the number of mutations is drawn from a binomial distribution and only
+	that many distinct positions are sampled, instead of one random number per gene.
+
+	:param rng: Numpy random generator.
+	:param children: Children of shape (instances, children, genes).
+	:param n_vms: Number of VMs of every instance, mutated genes are drawn below it.
+	:param rate: Probability of mutating each gene.
+	:param sparse: Sample the mutated positions instead of drawing one random number per gene.
+
+	:returns flat: Sorted flat positions of the mutated genes in children.
+	"""
+
+	size = children.size
+	if sparse:
+		flat = np.sort(rng.choice(size, size=rng.binomial(size, rate), replace=False))
+	else:
+		flat = np.flatnonzero(rng.random(size) <= rate)
+	children.flat[flat] = rng.integers(0, n_vms[flat // (size // len(children))])
+
+	return flat
+
+
+def completion_times(etc: "np.ndarray", population: "np.ndarray") -> "np.ndarray":
+	"""
+	Calculate completion time for all VMs of every individual of every instance in one weighted bincount.
+	Genes are summed in cloudlet order like the single individual engines, so the values are identical.
+
+	:param etc: ETC tensor of shape (instances, cloudlets, VMs).
+	:param population: Population tensor of shape (instances, individuals, cloudlets).
+
+	:returns vm_ct: Completion time tensor of shape (instances, individuals, VMs).
+	"""
+
+	n_instances, n_individuals, n_genes = population.shape
+	n_vms = etc.shape[2]
+	genes = population.astype(np.intp)
+	# Gather the weights from the flat ETC tensor, cheaper than indexing it along three axes
+	weights = etc.reshape(-1).take(genes + np.arange(n_instances * n_genes, dtype=np.intp).reshape(n_instances, 1, n_genes) * n_vms)
+	genes += np.arange(n_instances * n_individuals, dtype=np.intp).reshape(n_instances, n_individuals, 1) * n_vms
+	vm_ct = np.bincount(genes.ravel(), weights=weights.ravel(), minlength=n_instances * n_individuals * n_vms)
+
+	return vm_ct.reshape(n_instances, n_individuals, n_vms)
+
+
+def select_survivors(winner_a: "np.ndarray", winner_b: "np.ndarray", fitness: "np.ndarray", elites: "np.ndarray") -> "np.ndarray":
+	"""
+	Select the next generation of every instance, the elites and the best two of every parent-child group.
+	Candidates are the individuals of a population stacked on its children, the children of pair k at 2k and 2k + 1.
+
+	:param winner_a: Ranks of the first parents, of shape (instances, pairs).
+	:param winner_b: Ranks of the second parents, of the same shape.
+	:param fitness: Fitness of the candidates, of shape (instances, individuals + children).
+	:param elites: Ranks kept by elitism.
+
+	:returns survivors: Candidate indices of the next generation, of shape (instances, elites + children).
+	"""
+
+	n_instances, n_pairs = winner_a.shape
+	offset = np.broadcast_to(fitness.shape[1] - 2 * n_pairs + 2 * np.arange(n_pairs), winner_a.shape)
+	group = np.stack([winner_a, winner_b, offset, offset + 1], axis=2)
+	best = np.argsort(-np.take_along_axis(fitness, group.reshape(n_instances, -1), axis=1).reshape(group.shape), axis=2, kind="stable")[:, :, :2]
+
+	return np.concatenate([np.broadcast_to(np.asarray(elites, dtype=np.intp), (n_instances, len(elites))), np.take_along_axis(group, best, axis=2).reshape(n_instances, -1)], axis=1)
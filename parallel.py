@@ -0,0 +1,175 @@
+"""
+This module contains the class for evaluating fitness on a pool of worker processes.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from population import Population
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+try:
+	from multiprocessing import shared_memory
+except ImportError:
+	shared_memory = None
+
+
+# Shared tables attached once per worker process
+_WORKER = {}
+
+
+def _attach(etc_name: str, etc_shape: tuple, population_name: str, population_shape: tuple):
+	"""
+	Worker initializer, attach to the shared ETC matrix and population buffer.
+	"""
+
+	etc_shm = shared_memory.SharedMemory(name=etc_name)
+	population_shm = shared_memory.SharedMemory(name=population_name)
+	_WORKER["shm"] = (etc_shm, population_shm)
+	_WORKER["etc"] = np.ndarray(etc_shape, dtype=np.float64, buffer=etc_shm.buf)
+	_WORKER["population"] = np.ndarray(population_shape, dtype=np.uint32, buffer=population_shm.buf)
+
+
+def _evaluate_rows(start: int, stop: int, n_genes: int) -> List[float]:
+	"""
+	Worker task, calculate fitness of the individuals in rows start to stop of the shared population.
+	"""
+
+	return fitness_rows(_WORKER["etc"], _WORKER["population"][start:stop, :n_genes])
+
+
+def fitness_rows(etc: "np.ndarray", matrix: "np.ndarray") -> List[float]:
+	"""
+	Calculate fitness of every row of a population matrix with a weighted bincount.
+	Sums in cloudlet order so results are identical to the serial engines.
+
+	:param etc: ETC matrix with one row per cloudlet.
+	:param matrix: Population matrix with one row per individual.
+
+	:returns fitness: List of fitness values.
+	"""
+
+	n_rows, n_genes = matrix.shape
+	n_vms = etc.shape[1]
+	index = matrix.astype(np.intp)
+	# Gather the weights from the flat ETC matrix, cheaper than indexing it along two axes
+	weights = etc.reshape(-1).take(index + np.arange(n_genes, dtype=np.intp) * n_vms)
+	index += np.arange(n_rows, dtype=np.intp)[:, None] * n_vms
+	vm_ct = np.bincount(index.ravel(), weights=weights.ravel(), minlength=n_rows * n_vms).reshape(n_rows, n_vms)
+
+	return (1 / vm_ct.max(axis=1)).tolist()
+
+
+def _release(executor: ProcessPoolExecutor, blocks: list):
+	"""
+	Shut down the pool and free the shared memory blocks.
+	"""
+
+	executor.shutdown(wait=True)
+	for shm in blocks:
+		shm.close()
+		shm.unlink()
+
+
+class ParallelEvaluator():
+	"""
+	Evaluate population fitness on a process pool.
+	The ETC matrix and the population matrix live in shared memory, so chromosomes are copied into the
+	shared buffer once per call instead of being pickled to every worker. Requires numpy and Python 3.8 or later.
+	"""
+
+
+	def __init__(self, n_workers: int):
+		if np is None:
+			raise ImportError("Parallel evaluation requires numpy to be installed.")
+		if shared_memory is None:
+			raise ImportError("Parallel evaluation requires multiprocessing.shared_memory, available from Python 3.8.")
+
+		self.n_workers = n_workers
+		self.etc = None
+		self.capacity = (0, 0)
+		self.population = None
+		self.executor = None
+		self._finalizer = None
+
+
+	def _setup(self, etc: "np.ndarray", n_rows: int, n_genes: int):
+		"""
+		(Re)create the shared blocks and the worker pool for the given ETC matrix and population shape.
+		"""
+
+		self.close()
+
+		etc_shm = shared_memory.SharedMemory(create=True, size=max(etc.nbytes, 1))
+		shared_etc = np.ndarray(etc.shape, dtype=np.float64, buffer=etc_shm.buf)
+		shared_etc[:] = etc
+
+		shape = (n_rows, n_genes)
+		population_shm = shared_memory.SharedMemory(create=True, size=max(n_rows * n_genes * 4, 1))
+		self.population = np.ndarray(shape, dtype=np.uint32, buffer=population_shm.buf)
+
+		self.executor = ProcessPoolExecutor(
+			max_workers=self.n_workers,
+			initializer=_attach,
+			initargs=(etc_shm.name, etc.shape, population_shm.name, shape)
+		)
+		self._finalizer = weakref.finalize(self, _release, self.executor, [etc_shm, population_shm])
+		self.etc = etc
+		self.capacity = shape
+
+
+	def evaluate(self, etc: "np.ndarray", population: List[List[int]]) -> List[float]:
+		"""
+		Calculate fitness of all individuals, split across the workers.
+		Every worker gets one contiguous slice of the shared population of population / workers rows, sizes differing
+		by at most one row, so a generation costs one task per worker.
+
+		:param etc: ETC matrix with one row per cloudlet.
+		:param population: List of individuals.
+
+		:returns fitness: List of fitness values, in population order.
+		"""
+
+		n_rows = len(population)
+		n_genes = len(population[0])
+
+		if etc is not self.etc or n_rows > self.capacity[0] or n_genes > self.capacity[1]:
+			self._setup(etc, max(n_rows, self.capacity[0]), max(n_genes, self.capacity[1]))
+
+		if isinstance(population, Population):
+			self.population[:n_rows, :n_genes] = population.as_array()
+		else:
+			self.population[:n_rows, :n_genes] = population
+
+		n_slices = min(self.n_workers, n_rows)
+		bounds = [n_rows * k // n_slices for k in range(n_slices + 1)]
+		futures = [self.executor.submit(_evaluate_rows, start, stop, n_genes) for start, stop in zip(bounds, bounds[1:])]
+
+		fitness = []
+		for future in futures:
+			fitness.extend(future.result())
+
+		return fitness
+
+
+	def close(self):
+		"""
+		Shut down the worker pool and free the shared memory.
+		"""
+
+		if self._finalizer is not None:
+			self._finalizer()
+		self._finalizer = None
+		self.executor = None
+		self.population = None
+		self.etc = None
+		self.capacity = (0, 0)
@@ -0,0 +1,184 @@
+"""
+This module contains the class for array backed population storage.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from array import array
+from typing import Iterable, List
+from checkpoint import copy_buffer
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+def gene_typecode(n_vms: int) -> str:
+	"""
+	Get the array typecode used to store genes for the given number of VMs.
+
+	:param n_vms: Number of VMs.
+
+	:returns typecode: uint16 typecode when VM IDs fit, uint32 otherwise.
+	"""
+
+	return "H" if n_vms <= 0x10000 else "I"
+
+
+class Population():
+	"""
+	Population of individuals stored in one contiguous unsigned integer buffer, one row per individual.
+	Rows are kept in ranked order through an index permutation, so sorting never moves chromosomes.
+	Indexing returns a memoryview of the row, which behaves like the List[int] individuals used elsewhere.
+	"""
+
+
+	def __init__(self, n_vms: int, length: int, size: int = 0):
+		self.typecode = gene_typecode(n_vms)
+		self.length = length
+		self.size = size
+		self.data = array(self.typecode, bytes(array(self.typecode).itemsize * size * length))
+		# Physical row of every ranked position
+		self.order = list(range(size))
+
+
+	@classmethod
+	def from_individuals(cls, individuals: Iterable[List[int]], n_vms: int, length: int = None) -> "Population":
+		"""
+		Build a population by copying individuals into a new buffer.
+
+		:param individuals: Individuals, lists or rows of another population.
+		:param n_vms: Number of VMs, decides the gene width.
+		:param length: Number of genes, taken from the first individual if not given.
+
+		:returns population: New population.
+		"""
+
+		if length is None:
+			individuals = list(individuals)
+			length = len(individuals[0]) if individuals else 0
+
+		population = cls(n_vms, length)
+		data = population.data
+		size = 0
+		for individual in individuals:
+			if isinstance(individual, memoryview) and individual.format == population.typecode:
+				data.frombytes(individual.cast("B"))
+			else:
+				data.extend(individual)
+			size = size + 1
+		population.size = size
+		population.order = list(range(size))
+
+		return population
+
+
+	@classmethod
+	def from_array(cls, matrix: "np.ndarray", n_vms: int) -> "Population":
+		"""
+		Build a population by copying a numpy matrix into a new buffer.
+		Lists of individuals of equal length are converted straight to the gene width, which is faster than extending the buffer by every list.
+
+		:param matrix: Matrix with one row per individual, or list of individuals.
+		:param n_vms: Number of VMs, decides the gene width.
+
+		:returns population: New population.
+		"""
+
+		matrix = np.ascontiguousarray(matrix, dtype=np.uint16 if gene_typecode(n_vms) == "H" else np.uint32)
+		population = cls(n_vms, matrix.shape[1])
+		population.data.frombytes(memoryview(matrix).cast("B"))
+		population.size = matrix.shape[0]
+		population.order = list(range(population.size))
+
+		return population
+
+
+	@classmethod
+	def from_buffer(cls, data: memoryview, n_vms: int, length: int, order: List[int] = None) -> "Population":
+		"""
+		Build a population over an existing writable buffer without copying, such as a memory-mapped view.
+
+		:param data: Typed buffer holding the rows, its typecode must match the gene width.
+		:param n_vms: Number of VMs, decides the gene width.
+		:param length: Number of genes.
+		:param order: Physical row of every ranked position, rows in stored order if not given.
+
+		:returns population: Population backed by the buffer.
+		"""
+
+		population = cls(n_vms, length)
+		population.data = data
+		population.size = len(data) // length if length else 0
+		population.order = list(range(population.size)) if order is None else list(order)
+
+		return population
+
+
+	def __len__(self) -> int:
+		return self.size
+
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(self.size))]
+
+		row = self.order[index]
+		return memoryview(self.data)[row * self.length:(row + 1) * self.length]
+
+
+	def __setitem__(self, index: int, individual: List[int]):
+		row = self.order[index]
+		memoryview(self.data)[row * self.length:(row + 1) * self.length] = array(self.typecode, individual)
+
+
+	def __iter__(self):
+		for i in range(self.size):
+			yield self[i]
+
+
+	def __getstate__(self):
+		# Pickled and deep copied with the rows copied out of any memory map, for worker processes and spawned schedulers
+		return {**self.__dict__, "data": copy_buffer(self.data)}
+
+
+	def __repr__(self):
+		return f"Population: {self.size} individuals of {self.length} genes"
+
+
+	def sort(self, fitness: List[float]) -> List[int]:
+		"""
+		Rank the population by descending fitness by updating the permutation only.
+		The sort is stable, equally fit individuals keep their current relative rank.
+
+		:param fitness: Fitness of every individual in current ranked order.
+
+		:returns ranking: Previous ranked positions in their new order, for reordering parallel lists.
+		"""
+
+		ranking = sorted(range(self.size), key=fitness.__getitem__, reverse=True)
+		self.order = [self.order[i] for i in ranking]
+
+		return ranking
+
+
+	def as_array(self) -> "np.ndarray":
+		"""
+		Get the population as a numpy matrix in ranked order.
+		Requires numpy.
+
+		:returns matrix: Matrix with one row per individual.
+		"""
+
+		if np is None:
+			raise ImportError("Population.as_array requires numpy to be installed.")
+
+		matrix = np.frombuffer(self.data, dtype=np.uint16 if self.typecode == "H" else np.uint32).reshape(self.size, self.length)
+		if self.order == list(range(self.size)):
+			return matrix
+
+		return matrix[self.order]
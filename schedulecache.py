@@ -0,0 +1,332 @@
+"""
+This module contains the class for the persistent on-disk cache of schedules.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import os
+import sys
+import json
+import hashlib
+import operator
+from array import array
+from enum import Enum
+from typing import Tuple, List, Sequence
+from gcs import GeneticCloudScheduling
+from population import gene_typecode
+from checkpoint import as_buffer, copy_buffer, write_checkpoint, read_checkpoint, read_checkpoint_state
+
+
+# Parameters of GeneticCloudScheduling that change the schedule a run finds, part of the cache key
+PARAMETERS = (
+	"N_GENERATIONS", "DESIRED_DELTA_FITNESS", "DESIRED_DELTA_FITNESS_STAGNATION_N_GENERATION", "DESIRED_DELTA_DIVERSITY",
+	"TIME_BUDGET", "POPULATION_SIZE", "TOURNAMENT_SIZE", "CROSSOVER", "CROSSOVER_RATE", "MUTATION_RATE", "ELITISM_RATE",
+	"ADAPTIVE_RATES", "TARGET_DIVERSITY", "ADAPTATION_FACTOR", "MUTATION_RATE_RANGE", "CROSSOVER_RATE_RANGE",
+	"SEED_FRACTION", "SEED_HEURISTICS", "SEED_PERTURBATION_RATE", "SPARSE_MUTATION", "BATCHED_OPERATORS",
+	"STEADY_STATE", "STEADY_STATE_OFFSPRING", "LOCAL_SEARCH_BUDGET", "LOCAL_SEARCH_ELITES", "LOCAL_SEARCH_CHILDREN",
+	"BOUNDED_FITNESS", "STOP_AT_LOWER_BOUND", "SEED", "SPAWN_KEY",
+)
+# File name extension of cache entries
+EXTENSION = ".gcs"
+
+
+class ScheduleCache():
+	"""
+	Persistent cache of the schedules found by GeneticCloudScheduling, one checkpoint file per entry in DIRECTORY.
+	Entries are keyed by a hash of the cloudlet lengths, the VM MIPS and PARAMETERS.
+	An exact hit returns the stored best schedule and its metrics without running the genetic algorithm.
+	Otherwise the closest cached workloads with the same numbers of cloudlets and VMs seed the initial population,
+	entries are first screened by the block sums of their lengths and MIPS stored in their state and only those passing are opened.
+	The least recently used entries are evicted beyond MAX_ENTRIES entries or MAX_BYTES bytes.
+	"""
+
+
+	def __init__(self, directory: str):
+		# Directory holding the cache entries, created when needed
+		self.DIRECTORY: str = directory
+		# Maximum number of entries kept, 0 means no limit
+		self.MAX_ENTRIES: int = 100
+		# Maximum total size of the entries in bytes, 0 means no limit
+		self.MAX_BYTES: int = 1 << 30
+		# Number of best individuals stored per entry for seeding
+		self.SOLUTIONS: int = 10
+		# Largest relative difference of cloudlet lengths or VM MIPS for a cached workload to seed a run
+		self.NEAR_HIT_DISTANCE: float = 0.1
+		# Number of contiguous blocks of cloudlet lengths and of VM MIPS whose sums are stored in every entry's state to screen near hits
+		self.SUMMARY_BLOCKS: int = 64
+		# Maximum number of cached individuals taken from near workloads
+		self.NEAR_HIT_SEEDS: int = 10
+		# Fraction of the initial population replaced by the cached individuals and perturbed copies of them
+		self.NEAR_HIT_FRACTION: float = 0.1
+		# Outcome of the last run(), "hit", "near" or "miss"
+		self.LAST: str = None
+		# Metrics stored with the schedule returned by the last run()
+		self.METRICS: dict = {}
+		# Number of exact hits, near hits and misses
+		self.HITS: int = 0
+		self.NEAR_HITS: int = 0
+		self.MISSES: int = 0
+
+
+	def workload_key(self, gcs: GeneticCloudScheduling) -> str:
+		"""
+		Hash the cloudlet lengths and VM MIPS of a scheduler.
+
+		:param gcs: Scheduler with CLOUDLETS and VMS.
+
+		:returns key: Hex digest.
+		"""
+
+		digest = hashlib.blake2b(digest_size=16)
+		digest.update(as_buffer(gcs.get_cloudlet_lengths(), "d"))
+		digest.update(b"/")
+		digest.update(as_buffer(gcs.get_vm_mips(), "d"))
+
+		return digest.hexdigest()
+
+
+	def key(self, gcs: GeneticCloudScheduling) -> str:
+		"""
+		Hash the cloudlet lengths, VM MIPS and PARAMETERS of a scheduler.
+
+		:param gcs: Scheduler with CLOUDLETS and VMS.
+
+		:returns key: Hex digest, also the file name of the entry.
+		"""
+
+		parameters = {}
+		for name in PARAMETERS:
+			value = getattr(gcs, name)
+			values = value if isinstance(value, list) else [value]
+			values = [x.name if isinstance(x, Enum) else x for x in values]
+			parameters[name] = values if isinstance(value, list) else values[0]
+
+		digest = hashlib.blake2b(digest_size=16)
+		digest.update(self.workload_key(gcs).encode())
+		digest.update(json.dumps(parameters, sort_keys=True).encode())
+
+		return digest.hexdigest()
+
+
+	def summarize(self, values: Sequence[float]) -> List[float]:
+		"""
+		Sum values in SUMMARY_BLOCKS contiguous blocks of nearly equal size, fewer when there are fewer values.
+
+		:param values: Cloudlet lengths or VM MIPS.
+
+		:returns sums: Sum of every block.
+		"""
+
+		n_blocks = min(self.SUMMARY_BLOCKS, len(values)) or 1
+		bounds = [i * len(values) // n_blocks for i in range(n_blocks + 1)]
+
+		return [sum(values[bounds[i]:bounds[i + 1]]) for i in range(n_blocks)]
+
+
+	def get_path(self, key: str) -> str:
+		return os.path.join(self.DIRECTORY, key + EXTENSION)
+
+
+	def get_entries(self) -> List[Tuple[float, int, str]]:
+		"""
+		List the cache entries, least recently used first.
+
+		:returns entries: Last use time, size and path of every entry.
+		"""
+
+		if not os.path.isdir(self.DIRECTORY):
+			return []
+
+		entries = []
+		for name in os.listdir(self.DIRECTORY):
+			if name.endswith(EXTENSION):
+				path = os.path.join(self.DIRECTORY, name)
+				stat = os.stat(path)
+				entries.append((stat.st_mtime, stat.st_size, path))
+
+		return sorted(entries)
+
+
+	def get(self, gcs: GeneticCloudScheduling, key: str = None) -> Tuple[float, List[int], dict]:
+		"""
+		Look up the schedule cached for a scheduler's workload and parameters, marking the entry as recently used.
+
+		:param gcs: Scheduler with CLOUDLETS and VMS.
+		:param key: Key of the scheduler, computed if not given.
+
+		:returns (max_fitness, individual, metrics): Best fitness, individual and stored metrics, None when not cached.
+		"""
+
+		path = self.get_path(self.key(gcs) if key is None else key)
+		if not os.path.exists(path):
+			return None
+
+		with read_checkpoint(path) as (state, sections):
+			individual = sections["solutions"][:state["n_cloudlets"]].tolist()
+		os.utime(path)
+
+		return state["fitness"], individual, state
+
+
+	def nearest(self, gcs: GeneticCloudScheduling) -> List[List[int]]:
+		"""
+		Collect the cached individuals of the workloads closest to a scheduler's one.
+		Only entries with the same numbers of cloudlets and VMs qualify, the distance of a workload is the larger of
+		the relative L1 differences of its cloudlet lengths and of its VM MIPS, and must be at most NEAR_HIT_DISTANCE.
+		The differences of the block sums of summarize bound the L1 difference from below, so entries whose block sums are
+		already too far apart are ruled out from their state alone, and the sections of only the remaining ones are read and compared.
+
+		:param gcs: Scheduler with CLOUDLETS and VMS.
+
+		:returns individuals: Up to NEAR_HIT_SEEDS individuals, closest workloads and fittest individuals first.
+		"""
+
+		lengths = as_buffer(gcs.get_cloudlet_lengths(), "d")
+		mips = as_buffer(gcs.get_vm_mips(), "d")
+		length_sums, mips_sums = self.summarize(lengths), self.summarize(mips)
+		total_length, total_mips = sum(lengths) or 1.0, sum(mips) or 1.0
+		# Rounding of the sums, so the screening never rules out an entry the full comparison would accept
+		tolerance = (len(lengths) + len(mips)) * sys.float_info.epsilon
+
+		candidates = []
+		for _, _, path in self.get_entries():
+			state = read_checkpoint_state(path)
+			if state["n_cloudlets"] != len(lengths) or state["n_vms"] != len(mips):
+				continue
+			if len(state.get("length_sums", ())) == len(length_sums) and len(state.get("mips_sums", ())) == len(mips_sums) and max(
+				sum(map(abs, map(operator.sub, state["length_sums"], length_sums))) / total_length,
+				sum(map(abs, map(operator.sub, state["mips_sums"], mips_sums))) / total_mips,
+			) > self.NEAR_HIT_DISTANCE + tolerance:
+				continue
+			with read_checkpoint(path) as (_, sections):
+				distance = max(
+					sum(map(abs, map(operator.sub, sections["lengths"], lengths))) / total_length,
+					sum(map(abs, map(operator.sub, sections["mips"], mips))) / total_mips,
+				)
+				if distance <= self.NEAR_HIT_DISTANCE:
+					candidates.append((distance, path, state, copy_buffer(sections["solutions"])))
+
+		individuals = []
+		for _, path, state, solutions in sorted(candidates, key=operator.itemgetter(0)):
+			os.utime(path)
+			length = state["n_cloudlets"]
+			for i in range(state["n_solutions"]):
+				if len(individuals) >= self.NEAR_HIT_SEEDS:
+					return individuals
+				individuals.append(solutions[i * length:(i + 1) * length].tolist())
+
+		return individuals
+
+
+	def put(self, gcs: GeneticCloudScheduling, fitness: float, individual: List[int], key: str = None) -> dict:
+		"""
+		Store the result of a run of a scheduler, with the fittest distinct individuals of its population for seeding,
+		then evict the least recently used entries beyond the limits.
+
+		:param gcs: Scheduler after run().
+		:param fitness: Best fitness of the run.
+		:param individual: Best individual of the run.
+		:param key: Key of the scheduler before the run, computed if not given. ADAPTIVE_RATES changes the rates during a run.
+
+		:returns metrics: Metrics stored with the schedule.
+		"""
+
+		key = self.key(gcs) if key is None else key
+		solutions = array(gene_typecode(gcs.N_VMS), individual)
+		n_solutions = 1
+		seen = {bytes(solutions)}
+		for row in gcs.POPULATION:
+			if n_solutions >= self.SOLUTIONS:
+				break
+			if bytes(row) not in seen:
+				seen.add(bytes(row))
+				solutions.frombytes(row.cast("B"))
+				n_solutions = n_solutions + 1
+
+		vm_ct = gcs.calculate_all_vm_completion_time(individual)
+		lengths = as_buffer(gcs.get_cloudlet_lengths(), "d")
+		mips = as_buffer(gcs.get_vm_mips(), "d")
+		state = {
+			"key": key,
+			"workload": self.workload_key(gcs),
+			"n_cloudlets": len(individual),
+			"n_vms": gcs.N_VMS,
+			"length_sums": self.summarize(lengths),
+			"mips_sums": self.summarize(mips),
+			"n_solutions": n_solutions,
+			"fitness": fitness,
+			"makespan": max(vm_ct),
+			"vm_completion_time": vm_ct,
+			"generation": gcs.GENERATION,
+		}
+
+		os.makedirs(self.DIRECTORY, exist_ok=True)
+		write_checkpoint(self.get_path(key), state, {
+			"solutions": (solutions.typecode, solutions),
+			"lengths": ("d", lengths),
+			"mips": ("d", mips),
+		})
+		self.evict()
+
+		return state
+
+
+	def evict(self) -> int:
+		"""
+		Delete the least recently used entries until at most MAX_ENTRIES entries of at most MAX_BYTES bytes remain.
+
+		:returns evicted: Number of entries deleted.
+		"""
+
+		entries = self.get_entries()
+		size = sum(entry[1] for entry in entries)
+		evicted = 0
+		for _, entry_size, path in entries:
+			if (not self.MAX_ENTRIES or len(entries) - evicted <= self.MAX_ENTRIES) and (not self.MAX_BYTES or size <= self.MAX_BYTES):
+				break
+			os.remove(path)
+			size = size - entry_size
+			evicted = evicted + 1
+
+		return evicted
+
+
+	def run(self, gcs: GeneticCloudScheduling) -> Tuple[float, List[int]]:
+		"""
+		Run a scheduler through the cache.
+		An exact hit returns the cached schedule and leaves the scheduler untouched.
+		Otherwise the cached individuals of near workloads replace the least fit of the initial population,
+		the genetic algorithm is run and its result is stored.
+
+		:param gcs: Scheduler with CLOUDLETS and VMS.
+
+		:returns (max_fitness, individual): Best fitness and individual.
+		"""
+
+		key = self.key(gcs)
+		cached = self.get(gcs, key)
+		if cached is not None:
+			self.LAST, self.HITS = "hit", self.HITS + 1
+			fitness, individual, self.METRICS = cached
+			return fitness, individual
+
+		if not len(gcs.POPULATION):
+			gcs.generate_population()
+		seeds = self.nearest(gcs)
+		if seeds:
+			self.LAST, self.NEAR_HITS = "near", self.NEAR_HITS + 1
+			n_seeded = min(round(len(gcs.POPULATION) * self.NEAR_HIT_FRACTION), len(gcs.POPULATION))
+			individuals = seeds[:n_seeded]
+			while len(individuals) < n_seeded:
+				individuals.append(gcs.perturb(seeds[len(individuals) % len(seeds)], gcs.SEED_PERTURBATION_RATE))
+			gcs.replace_worst(individuals)
+		else:
+			self.LAST, self.MISSES = "miss", self.MISSES + 1
+
+		fitness, individual = gcs.run()
+		self.METRICS = self.put(gcs, fitness, individual, key)
+
+		return fitness, individual
@@ -0,0 +1,17 @@
+"""
+This module contains the enum for heuristics seeding the initial population.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from enum import Enum
+
+
+class Seeding(Enum):
+	MCT = 0
+	MIN_MIN = 1
+	ROUND_ROBIN = 2
+	LPT = 3
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+This module contains the class for collecting per generation telemetry of the genetic algorithm.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import json
+import time
+from typing import Callable, List
+
+
+class Telemetry():
+	"""
+	Per generation telemetry: wall-clock time of every phase, fitness evaluation counters,
+	fitness statistics and population diversity.
+	Attach it as GeneticCloudScheduling.TELEMETRY, every step() then produces one record which is passed
+	to every callback and written as one JSON line to PATH when it is set.
+	When TELEMETRY is None nothing is timed or recorded.
+	"""
+
+
+	def __init__(self, path: str = None, callbacks: List[Callable[[dict], None]] = None):
+		# File to append records to as JSON lines, None disables the sink
+		self.PATH: str = path
+		# Functions called with every record
+		self.CALLBACKS: List[Callable[[dict], None]] = callbacks if callbacks is not None else []
+		# Count distinct chromosomes as a diversity measure, costs one pass over the population
+		self.DIVERSITY: bool = True
+		# Number of generations recorded, the record of the n-th step() has generation n
+		self.generation: int = 0
+		# Seconds spent in every phase of the current generation
+		self.phases: dict = {}
+		self._best_fitness: float = None
+		self._hits: int = 0
+		self._misses: int = 0
+		self._file = None
+
+
+	def time_phase(self, name: str, phase: Callable):
+		"""
+		Call a phase and add its wall-clock time to the current generation.
+
+		:param name: Phase name.
+		:param phase: Function to call.
+
+		:returns result: Result of the phase.
+		"""
+
+		start = time.perf_counter()
+		result = phase()
+		self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+		return result
+
+
+	def record(self, gcs) -> dict:
+		"""
+		Record the current generation of an evaluated and sorted population.
+		The delta_fitness of the first record is None, as there is no previous best fitness to compare with.
+
+		:param gcs: GeneticCloudScheduling instance.
+
+		:returns record: Telemetry of the generation.
+		"""
+
+		fitness = gcs.FITNESS
+		best_fitness = fitness[0] if len(fitness) else 0.0
+		self.generation = self.generation + 1
+
+		record = {
+			"generation": self.generation,
+			"time": time.time(),
+			"best_fitness": best_fitness,
+			"delta_fitness": best_fitness - self._best_fitness if self._best_fitness is not None else None,
+			"mean_fitness": sum(fitness) / len(fitness) if len(fitness) else 0.0,
+			"worst_fitness": fitness[-1] if len(fitness) else 0.0,
+			"makespan": 1 / best_fitness if best_fitness else 0.0,
+			"evaluations": gcs.FITNESS_CACHE_MISSES - self._misses,
+			"cache_hits": gcs.FITNESS_CACHE_HITS - self._hits,
+			"phases": self.phases,
+		}
+		if self.DIVERSITY:
+			record["unique_individuals"] = len(set(bytes(individual) for individual in gcs.POPULATION))
+
+		self.phases = {}
+		self._best_fitness = best_fitness
+		self._hits = gcs.FITNESS_CACHE_HITS
+		self._misses = gcs.FITNESS_CACHE_MISSES
+
+		for callback in self.CALLBACKS:
+			callback(record)
+
+		if self.PATH:
+			if self._file is None:
+				self._file = open(self.PATH, "a")
+			self._file.write(json.dumps(record) + "\n")
+
+		return record
+
+
+	def close(self):
+		"""
+		Flush and close the JSON lines sink.
+		"""
+
+		if self._file is not None:
+			self._file.close()
+			self._file = None
@@ -0,0 +1,15 @@
+"""
+This module contains the enum for island migration topology.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from enum import Enum
+
+
+class Topology(Enum):
+	RING = 0
+	FULLY_CONNECTED = 1
\ No newline at end of file
@@ -1,31 +1,75 @@
-"""
-This module contains the class details for VM.
-"""
-
-
-__author__ = "Ahmad Awan"
-__email__ = "i202004@nu.edu.pk"
-
-
-class Vm():
-
-
-	def __init__(self, id: int, mips: int):
-		self.id = id
-		self.mips = mips
-
-
-	def get_id(self) -> int:
-		return self.id
-
-
-	def get_mips(self) -> int:
-		return self.mips
-
-
-	def __repr__(self):
-		return f"VM {self.id}: {self.mips} MIPS"
-
-
-	def __str__(self):
-		return f"VM {self.id}: {self.mips} MIPS"
+"""
+This module contains the class details for VM.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+from typing import Sequence
+from checkpoint import copy_buffer
+
+
+class Vm():
+
+
+	def __init__(self, id: int, mips: int):
+		self.id = id
+		self.mips = mips
+
+
+	def get_id(self) -> int:
+		return self.id
+
+
+	def get_mips(self) -> int:
+		return self.mips
+
+
+	def __repr__(self):
+		return f"VM {self.id}: {self.mips} MIPS"
+
+
+	def __str__(self):
+		return f"VM {self.id}: {self.mips} MIPS"
+
+
+class VmArray():
+	"""
+	Columnar list of VMs backed by a typed buffer of MIPS, such as an array or a memory-mapped memoryview.
+	Behaves like List[Vm], but a Vm object is only created when an item is accessed.
+	"""
+
+
+	def __init__(self, mips: Sequence[float]):
+		self.mips = mips
+
+
+	def get_mips(self) -> Sequence[float]:
+		return self.mips
+
+
+	def __len__(self) -> int:
+		return len(self.mips)
+
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return VmArray(self.mips[index])
+
+		return Vm(range(len(self))[index], self.mips[index])
+
+
+	def __iter__(self):
+		for i in range(len(self)):
+			yield self[i]
+
+
+	def __getstate__(self):
+		# Pickled and deep copied with the buffers copied out of any memory map, for worker processes and spawned schedulers
+		return {**self.__dict__, "mips": copy_buffer(self.mips)}
+
+
+	def __repr__(self):
+		return f"VmArray: {len(self)} VMs"
\ No newline at end of file
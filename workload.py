@@ -0,0 +1,71 @@
+"""
+This module contains the functions for loading workloads from trace files.
+"""
+
+
+__author__ = "Ahmad Awan"
+__email__ = "i202004@nu.edu.pk"
+
+
+import csv
+import mmap
+import random
+from array import array
+from itertools import islice
+from typing import Sequence, Union
+
+
+def read_column(path: str, column: Union[int, str] = 0, delimiter: str = None, header: bool = True, typecode: str = "d", start: int = 0, stop: int = None, step: int = 1, sample: float = 1.0, rng: random.Random = random) -> Sequence[float]:
+	"""
+	Read one column of a trace file into a typed buffer without creating an object per record.
+	CSV and text files are streamed row by row.
+	Any other file is treated as raw native-endian values of the given typecode and memory-mapped,
+	in which case a window without sampling is returned as a zero-copy view of the file.
+
+	:param path: Path of the trace file.
+	:param column: Column index, or column name when the CSV file has a header.
+	:param delimiter: CSV delimiter, defaults to a tab for .tsv files and a comma otherwise.
+	:param header: Whether the first CSV row is a header, an empty file then raises ValueError.
+	:param typecode: Array typecode of the values, "d" for float64, "q" for int64.
+	:param start: Index of the first record to read.
+	:param stop: Index after the last record to read, None reads to the end.
+	:param step: Read every step-th record of the window.
+	:param sample: Fraction of the window records to keep, chosen at random.
+	:param rng: Random generator used for sampling, the random module by default.
+
+	:returns values: Array or memoryview of values.
+	"""
+
+	if path.endswith((".csv", ".tsv", ".txt")):
+		values = array(typecode)
+		convert = float if typecode in "fd" else int
+		if delimiter is None:
+			delimiter = "\t" if path.endswith(".tsv") else ","
+
+		with open(path, newline="") as f:
+			reader = csv.reader(f, delimiter=delimiter)
+			if header:
+				names = next(reader, None)
+				if names is None:
+					raise ValueError(f"Trace file {path} is empty, expected a header row.")
+				if isinstance(column, str):
+					column = names.index(column)
+
+			for row in islice(reader, start, stop, step):
+				if sample >= 1 or rng.random() < sample:
+					values.append(convert(row[column]))
+
+		return values
+
+	with open(path, "rb") as f:
+		if not f.seek(0, 2):
+			return array(typecode)
+		mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+	itemsize = array(typecode).itemsize
+	view = memoryview(mm)[:len(mm) - len(mm) % itemsize].cast(typecode)[start:stop:step]
+
+	if sample >= 1:
+		return view
+
+	return array(typecode, (x for x in view if rng.random() < sample))